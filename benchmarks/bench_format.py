@@ -0,0 +1,64 @@
+"""Benchmark precompiled format templates against per-record str.format.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_format.py [--records N]
+"""
+import argparse
+import timeit
+
+from Logges import LogLevel, LogRecord
+from Logges.formatter import CompiledFormat
+
+TEMPLATES = {
+    "default": "[{time}] [{level:^10}] [{filename}] [{function}]: {message}",
+    "minimal": "{time} {message}",
+    "padded": "{time} | {level:<8} | {filename:>20} | {function:<24} | {message}",
+    "with extra": "[{time}] [{level}] {message} request={request_id} user={user}",
+}
+
+
+def str_format(format_string: str, record: LogRecord) -> str:
+    """Render the way LogRecord.format did before templates were compiled."""
+    return format_string.format(
+        time=record.timestamp,
+        level=record.level.name,
+        filename=record.filename,
+        function=f"{record.function}:{record.line_number}",
+        message=record.message,
+        **record.extra,
+    )
+
+
+def main() -> None:
+    """Time both renderers for every template and print ns per record."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=500_000)
+    args = parser.parse_args()
+
+    record = LogRecord(
+        timestamp="12:34:56",
+        level=LogLevel.INFO,
+        message="benchmark message",
+        filename="bench_format.py",
+        function="main",
+        line_number=42,
+        extra={"request_id": "4f1c", "user": "alice"},
+    )
+
+    print(f"{'template':<12} {'str.format':>12} {'compiled':>12} {'speedup':>8}")
+    for name, format_string in TEMPLATES.items():
+        template = CompiledFormat(format_string)
+        assert template.render(record) == str_format(format_string, record)
+
+        before = min(
+            timeit.repeat(lambda: str_format(format_string, record), number=args.records, repeat=3)
+        )
+        after = min(timeit.repeat(lambda: template.render(record), number=args.records, repeat=3))
+        print(
+            f"{name:<12} {before / args.records * 1e9:>9.0f} ns "
+            f"{after / args.records * 1e9:>9.0f} ns {before / after:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
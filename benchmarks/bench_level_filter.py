@@ -0,0 +1,46 @@
+"""Benchmark the cost of suppressed (below-level) logging calls.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_level_filter.py [--calls N]
+"""
+import argparse
+import tempfile
+import timeit
+from pathlib import Path
+
+from Logges import LogConfig, Logger, LogLevel
+
+
+def main() -> None:
+    """Time suppressed and emitted calls and print ns per call."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = LogConfig(name="bench", level=LogLevel.INFO, log_dir=Path(tmpdir))
+        # No handlers: measures the logger itself, not the I/O
+        logger = Logger(config, handlers=[])
+        no_caller_config = LogConfig(
+            name="bench", level=LogLevel.INFO, log_dir=Path(tmpdir), capture_caller=False
+        )
+        no_caller_logger = Logger(no_caller_config, handlers=[])
+
+        def noop(message: str) -> None:
+            pass
+
+        cases = {
+            "empty function call": lambda: noop("message"),
+            "suppressed logger.debug()": lambda: logger.debug("message"),
+            "suppressed logger.log(DEBUG)": lambda: logger.log("message", LogLevel.DEBUG),
+            "is_enabled_for(DEBUG)": lambda: logger.is_enabled_for(LogLevel.DEBUG),
+            "emitted logger.info()": lambda: logger.info("message"),
+            "emitted, capture_caller=False": lambda: no_caller_logger.info("message"),
+        }
+        for name, call in cases.items():
+            seconds = min(timeit.repeat(call, number=args.calls, repeat=3))
+            print(f"{name:<32} {seconds / args.calls * 1e9:8.1f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark the PDF export on logs of 10k and 100k records.
+
+Times a full export and a capped export (``max_rows``, first records and a
+random sample) for each size. With ``--memory``, peak memory is measured
+with tracemalloc, which slows the export down several times.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_pdf_export.py [--rows N ...] [--max-rows N] [--memory]
+"""
+import argparse
+import importlib
+import os
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Optional
+
+from Logges.config import LogLevel
+from Logges.utils import to_pdf
+
+LEVELS = [level.name for level in LogLevel]
+
+# Logges imports these on first use; load them here so the timings don't
+# include the one-off import cost
+for _module in ("matplotlib.pyplot", "reportlab.platypus"):
+    importlib.import_module(_module)
+
+
+def write_log(path: Path, rows: int) -> None:
+    """Write a log of ``rows`` records, every seventh one too long for its cell."""
+    with open(path, "w") as log:
+        for index in range(rows):
+            message = f"request {index} served by worker {index % 16}"
+            if index % 7 == 0:
+                message += " after retrying the upstream call with a longer timeout"
+            log.write(
+                f"[12:00:{index % 60:02d}] [{LEVELS[index % 5]:^10s}] [service.py] "
+                f"[handle:{index % 500}]: {message}\n"
+            )
+
+
+def run(rows: int, memory: bool, **kwargs) -> tuple[float, Optional[float]]:
+    """Export a fresh log and return the wall time and peak memory (MB)."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cwd = os.getcwd()
+        os.chdir(tmpdir)
+        try:
+            write_log(Path("bench.log"), rows)
+            if memory:
+                tracemalloc.start()
+            start = time.perf_counter()
+            to_pdf("bench.log", ".", dict.fromkeys(LEVELS, 0), local_file=True, **kwargs)
+            elapsed = time.perf_counter() - start
+            peak = None
+            if memory:
+                peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+                tracemalloc.stop()
+        finally:
+            os.chdir(cwd)
+    return elapsed, peak
+
+
+def main() -> None:
+    """Run the benchmark and print a small report."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--max-rows", type=int, default=1_000)
+    parser.add_argument("--memory", action="store_true")
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        modes = (
+            ("all rows", {}),
+            (f"first {args.max_rows}", {"max_rows": args.max_rows}),
+            (f"sample {args.max_rows}", {"max_rows": args.max_rows, "sample": True}),
+        )
+        for label, kwargs in modes:
+            elapsed, peak = run(rows, args.memory, **kwargs)
+            report = f"{rows:>8} records  {label:<12}{elapsed:>8.2f} s"
+            if peak is not None:
+                report += f"  peak {peak:>7.1f} MB"
+            print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark the mmap reader against the streaming parser.
+
+Writes a synthetic log of ``--size-mb`` megabytes (use 1024 for the 1 GB
+case), then times a full scan and a rare-keyword search with both readers.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_reader.py [--size-mb N]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from Logges.parser import iter_log_file
+from Logges.reader import MappedLogReader
+
+LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+
+def write_log(path: Path, size_mb: int) -> int:
+    """Write a synthetic log of roughly ``size_mb`` MB and return its records."""
+    target = size_mb * 1024 * 1024
+    block = []
+    for index in range(10_000):
+        level = LEVELS[index % len(LEVELS)]
+        message = "needle found" if index == 4_321 else f"request {index} served"
+        block.append(
+            f"[12:{index // 600 % 60:02d}:{index // 10 % 60:02d}] [{level:^10s}] "
+            f"[service.py] [handle:{index % 500}]: {message}\n"
+        )
+    chunk = "".join(block).encode()
+
+    written = 0
+    with open(path, "wb") as log:
+        while written < target:
+            log.write(chunk)
+            written += len(chunk)
+    return written // len(chunk) * len(block)
+
+
+def timed(label: str, func) -> None:
+    """Run ``func`` once and print its wall time and result."""
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<32}{time.perf_counter() - start:>8.2f} s  ({result:,} records)")
+
+
+def main() -> None:
+    """Run the benchmark and print a small report."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "2026-01-30_bench.log"
+        records = write_log(path, args.size_mb)
+        print(f"{args.size_mb} MB, {records:,} records")
+
+        timed("parser: full scan", lambda: sum(1 for _ in iter_log_file(path)))
+        timed(
+            "parser: search 'needle'",
+            lambda: sum("needle" in entry.message for entry in iter_log_file(path)),
+        )
+        with MappedLogReader(path) as reader:
+            timed("mmap: full scan", lambda: sum(1 for _ in reader.records()))
+            timed("mmap: search 'needle'", lambda: sum(1 for _ in reader.search([b"needle"])))
+
+
+if __name__ == "__main__":
+    main()
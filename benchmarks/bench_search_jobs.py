@@ -0,0 +1,79 @@
+"""Benchmark CLI search over many daily files with 1..N worker processes.
+
+Each run starts without sidecar indexes, so it measures the CPU-bound first
+search over a month of logs.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_search_jobs.py [--files N] [--size-mb N]
+"""
+import argparse
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+
+from Logges.cli import search_log_file
+from Logges.index import index_path
+from Logges.matching import Matcher
+
+LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+
+def write_logs(directory: Path, files: int, size_mb: int) -> list[str]:
+    """Write ``files`` daily logs of about ``size_mb`` MB each."""
+    lines = []
+    for index in range(5_000):
+        lines.append(
+            f"[12:00:{index % 60:02d}] [{LEVELS[index % 5]:^10s}] [service.py] "
+            f"[handle:{index % 500}]: request {index} served by worker {index % 16}\n"
+        )
+    chunk = "".join(lines)
+    repeats = max(1, size_mb * 1024 * 1024 // len(chunk))
+
+    paths = []
+    for day in range(1, files + 1):
+        path = directory / f"2026-01-{day:02d}_bench.log"
+        path.write_text(chunk * repeats)
+        paths.append(str(path))
+    return paths
+
+
+def run(paths: list[str], jobs: int) -> float:
+    """Search all files with ``jobs`` processes and return the wall time."""
+    for path in paths:
+        index_path(path).unlink(missing_ok=True)
+
+    start = time.perf_counter()
+    arguments = (paths, repeat(Matcher(["worker 7"])), repeat(["ERROR"]))
+    if jobs == 1:
+        results = list(map(search_log_file, *arguments))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(search_log_file, *arguments))
+    elapsed = time.perf_counter() - start
+    assert all(results)
+    return elapsed
+
+
+def main() -> None:
+    """Run the benchmark and print a small report."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=30)
+    parser.add_argument("--size-mb", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = write_logs(Path(tmpdir), args.files, args.size_mb)
+        baseline = None
+        jobs = 1
+        while jobs <= (os.cpu_count() or 1):
+            elapsed = run(paths, jobs)
+            baseline = baseline or elapsed
+            print(f"--jobs {jobs:<3}{elapsed:>8.2f} s  speedup {baseline / elapsed:.1f}x")
+            jobs *= 2
+
+
+if __name__ == "__main__":
+    main()
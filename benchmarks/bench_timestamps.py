@@ -0,0 +1,33 @@
+"""Benchmark cached timestamp rendering against per-record strftime.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_timestamps.py [--calls N]
+"""
+import argparse
+import datetime
+import timeit
+
+from Logges.config import TimestampFormat
+from Logges.timestamps import TimestampProvider
+
+
+def main() -> None:
+    """Time strftime and every provider format and print ns per call."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=500_000)
+    args = parser.parse_args()
+
+    cases = {
+        "datetime.now().strftime": lambda: datetime.datetime.now().strftime("%H:%M:%S"),
+    }
+    for timestamp_format in TimestampFormat:
+        cases[f"provider {timestamp_format.value}"] = TimestampProvider(timestamp_format).now
+    cases["provider date"] = TimestampProvider().date
+
+    for name, call in cases.items():
+        seconds = min(timeit.repeat(call, number=args.calls, repeat=3))
+        print(f"{name:<26} {seconds / args.calls * 1e9:8.1f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
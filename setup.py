@@ -32,6 +32,9 @@ setup(
         "reportlab==3.5.67",
         "click==8.1.3",
     ],
+    extras_require={
+        "msgpack": ["msgpack>=1.0"],
+    },
     entry_points="""
         [console_scripts]
         logges=Logges.cli:Logges_cli
@@ -24,17 +24,21 @@ For new projects, please use the modern Logger API which provides:
 
 # Modern API (recommended)
 from .logger import Logger, get_logger
-from .config import LogConfig, LogLevel, LogRecord
-from .handlers import LogHandler, FileHandler, ConsoleHandler
+from .config import LogConfig, LogLevel, LogRecord, OverflowPolicy
+from .handlers import LogHandler, FileHandler, RotatingFileHandler, ConsoleHandler, QueueHandler
 from .exceptions import (
     LoggesError,
     ConfigurationError,
     LogFileError,
+    LogFormatError,
     HandlerError,
     FormatterError,
     ExportError,
     RotationError,
+    SearchError,
 )
+from .matching import Matcher, MatchMode
+from .serializers import RecordSerializer, TextSerializer, JsonLinesSerializer, MsgpackSerializer, BinarySerializer
 
 # Legacy API (deprecated but maintained for compatibility)
 from .logges import Logges
@@ -48,17 +52,29 @@ __all__ = [
     "LogConfig",
     "LogLevel",
     "LogRecord",
+    "OverflowPolicy",
     "LogHandler",
     "FileHandler",
+    "RotatingFileHandler",
     "ConsoleHandler",
+    "QueueHandler",
+    "Matcher",
+    "MatchMode",
+    "RecordSerializer",
+    "TextSerializer",
+    "JsonLinesSerializer",
+    "MsgpackSerializer",
+    "BinarySerializer",
     # Exceptions
     "LoggesError",
     "ConfigurationError",
     "LogFileError",
+    "LogFormatError",
     "HandlerError",
     "FormatterError",
     "ExportError",
     "RotationError",
+    "SearchError",
     # Legacy API
     "Logges",
 ]
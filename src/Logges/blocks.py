@@ -0,0 +1,368 @@
+"""Block-compressed log files.
+
+A compressed log is written as a sequence of independently compressed
+blocks, so a crash loses at most the block still being filled, and a reader
+can decompress single blocks. The file keeps its ``.log`` name and starts
+with ``BLOCK_MAGIC`` and a codec byte. Each block is a fixed-width header
+followed by its compressed payload:
+
+=================  ========  ================================================
+Field              Type      Meaning
+=================  ========  ================================================
+compressed size    uint32    Bytes of payload after the header
+raw size           uint32    Bytes of the decompressed payload
+crc32              uint32    Checksum of the compressed payload
+records            uint32    Records in the block
+first, last        float64   Creation times (epoch) of the first/last record
+levels             uint8     Bit per level present in the block
+=================  ========  ================================================
+
+The headers double as the block index: ``iter_blocks`` reads only them,
+seeking past payloads, and decompresses just the blocks whose levels and
+time range can match the caller's filters. A payload holds whole records
+in the file's record format (text, JSON Lines, msgpack or binary).
+
+zstd is used when the ``zstandard`` package (or Python's
+``compression.zstd``) is available; gzip and lzma need only the standard
+library.
+"""
+
+import datetime
+import gzip
+import lzma
+import os
+import struct
+import zlib
+from collections.abc import Collection, Iterator, Sequence
+from pathlib import Path
+from typing import BinaryIO, Callable, NamedTuple, Optional, Union
+
+from .config import COMPRESSIONS, LogLevel, LogRecord
+from .exceptions import HandlerError, LogFileError
+
+BLOCK_MAGIC = b"LGZ\x01"
+BLOCK_HEADER = struct.Struct("<IIIIddB")
+
+# Codec ids stored after the magic
+_CODEC_IDS = {"zstd": 1, "gzip": 2, "lzma": 3}
+
+
+class Codec(NamedTuple):
+    """A compression method.
+
+    Attributes:
+        name: ``"zstd"``, ``"gzip"`` or ``"lzma"``
+        compress: Compress one payload
+        decompress: Decompress one payload
+    """
+
+    name: str
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+class BlockInfo(NamedTuple):
+    """Index entry of one block.
+
+    Attributes:
+        offset: File offset of the compressed payload
+        compressed_size: Bytes of compressed payload
+        raw_size: Bytes once decompressed
+        crc: CRC32 of the compressed payload
+        records: Number of records
+        first: Creation time of the first record (epoch)
+        last: Creation time of the last record (epoch)
+        levels: Bit mask of the levels present, see ``level_bit``
+    """
+
+    offset: int
+    compressed_size: int
+    raw_size: int
+    crc: int
+    records: int
+    first: float
+    last: float
+    levels: int
+
+
+def level_bit(level: LogLevel) -> int:
+    """Return the bit of ``level`` in a block's level mask."""
+    return 1 << (level.value // 10 - 1)
+
+
+def _zstd_codec() -> Optional[Codec]:
+    """Return the zstd codec, or None if no zstd module is installed."""
+    try:
+        from compression import zstd
+
+        return Codec("zstd", zstd.compress, zstd.decompress)
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    compressor = zstandard.ZstdCompressor()
+    decompressor = zstandard.ZstdDecompressor()
+    # zstandard objects aren't thread-safe: every codec gets its own, and
+    # handlers only compress with their lock held
+    return Codec("zstd", compressor.compress, decompressor.decompress)
+
+
+def get_codec(name: str) -> Codec:
+    """Return the codec for a compression name.
+
+    Args:
+        name: One of ``COMPRESSIONS``; ``"auto"`` is zstd if available,
+            gzip otherwise
+
+    Returns:
+        The codec
+
+    Raises:
+        HandlerError: If the name is unknown or zstd is not installed
+    """
+    if name in ("auto", "zstd"):
+        codec = _zstd_codec()
+        if codec is not None:
+            return codec
+        if name == "zstd":
+            raise HandlerError(
+                "zstd compression needs the zstandard package (pip install zstandard)"
+            )
+        name = "gzip"
+    if name == "gzip":
+        return Codec("gzip", lambda data: gzip.compress(data, mtime=0), gzip.decompress)
+    if name == "lzma":
+        return Codec("lzma", lzma.compress, lzma.decompress)
+    raise HandlerError(
+        f"Unknown compression {name!r}, expected one of {', '.join(COMPRESSIONS)}"
+    )
+
+
+class BlockWriter:
+    """Collect encoded records and compress them into blocks.
+
+    Not thread-safe; the file handler calls it with its lock held.
+
+    Attributes:
+        codec: Compression method of the blocks
+        block_size: Raw bytes after which a block is complete
+    """
+
+    def __init__(self, codec: Codec, block_size: int) -> None:
+        self.codec = codec
+        self.block_size = block_size
+        self._parts: list[bytes] = []
+        self._size = 0
+        self._records = 0
+        self._first = 0.0
+        self._last = 0.0
+        self._levels = 0
+
+    @property
+    def file_header(self) -> bytes:
+        """Bytes starting a compressed file written by this writer."""
+        return BLOCK_MAGIC + bytes([_CODEC_IDS[self.codec.name]])
+
+    @property
+    def pending(self) -> int:
+        """Raw bytes collected for the next block."""
+        return self._size
+
+    @property
+    def full(self) -> bool:
+        """Whether the next block has reached ``block_size``."""
+        return self._size >= self.block_size
+
+    def add(self, data: bytes, records: Sequence[LogRecord], created: float) -> None:
+        """Add encoded records to the next block.
+
+        Args:
+            data: Encoded records, or a serializer preamble
+            records: The records in ``data``, for the block index
+            created: Creation time to use for records that have none
+        """
+        self._parts.append(data)
+        self._size += len(data)
+        for record in records:
+            when = record.created or created
+            if not self._records:
+                self._first = when
+            self._last = max(self._last, when)
+            self._levels |= level_bit(record.level)
+            self._records += 1
+
+    def take(self) -> bytes:
+        """Compress the collected records into a block and start a new one.
+
+        Returns:
+            Block header and compressed payload
+        """
+        raw = b"".join(self._parts)
+        payload = self.codec.compress(raw)
+        block = BLOCK_HEADER.pack(
+            len(payload),
+            len(raw),
+            zlib.crc32(payload),
+            self._records,
+            self._first,
+            self._last,
+            self._levels,
+        )
+        self._parts = []
+        self._size = self._records = self._levels = 0
+        self._first = self._last = 0.0
+        return block + payload
+
+
+def read_codec(stream: BinaryIO) -> Codec:
+    """Read the file header of a compressed log.
+
+    Args:
+        stream: Binary stream at the start of the file
+
+    Returns:
+        The codec of the file's blocks
+
+    Raises:
+        LogFileError: If the stream is not a compressed log or its codec is
+            not available
+    """
+    header = stream.read(len(BLOCK_MAGIC) + 1)
+    if len(header) < len(BLOCK_MAGIC) + 1 or header[: len(BLOCK_MAGIC)] != BLOCK_MAGIC:
+        raise LogFileError("Not a Logges compressed log")
+    names = {codec_id: name for name, codec_id in _CODEC_IDS.items()}
+    name = names.get(header[-1])
+    if name is None:
+        raise LogFileError(f"Unknown codec {header[-1]} in compressed log")
+    try:
+        return get_codec(name)
+    except HandlerError as e:
+        raise LogFileError(str(e)) from e
+
+
+def read_index(stream: BinaryIO) -> list[BlockInfo]:
+    """Read the block index of a compressed log without decompressing.
+
+    A block cut off at the end of the file, such as one torn by a crash, is
+    left out.
+
+    Args:
+        stream: Binary stream after the file header (see ``read_codec``)
+
+    Returns:
+        One entry per complete block, in file order
+    """
+    size = os.fstat(stream.fileno()).st_size
+    blocks = []
+    offset = stream.tell()
+    while offset + BLOCK_HEADER.size <= size:
+        stream.seek(offset)
+        compressed, raw, crc, records, first, last, levels = BLOCK_HEADER.unpack(
+            stream.read(BLOCK_HEADER.size)
+        )
+        offset += BLOCK_HEADER.size
+        if offset + compressed > size:
+            break
+        blocks.append(BlockInfo(offset, compressed, raw, crc, records, first, last, levels))
+        offset += compressed
+    return blocks
+
+
+def repair(path: Union[str, Path]) -> int:
+    """Cut a torn last block off a compressed log.
+
+    Blocks are only ever appended, so after a crash at most the last one is
+    incomplete. Removing it lets new blocks be appended cleanly. Must not
+    run while another writer appends to the file.
+
+    Args:
+        path: Path of the compressed log
+
+    Returns:
+        Number of bytes removed
+
+    Raises:
+        LogFileError: If the file is not a compressed log
+        OSError: If the file cannot be read or truncated
+    """
+    with open(path, "r+b") as stream:
+        read_codec(stream)
+        blocks = read_index(stream)
+        end = blocks[-1].offset + blocks[-1].compressed_size if blocks else stream.tell()
+        size = os.fstat(stream.fileno()).st_size
+        if end < size:
+            stream.truncate(end)
+        return size - end
+
+
+def block_matches(
+    block: BlockInfo,
+    levels: Optional[Collection[str]] = None,
+    since: Optional[str] = None,
+) -> bool:
+    """Tell whether a block can hold records passing the filters.
+
+    Args:
+        block: Index entry of the block
+        levels: Level names to keep, or None for all
+        since: Earliest local time of day (``"HH:MM[:SS]"``), or None
+
+    Returns:
+        False only if no record of the block can match
+    """
+    if levels is not None:
+        mask = 0
+        for name in levels:
+            if name in LogLevel.__members__:
+                mask |= level_bit(LogLevel[name])
+        if not block.levels & mask:
+            return False
+    if since and block.records:
+        first = datetime.datetime.fromtimestamp(block.first)
+        last = datetime.datetime.fromtimestamp(block.last)
+        # Times of day only compare within one day
+        if first.date() == last.date() and last.strftime("%H:%M:%S.%f")[:12] < since:
+            return False
+    return True
+
+
+def iter_blocks(
+    stream: BinaryIO,
+    levels: Optional[Collection[str]] = None,
+    since: Optional[str] = None,
+    last_records: Optional[int] = None,
+) -> Iterator[tuple[BlockInfo, bytes]]:
+    """Decompress the blocks of a compressed log that can match the filters.
+
+    Args:
+        stream: Binary stream at the start of the file
+        levels: Level names to keep, or None for all
+        since: Earliest local time of day (``"HH:MM[:SS]"``), or None
+        last_records: Only read the last blocks, holding at least this many
+            records
+
+    Yields:
+        Index entry and decompressed payload of each matching block
+
+    Raises:
+        LogFileError: If the file is not a compressed log or a block is
+            corrupt
+    """
+    codec = read_codec(stream)
+    blocks = [block for block in read_index(stream) if block_matches(block, levels, since)]
+    if last_records is not None:
+        start = len(blocks)
+        total = 0
+        while start > 0 and total < last_records:
+            start -= 1
+            total += blocks[start].records
+        blocks = blocks[start:]
+
+    for block in blocks:
+        stream.seek(block.offset)
+        payload = stream.read(block.compressed_size)
+        if zlib.crc32(payload) != block.crc:
+            raise LogFileError(f"Corrupt compressed log: bad checksum at byte {block.offset}")
+        yield block, codec.decompress(payload)
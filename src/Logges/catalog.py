@@ -0,0 +1,278 @@
+"""Catalog of the log files in a directory.
+
+The CLI used to call ``os.listdir`` and compare ``name[:10]`` strings for
+every command. A LogCatalog scans a directory once with ``os.scandir``,
+parses each log file name into a date and a logger name, and keeps the
+files sorted by date so date ranges are answered by bisection.
+
+Both layouts are understood: dated files (``2026-01-30_app.log``, including
+size-rotated ``2026-01-30_app.1.log``) and undated files (``app.log``) as
+written by a ``Logger`` without daily rotation. Undated files are filed
+under the date they were last modified.
+
+The scan is cached in memory and in a hidden ``.Logges-catalog.json`` in
+the directory, keyed by the directory's modification time, so repeated
+invocations skip the scan as long as no file was added, removed or renamed.
+Appending to a file doesn't change the directory, so the undated files are
+stat'ed again whenever a cached scan is reused.
+"""
+
+import datetime
+import json
+import os
+import re
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from pathlib import Path
+from typing import NamedTuple, Optional, Union
+
+CATALOG_VERSION = 1
+CATALOG_FILE = ".Logges-catalog.json"
+
+_DATED_NAME = re.compile(r"(\d{4}-\d{2}-\d{2})_(.+)\.log")
+_UNDATED_NAME = re.compile(r"(.+)\.log")
+
+# Resolved directory -> catalog, for repeated lookups in one process
+_catalogs: dict[Path, "LogCatalog"] = {}
+
+
+def parse_log_name(name: str) -> Optional[tuple[Optional[str], str]]:
+    """Split a log file name into its date and logger name.
+
+    Args:
+        name: File name, e.g. ``2026-01-30_app.log`` or ``app.log``
+
+    Returns:
+        ``(date, logger)`` with date None for undated names, or None if the
+        name is not a log file name
+    """
+    dated = _DATED_NAME.fullmatch(name)
+    if dated is not None:
+        return dated.group(1), dated.group(2)
+    undated = _UNDATED_NAME.fullmatch(name)
+    if undated is not None:
+        return None, undated.group(1)
+    return None
+
+
+def default_log_dir() -> Path:
+    """Return the directory the legacy ``Logges`` API and the CLI use."""
+    return Path(__file__).resolve().parent
+
+
+class LogFileInfo(NamedTuple):
+    """A log file found in a catalog.
+
+    Attributes:
+        name: File name (e.g. ``2026-01-30_app.log``)
+        path: Full path of the file
+        date: ``YYYY-MM-DD`` from the file name, or of the last modification
+            for undated files
+        logger: Logger name part of the file name (e.g. ``app``)
+        dated: Whether the date comes from the file name
+        size: Size in bytes when the directory was scanned
+        mtime: Modification time when the directory was scanned
+    """
+
+    name: str
+    path: Path
+    date: str
+    logger: str
+    dated: bool
+    size: int
+    mtime: float
+
+
+class LogCatalog:
+    """Sorted index of the log files in one directory.
+
+    Files are ordered by date, then name. Size and modification time are as
+    of the last scan; call ``refresh()`` to rescan.
+
+    Example:
+        >>> catalog = LogCatalog.open("logs")
+        >>> [info.name for info in catalog.between("2026-01-01", "2026-01-31")]
+    """
+
+    def __init__(self, directory: Union[str, Path], files: Optional[list[LogFileInfo]] = None) -> None:
+        """Create a catalog.
+
+        Args:
+            directory: Directory holding the log files
+            files: Already scanned files; the directory is scanned if None
+        """
+        self.directory = Path(directory)
+        self.dir_mtime_ns = 0
+        if files is None:
+            self.refresh()
+        else:
+            self._set_files(files)
+
+    @classmethod
+    def open(cls, directory: Optional[Union[str, Path]] = None, use_cache: bool = True) -> "LogCatalog":
+        """Return the catalog of a directory, reusing a cached scan if valid.
+
+        Args:
+            directory: Directory holding the log files; the package directory
+                used by the legacy API if None
+            use_cache: Reuse and update the in-memory and on-disk caches
+
+        Returns:
+            Catalog of the directory
+
+        Raises:
+            OSError: If the directory cannot be read
+        """
+        directory = Path(directory).resolve() if directory is not None else default_log_dir()
+        if not use_cache:
+            return cls(directory)
+
+        dir_mtime_ns = directory.stat().st_mtime_ns
+        catalog = _catalogs.get(directory)
+        if catalog is None or catalog.dir_mtime_ns != dir_mtime_ns:
+            catalog = cls._load(directory, dir_mtime_ns)
+        if catalog is None:
+            catalog = cls(directory)
+            catalog.save()
+        elif catalog._restat_undated():
+            catalog.save()
+        _catalogs[directory] = catalog
+        return catalog
+
+    @classmethod
+    def _load(cls, directory: Path, dir_mtime_ns: int) -> Optional["LogCatalog"]:
+        """Read the on-disk cache; None if missing, unreadable or stale."""
+        try:
+            with open(directory / CATALOG_FILE, "r") as cache:
+                data = json.load(cache)
+            if data["version"] != CATALOG_VERSION or data["dir_mtime_ns"] != dir_mtime_ns:
+                return None
+            files = [
+                LogFileInfo(name, directory / name, date, logger, dated, size, mtime)
+                for name, date, logger, dated, size, mtime in data["files"]
+            ]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        catalog = cls(directory, files)
+        catalog.dir_mtime_ns = dir_mtime_ns
+        return catalog
+
+    def save(self) -> None:
+        """Write the on-disk cache; failures are ignored."""
+        data = {
+            "version": CATALOG_VERSION,
+            "dir_mtime_ns": self.dir_mtime_ns,
+            "files": [
+                [info.name, info.date, info.logger, info.dated, info.size, info.mtime]
+                for info in self.files
+            ],
+        }
+        target = self.directory / CATALOG_FILE
+        try:
+            if not target.exists():
+                # Creating the cache changes the directory's mtime; it is not
+                # a log file, so the scan is still valid for the new time
+                target.touch()
+                self.dir_mtime_ns = self.directory.stat().st_mtime_ns
+                data["dir_mtime_ns"] = self.dir_mtime_ns
+            # Rewrite in place: a rename would change the directory's mtime
+            with open(target, "w") as cache:
+                json.dump(data, cache, separators=(",", ":"))
+        except OSError:
+            pass
+
+    def refresh(self) -> None:
+        """Scan the directory again.
+
+        Raises:
+            OSError: If the directory cannot be read
+        """
+        self.dir_mtime_ns = self.directory.stat().st_mtime_ns
+        files = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                info = self._parse(entry)
+                if info is not None:
+                    files.append(info)
+        self._set_files(files)
+
+    def _parse(self, entry: os.DirEntry) -> Optional[LogFileInfo]:
+        """Build the LogFileInfo of a directory entry, if it is a log file."""
+        parsed = parse_log_name(entry.name)
+        if parsed is None:
+            return None
+        try:
+            if not entry.is_file():
+                return None
+            stat = entry.stat()
+        except OSError:
+            return None
+
+        date, logger = parsed
+        return LogFileInfo(
+            entry.name,
+            Path(entry.path),
+            date or datetime.date.fromtimestamp(stat.st_mtime).isoformat(),
+            logger,
+            date is not None,
+            stat.st_size,
+            stat.st_mtime,
+        )
+
+    def _restat_undated(self) -> bool:
+        """Update the undated files, whose date is their modification date.
+
+        Returns:
+            Whether any of them changed since the scan
+        """
+        changed = False
+        files = []
+        for info in self.files:
+            if not info.dated:
+                try:
+                    stat = info.path.stat()
+                except OSError:
+                    stat = None
+                if stat is not None and stat.st_mtime != info.mtime:
+                    info = info._replace(
+                        date=datetime.date.fromtimestamp(stat.st_mtime).isoformat(),
+                        size=stat.st_size,
+                        mtime=stat.st_mtime,
+                    )
+                    changed = True
+            files.append(info)
+        if changed:
+            self._set_files(files)
+        return changed
+
+    def _set_files(self, files: list[LogFileInfo]) -> None:
+        self.files = sorted(files, key=lambda info: (info.date, info.name))
+        self._dates = [info.date for info in self.files]
+        self._by_name = {info.name: info for info in self.files}
+
+    def between(self, min_date: Optional[str] = None, max_date: Optional[str] = None) -> list[LogFileInfo]:
+        """Return the files dated within a range, both ends included.
+
+        Args:
+            min_date: Earliest ``YYYY-MM-DD`` date, or None for no lower bound
+            max_date: Latest ``YYYY-MM-DD`` date, or None for no upper bound
+
+        Returns:
+            Matching files, ordered by date and name
+        """
+        start = bisect_left(self._dates, min_date) if min_date is not None else 0
+        end = bisect_right(self._dates, max_date) if max_date is not None else len(self.files)
+        return self.files[start:end]
+
+    def find(self, name: str) -> Optional[LogFileInfo]:
+        """Return the file called ``name``, if it is in the catalog."""
+        return self._by_name.get(name)
+
+    def __iter__(self) -> Iterator[LogFileInfo]:
+        return iter(self.files)
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._by_name
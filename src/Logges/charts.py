@@ -0,0 +1,168 @@
+"""Level charts for the Markdown and PDF exports.
+
+The pie chart is drawn with matplotlib's object-oriented API on an Agg
+canvas, so no pyplot figure is registered, left open or drawn over by the
+next export. Rendered PNGs are cached by their level counts, as a log is
+usually exported to several formats in a row.
+
+The bar charts need no matplotlib at all: an SVG document for Markdown and a
+reportlab drawing for PDF, both a lot faster to produce than the pie.
+"""
+
+import io
+from collections.abc import Mapping
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Union
+from xml.sax.saxutils import escape
+
+if TYPE_CHECKING:
+    from reportlab.graphics.shapes import Drawing
+
+# Chart kinds accepted by the exports
+CHART_KINDS = ("pie", "bars", "none")
+
+CHART_COLORS = {
+    "DEBUG": "gray",
+    "INFO": "blue",
+    "WARNING": "yellow",
+    "ERROR": "red",
+    "CRITICAL": "darkred",
+}
+
+# Bar chart layout, in pixels (SVG) or points (PDF)
+_BAR_LABEL_WIDTH = 80
+_BAR_HEIGHT = 18
+_BAR_GAP = 6
+_BAR_COUNT_WIDTH = 60
+
+
+def pie_chart_png(counts: Mapping[str, int]) -> bytes:
+    """Render a pie chart of level counts as PNG.
+
+    Args:
+        counts: Number of records per level name, in drawing order
+
+    Returns:
+        PNG image data; the same bytes for the same counts
+    """
+    return _render_pie(tuple(counts.items()))
+
+
+@lru_cache(maxsize=32)
+def _render_pie(items: tuple[tuple[str, int], ...]) -> bytes:
+    """Render the PNG for ``pie_chart_png``, cached by the counts.
+
+    Args:
+        items: ``(level, count)`` pairs in chart order
+
+    Returns:
+        PNG image data
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure()
+    FigureCanvasAgg(figure)
+    axes = figure.add_subplot()
+    labels = [level for level, _ in items]
+    sizes = [count for _, count in items]
+    if sum(sizes):
+        axes.pie(
+            sizes,
+            labels=labels,
+            explode=[0.0] + [0.01] * (len(items) - 1),
+            colors=[CHART_COLORS.get(level, "black") for level in labels],
+            autopct="%1.1f%%",
+        )
+    else:
+        # A pie of nothing can't be drawn
+        axes.text(0.5, 0.5, "No records", ha="center", va="center")
+        axes.set_axis_off()
+
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format="png")
+    return buffer.getvalue()
+
+
+def write_pie_chart(path: Union[str, Path], counts: Mapping[str, int]) -> None:
+    """Write a pie chart of level counts as a PNG file.
+
+    Args:
+        path: Path of the image
+        counts: Number of records per level name
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    Path(path).write_bytes(pie_chart_png(counts))
+
+
+def bar_chart_svg(counts: Mapping[str, int], width: int = 400) -> str:
+    """Render a horizontal bar chart of level counts as SVG.
+
+    Args:
+        counts: Number of records per level name
+        width: Width of the image in pixels
+
+    Returns:
+        SVG document
+    """
+    bar_space = width - _BAR_LABEL_WIDTH - _BAR_COUNT_WIDTH
+    most = max(counts.values(), default=0) or 1
+    height = len(counts) * (_BAR_HEIGHT + _BAR_GAP) + _BAR_GAP
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        'font-family="sans-serif" font-size="12">'
+    ]
+    for row, (level, count) in enumerate(counts.items()):
+        top = _BAR_GAP + row * (_BAR_HEIGHT + _BAR_GAP)
+        middle = top + _BAR_HEIGHT // 2 + 4
+        bar = round(bar_space * count / most)
+        color = CHART_COLORS.get(level, "black")
+        parts.append(f'<text x="0" y="{middle}">{escape(level)}</text>')
+        parts.append(
+            f'<rect x="{_BAR_LABEL_WIDTH}" y="{top}" width="{bar}" '
+            f'height="{_BAR_HEIGHT}" fill="{color}"/>'
+        )
+        parts.append(f'<text x="{_BAR_LABEL_WIDTH + bar + 4}" y="{middle}">{count}</text>')
+    parts.append("</svg>")
+    return "\n".join(parts) + "\n"
+
+
+def bar_chart_drawing(counts: Mapping[str, int], width: float = 400) -> "Drawing":
+    """Build a horizontal bar chart of level counts as a reportlab drawing.
+
+    The drawing is a flowable, so it can be added to a PDF story directly.
+
+    Args:
+        counts: Number of records per level name
+        width: Width of the drawing in points
+
+    Returns:
+        Drawing of the chart
+    """
+    from reportlab.graphics.shapes import Drawing, Rect, String
+    from reportlab.lib import colors
+
+    bar_space = width - _BAR_LABEL_WIDTH - _BAR_COUNT_WIDTH
+    most = max(counts.values(), default=0) or 1
+    height = len(counts) * (_BAR_HEIGHT + _BAR_GAP) + _BAR_GAP
+    drawing = Drawing(width, height)
+    for row, (level, count) in enumerate(counts.items()):
+        # reportlab's y axis points up; draw the first level at the top
+        bottom = height - (row + 1) * (_BAR_HEIGHT + _BAR_GAP)
+        baseline = bottom + _BAR_HEIGHT / 2 - 4
+        bar = bar_space * count / most
+        color = colors.toColor(CHART_COLORS.get(level, "black"))
+        drawing.add(String(0, baseline, level, fontName="Helvetica", fontSize=10))
+        drawing.add(
+            Rect(_BAR_LABEL_WIDTH, bottom, bar, _BAR_HEIGHT, fillColor=color, strokeColor=None)
+        )
+        drawing.add(
+            String(
+                _BAR_LABEL_WIDTH + bar + 4, baseline, str(count), fontName="Helvetica", fontSize=10
+            )
+        )
+    return drawing
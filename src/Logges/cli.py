@@ -1,24 +1,41 @@
 """CLI app."""
 import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
-from typing import Union
+from itertools import repeat
+from typing import List, Optional, Union
 
 import click
 from Logges import Logges
 
+from .catalog import LogCatalog
+from .charts import CHART_KINDS
+from .config import LogLevel
+from .exceptions import LogFileError
+from .exceptions import SearchError
+from .index import LogIndex
+from .matching import Matcher
+from .matching import MatchMode
+from .parser import LogEntry
+from .parser import detect_format
+from .parser import iter_compressed
+from .parser import iter_log_file
+from .tail import follow as follow_records
+from .tail import last_records
+from .utils import CHART_FILES
 from .utils import console_data
-from .utils import extract_logs
+from .utils import iter_console_data
 from .utils import to_markdown
 from .utils import to_pdf
+from .utils import to_text
 
 
-def validate_file(_, __, value):
+def validate_file(_, __, value, log_dir=None):
     """VALIDATE."""
-    log_files = []
-    for each_file in os.listdir(os.path.split(__file__)[0]):
-        if ".log" in each_file:
-            log_files.append(each_file)
-    if value not in log_files:
+    if value not in LogCatalog.open(log_dir):
         raise click.BadParameter(
             message="Please enter a " +
             click.style("valid", fg="red", reverse=True, underline=True) +
@@ -73,35 +90,19 @@ def Logges_cli():
     help="Show logs of minimum date.",
     callback=validate_date,
 )
-def list_logs(max_date: str, min_date: str):
+@click.option(
+    "--log_dir",
+    required=False,
+    default=None,
+    help="Directory of the log files, default is the Logges package directory.",
+)
+def list_logs(max_date: str, min_date: str, log_dir: str):
     """LIST."""
-    log_file_list = []
-    for each_file in os.listdir(os.path.split(__file__)[0]):
-        if ".log" in each_file:
-            if (not isinstance(min_date, type(None))) and (not isinstance(
-                    max_date, type(None))):
-                if (each_file[:10] >= min_date) and (each_file[:10] <=
-                                                     max_date):
-                    log_file_list.append(
-                        click.style(text="*: ", fg="bright_green", bold=True) +
-                        click.style(
-                            text=each_file, fg="bright_cyan", italic=True))
-            elif not isinstance(min_date, type(None)):
-                if each_file[:10] >= min_date:
-                    log_file_list.append(
-                        click.style(text="*: ", fg="bright_green", bold=True) +
-                        click.style(
-                            text=each_file, fg="bright_cyan", italic=True))
-            elif not isinstance(max_date, type(None)):
-                if each_file[:10] <= max_date:
-                    log_file_list.append(
-                        click.style(text="*: ", fg="bright_green", bold=True) +
-                        click.style(
-                            text=each_file, fg="bright_cyan", italic=True))
-            else:
-                log_file_list.append(
-                    click.style(text="*: ", fg="bright_green", bold=True) +
-                    click.style(text=each_file, fg="bright_cyan", italic=True))
+    log_file_list = [
+        click.style(text="*: ", fg="bright_green", bold=True) +
+        click.style(text=info.name, fg="bright_cyan", italic=True)
+        for info in LogCatalog.open(log_dir).between(min_date, max_date)
+    ]
     click.echo_via_pager("\n".join(log_file_list))
 
 
@@ -121,18 +122,165 @@ def list_logs(max_date: str, min_date: str):
     "--local_file",
     default=False,
 )
-def show_log_file(file: Union[str, any], local_file: bool) -> None:
+@click.option(
+    "--log_dir",
+    required=False,
+    default=None,
+    help="Directory of the log files, default is the Logges package directory.",
+)
+@click.option(
+    "--limit",
+    "-l",
+    default=None,
+    type=click.IntRange(min=0),
+    help="Show at most this many records.",
+)
+@click.option(
+    "--since",
+    default=None,
+    help="Skip records with an earlier timestamp, e.g. 12:30:00.",
+)
+@click.option(
+    "--level",
+    default=None,
+    type=click.Choice([level.name for level in LogLevel], case_sensitive=False),
+    help="Skip records below this level.",
+)
+@click.option(
+    "--pager",
+    is_flag=True,
+    default=False,
+    help="Page the output, streaming rows into the pager as they are read.",
+)
+def show_log_file(
+    file: Union[str, any],
+    local_file: bool,
+    log_dir: str,
+    limit: Optional[int],
+    since: Optional[str],
+    level: Optional[str],
+    pager: bool,
+) -> None:
     """SHOW."""
     if not local_file:
-        validate_file(None, None, value=file)
+        validate_file(None, None, value=file, log_dir=log_dir)
+        file = str(LogCatalog.open(log_dir).find(file).path)
     else:
         file = os.path.abspath(file)
-    console_data(
+
+    arguments = dict(
         script_name=file,
         status_dict=Logges.LogStatus.get_blank_dict(),
         statuc_icon_dict=Logges.LogStatus.get_icon_dict(),
-        local_file=local_file,
+        local_file=True,
+        limit=limit,
+        since=since,
+        min_level=level,
     )
+    if not pager:
+        console_data(**arguments)
+        return
+
+    from rich.console import Console
+
+    # Render each chunk to text and stream it into the pager as it is read
+    rich_console = Console(force_terminal=True)
+
+    def pages():
+        for renderable in iter_console_data(**arguments):
+            with rich_console.capture() as capture:
+                rich_console.print(renderable)
+            yield capture.get()
+
+    click.echo_via_pager(pages(), color=True)
+
+
+def entry_matches(
+    entry: LogEntry,
+    matcher: Optional[Matcher],
+    status_list: Optional[List[str]] = None,
+    functions_list: Optional[List[str]] = None,
+    files_list: Optional[List[str]] = None,
+) -> bool:
+    """Check a record against the search and tail filters.
+
+    Args:
+        entry: Parsed record
+        matcher: Compiled sentences to look for in the message, or None
+        status_list: Level names to keep, or None for all
+        functions_list: Function names to keep, or None for all
+        files_list: File names to keep, or None for all
+
+    Returns:
+        True if the record passes every given filter
+    """
+    if matcher is not None and not matcher.matches(entry.message):
+        return False
+
+    if status_list is not None:
+        if entry.level not in status_list:
+            return False
+
+    if functions_list is not None:
+        clear_funct_name = (entry.function.replace("<", "").replace(
+            ">", "").split(":")[0])
+        if clear_funct_name not in functions_list:
+            return False
+
+    if files_list is not None:
+        if entry.filename not in files_list:
+            return False
+    return True
+
+
+def search_log_file(
+    path: str,
+    matcher: Matcher,
+    status_list: Optional[List[str]] = None,
+    functions_list: Optional[List[str]] = None,
+    files_list: Optional[List[str]] = None,
+) -> List[LogEntry]:
+    """Return the records of one log file that match the search filters.
+
+    In ANY mode a record is returned once per sentence it contains, as the
+    search output has one line per match; in ALL mode it is returned once.
+    With ``--jobs`` this runs in worker processes.
+
+    Args:
+        path: Path of the log file
+        matcher: Compiled sentences to look for in messages
+        status_list: Level names to keep, or None for all
+        functions_list: Function names to keep, or None for all
+        files_list: File names to keep, or None for all
+
+    Returns:
+        Matching records, in file order
+    """
+    matches = []
+    file_format = detect_format(path)
+    if file_format == "text":
+        entries = LogIndex.open(path).search(
+            matcher.patterns if matcher.plain else None,
+            levels=status_list,
+            files=files_list,
+            functions=functions_list,
+        )
+    elif file_format == "compressed":
+        # Only blocks holding one of the levels are decompressed
+        entries = iter_compressed(path, levels=status_list)
+    else:
+        # The index only knows the text format; structured files are scanned
+        entries = iter_log_file(path)
+    for entry in entries:
+        if not entry_matches(entry, matcher, status_list, functions_list,
+                             files_list):
+            continue
+
+        if matcher.mode is MatchMode.ANY:
+            matches.extend([entry] * len(matcher.matching_patterns(entry.message)))
+        else:
+            matches.append(entry)
+    return matches
 
 
 @Logges_cli.command(
@@ -192,6 +340,56 @@ def show_log_file(file: Union[str, any], local_file: bool) -> None:
     help=
     "You can export your search result as log, md and pdf (only one type).",
 )
+@click.option(
+    "--all_sentences",
+    is_flag=True,
+    default=False,
+    help="Only match messages containing every sentence (default: any).",
+)
+@click.option(
+    "--ignore_case",
+    "-i",
+    is_flag=True,
+    default=False,
+    help="Ignore case while matching sentences.",
+)
+@click.option(
+    "--regex",
+    is_flag=True,
+    default=False,
+    help="Treat sentences as regular expressions.",
+)
+@click.option(
+    "--log_dir",
+    required=False,
+    default=None,
+    help="Directory of the log files, default is the Logges package directory.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Number of processes searching log files in parallel.",
+)
+@click.option(
+    "--max_rows",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Most records in the PDF export table, the rest is summarized.",
+)
+@click.option(
+    "--sample",
+    is_flag=True,
+    default=False,
+    help="With --max_rows, pick PDF export records at random instead of the first ones.",
+)
+@click.option(
+    "--chart",
+    default="pie",
+    type=click.Choice(CHART_KINDS),
+    help="Chart of the md and pdf exports; bars are drawn without matplotlib.",
+)
 def search_in_log_files(
     max_date: str,
     min_date: str,
@@ -201,6 +399,14 @@ def search_in_log_files(
     files: str,
     export_name: str,
     export: str,
+    all_sentences: bool,
+    ignore_case: bool,
+    regex: bool,
+    log_dir: str,
+    jobs: int,
+    max_rows: Optional[int],
+    sample: bool,
+    chart: str,
 ) -> None:
     """Search keywords on log files."""
     # Writting in file
@@ -214,106 +420,81 @@ def search_in_log_files(
                 click.style(text="log, md, pdf", underline=True),
             )
 
+    # Compile the sentences once for the whole search
+    try:
+        matcher = Matcher(
+            sentences.split(","),
+            mode=MatchMode.ALL if all_sentences else MatchMode.ANY,
+            ignore_case=ignore_case,
+            regex=regex,
+        )
+    except SearchError as e:
+        raise click.BadParameter(str(e), param_hint="--sentences") from e
+
     if export_name:
         tmp_filename = f"{export_name}.log"
     else:
         tmp_filename = datetime.now().strftime("Export %Y-%m-%d %H%M%S.log")
-    tmp_file = open(tmp_filename, "w")
 
-    # Log files
-    log_file_list = []
-    log_dir = os.path.split(__file__)[0]
-    for each_file in os.listdir(log_dir):
-        if ".log" in each_file:
-            if (not isinstance(min_date, type(None))) and (not isinstance(
-                    max_date, type(None))):
-                if (each_file[:10] >= min_date) and (each_file[:10] <=
-                                                     max_date):
-                    log_file_list.append(each_file)
-            elif not isinstance(min_date, type(None)):
-                if each_file[:10] >= min_date:
-                    log_file_list.append(each_file)
-            elif not isinstance(max_date, type(None)):
-                if each_file[:10] <= max_date:
-                    log_file_list.append(each_file)
-            else:
-                log_file_list.append(each_file)
+    # Log files, listed before the export file is created; never the export
+    # file itself, which may be written into the log directory
+    export_path = os.path.abspath(tmp_filename)
+    log_file_list = [
+        info for info in LogCatalog.open(log_dir).between(min_date, max_date)
+        if os.path.abspath(info.path) != export_path
+    ]
+    tmp_file = open(tmp_filename, "w")
+    # Per-file results are shown from copies outside the log directory
+    tmp_dir = tempfile.mkdtemp(prefix="logges-search-")
 
     # Create list of params, separated with ','
-    if sentences:
-        sentence_list = sentences.split(",")
-
-    if status:
-        status_list = status.split(",")
-
-    if functions:
-        functions_list = functions.split(",")
-
-    if files:
-        files_list = files.split(",")
-
-    # Extract and filter logs.
-    for each_log in log_file_list:
-        full_logfile_path = os.path.join(log_dir, each_log)
-        file = open(full_logfile_path, "r")
-        (
-            _date_list,
-            _status_list,
-            _filename_list,
-            _functname_list,
-            _log_message_list,
-        ) = extract_logs(logs=file)
-
-        each_tmp_log_file = open(each_log, "w")
-        counter = 0
-
-        for index, each_log_msg in enumerate(_log_message_list):
-            if sentence_list:
-                for each_sentence in sentence_list:
-                    if each_sentence in each_log_msg:
-                        if status:
-                            if (_status_list[index].replace("[", "").replace(
-                                    "]", "") not in status_list):
-                                continue
-
-                        if functions:
-                            clear_funct_name = (_functname_list[index].replace(
-                                "[", "").replace("]",
-                                                 "").replace("<", "").replace(
-                                                     ">", "").split(":")[0])
-                            if clear_funct_name not in functions_list:
-                                continue
-
-                        if files:
-                            if (_filename_list[index].replace("[", "").replace(
-                                    "]", "") not in files_list):
-                                continue
+    status_list = status.split(",") if status else None
+    functions_list = functions.split(",") if functions else None
+    files_list = files.split(",") if files else None
+
+    # Search files in date order; with --jobs, worker processes search ahead
+    # while results are written here in the same order.
+    log_paths = [str(info.path) for info in log_file_list]
+    try:
+        with ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else nullcontext() as executor:
+            mapper = executor.map if executor else map
+            results = mapper(
+                search_log_file,
+                log_paths,
+                repeat(matcher),
+                repeat(status_list),
+                repeat(functions_list),
+                repeat(files_list),
+            )
+
+            for each_log, entries in zip((info.name for info in log_file_list), results):
+                if not entries:
+                    continue
+
+                each_tmp_log = os.path.join(tmp_dir, each_log)
+                with open(each_tmp_log, "w") as each_tmp_log_file:
+                    for entry in entries:
                         tmp_file.write(
-                            f"{_date_list[index]} [{_status_list[index].replace('[', '').replace(']', '') :8s}] "
-                            +
-                            f"{_filename_list[index]} {_functname_list[index]}:({each_log}) {_log_message_list[index]}"
+                            f"[{entry.time}] [{entry.level :8s}] " +
+                            f"[{entry.filename}] [{entry.function}]:({each_log}) {entry.message}"
                         )
                         each_tmp_log_file.write(
-                            f"{_date_list[index]} [{_status_list[index].replace('[', '').replace(']', '') :8s}] "
-                            +
-                            f"{_filename_list[index]} {_functname_list[index]}: {_log_message_list[index]}"
+                            f"[{entry.time}] [{entry.level :8s}] " +
+                            f"[{entry.filename}] [{entry.function}]: {entry.message}"
                         )
-                        counter += 1
-        if counter > 0:
-            # Close temp file for writting on console log.
-            each_tmp_log_file.close()
-
-            console_data(
-                script_name=each_log,
-                status_dict=Logges.LogStatus.get_blank_dict(),
-                statuc_icon_dict=Logges.LogStatus.get_icon_dict(),
-                local_file=True,
-            )
 
-        # Remove temp log file.
-        os.remove(each_log)
+                console_data(
+                    script_name=each_tmp_log,
+                    status_dict=Logges.LogStatus.get_blank_dict(),
+                    statuc_icon_dict=Logges.LogStatus.get_icon_dict(),
+                    local_file=True,
+                )
 
-    tmp_file.close()
+                # Remove temp log file.
+                os.remove(each_tmp_log)
+    finally:
+        tmp_file.close()
+        shutil.rmtree(tmp_dir, ignore_errors=True)
 
     if not export:
         os.remove(tmp_filename)
@@ -325,6 +506,7 @@ def search_in_log_files(
                 status_dict=Logges.LogStatus.get_blank_dict(),
                 status_icons=Logges.LogStatus.get_icon_dict(),
                 local_file=True,
+                chart=chart,
             )
             os.remove(tmp_filename)
         elif export.lower() == "pdf":
@@ -333,9 +515,200 @@ def search_in_log_files(
                 saving_path=".",
                 status_dict=Logges.LogStatus.get_blank_dict(),
                 local_file=True,
+                max_rows=max_rows,
+                sample=sample,
+                chart=chart,
             )
             os.remove(tmp_filename)
-            os.remove("pie_chart.png")
+            if chart == "pie":
+                os.remove(CHART_FILES["pie"])
+
+
+_LEVEL_COLORS = {
+    "DEBUG": "bright_black",
+    "INFO": "blue",
+    "WARNING": "bright_yellow",
+    "ERROR": "red",
+    "CRITICAL": "bright_red",
+}
+
+
+@Logges_cli.command(
+    name="tail",
+    help="Show the last records of a log file, optionally following new ones.",
+)
+@click.option(
+    "--file",
+    required=True,
+    help="Log file name. If you don't know please use " +
+    click.style("list", fg="blue", underline=True, reverse=True) +
+    " command.",
+)
+@click.option(
+    "--local_file",
+    default=False,
+)
+@click.option(
+    "--follow",
+    "-f",
+    is_flag=True,
+    default=False,
+    help="Keep printing records as they are appended, until Ctrl+C.",
+)
+@click.option(
+    "--lines",
+    "-n",
+    default=10,
+    type=click.IntRange(min=0),
+    help="Number of last records to show first (filters apply to them).",
+)
+@click.option(
+    "--sentences",
+    "-sen",
+    required=False,
+    default=None,
+    help="Only show messages with these sentences, separated with ','.",
+)
+@click.option(
+    "--functions",
+    "-fu",
+    required=False,
+    default=None,
+    help="Searching functions, separated with ',' character.",
+)
+@click.option(
+    "--status",
+    "-sta",
+    required=False,
+    default=None,
+    help="Searching status, separated with ',' character.",
+)
+@click.option(
+    "--files",
+    "-fi",
+    required=False,
+    default=None,
+    help="Searching files, separated with ',' character.",
+)
+@click.option(
+    "--ignore_case",
+    "-i",
+    is_flag=True,
+    default=False,
+    help="Ignore case while matching sentences.",
+)
+@click.option(
+    "--regex",
+    is_flag=True,
+    default=False,
+    help="Treat sentences as regular expressions.",
+)
+@click.option(
+    "--log_dir",
+    required=False,
+    default=None,
+    help="Directory of the log files, default is the Logges package directory.",
+)
+def tail_log_file(
+    file: str,
+    local_file: bool,
+    follow: bool,
+    lines: int,
+    sentences: str,
+    functions: str,
+    status: str,
+    files: str,
+    ignore_case: bool,
+    regex: bool,
+    log_dir: str,
+) -> None:
+    """TAIL."""
+    if not local_file:
+        validate_file(None, None, value=file, log_dir=log_dir)
+        file = str(LogCatalog.open(log_dir).find(file).path)
+    else:
+        file = os.path.abspath(file)
+
+    matcher = None
+    if sentences:
+        try:
+            matcher = Matcher(sentences.split(","),
+                              ignore_case=ignore_case,
+                              regex=regex)
+        except SearchError as e:
+            raise click.BadParameter(str(e), param_hint="--sentences") from e
+    status_list = status.split(",") if status else None
+    functions_list = functions.split(",") if functions else None
+    files_list = files.split(",") if files else None
+
+    entries = (follow_records(file, count=lines)
+               if follow else last_records(file, lines))
+    try:
+        for entry in entries:
+            if entry_matches(entry, matcher, status_list, functions_list,
+                             files_list):
+                click.echo(
+                    f"[{entry.time}] [" +
+                    click.style(f"{entry.level :8s}",
+                                fg=_LEVEL_COLORS.get(entry.level)) +
+                    f"] [{entry.filename}] [{entry.function}]:{entry.message}",
+                    nl=False,
+                )
+    except KeyboardInterrupt:
+        pass
+    except LogFileError as e:
+        raise click.ClickException(str(e)) from e
+
+
+@Logges_cli.command(
+    name="convert",
+    help="Convert a JSON Lines, msgpack, binary or compressed log file to the text format.",
+)
+@click.option(
+    "--file",
+    "-f",
+    required=True,
+    help="Log file name.",
+)
+@click.option(
+    "--local_file",
+    default=False,
+)
+@click.option(
+    "--log_dir",
+    required=False,
+    default=None,
+    help="Directory of the log files, default is the Logges package directory.",
+)
+@click.option(
+    "--output",
+    "-o",
+    required=False,
+    default=None,
+    help="Path of the text file, default is the log file name with a .txt suffix.",
+)
+def convert_log_file(
+    file: str,
+    local_file: bool,
+    log_dir: str,
+    output: Optional[str],
+) -> None:
+    """CONVERT."""
+    if not local_file:
+        validate_file(None, None, value=file, log_dir=log_dir)
+        file = str(LogCatalog.open(log_dir).find(file).path)
+    else:
+        file = os.path.abspath(file)
+
+    if output is None:
+        output = os.path.splitext(os.path.basename(file))[0] + ".txt"
+    if os.path.abspath(output) == file:
+        raise click.BadParameter("The output would overwrite the log file.", param_hint="--output")
+    try:
+        count = to_text(file, output)
+    except LogFileError as e:
+        raise click.ClickException(str(e)) from e
+    click.echo(f"{count} records written to {output}")
 
 
 if __name__ == "__main__":
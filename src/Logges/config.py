@@ -5,11 +5,12 @@ This module provides dataclasses for configuring loggers and their behavior.
 
 import string
 from dataclasses import dataclass, field
-from enum import IntEnum
+from enum import Enum, IntEnum
 from pathlib import Path
 from typing import Optional
 
-from .exceptions import ConfigurationError
+from .exceptions import ConfigurationError, FormatterError
+from .formatter import CompiledFormat, compile_format
 
 
 class LogLevel(IntEnum):
@@ -26,6 +27,39 @@ class LogLevel(IntEnum):
     CRITICAL = 50
 
 
+class OverflowPolicy(Enum):
+    """What an asynchronous logger does when its queue is full.
+
+    BLOCK waits for the writer thread to make room, DROP_OLDEST discards the
+    oldest queued record and DROP_NEW discards the incoming record.
+    """
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEW = "drop_new"
+
+
+# Record formats a file handler can write (see serializers.get_serializer)
+FILE_FORMATS = ("text", "jsonl", "msgpack", "binary")
+
+# Block compression of log files (see blocks.get_codec); "auto" picks zstd
+# when available and gzip otherwise
+COMPRESSIONS = ("auto", "zstd", "gzip", "lzma")
+
+
+class TimestampFormat(Enum):
+    """How record timestamps are rendered.
+
+    TIME is the classic ``HH:MM:SS``, TIME_MS adds milliseconds, ISO is a full
+    ISO-8601 local timestamp with UTC offset and EPOCH is Unix time in seconds.
+    """
+
+    TIME = "time"
+    TIME_MS = "time_ms"
+    ISO = "iso"
+    EPOCH = "epoch"
+
+
 @dataclass
 class LogConfig:
     """Configuration for a Logger instance.
@@ -42,7 +76,30 @@ class LogConfig:
         auto_print_level: Auto-print logs at or above this level
         ignored_files: List of file patterns to ignore
         daily_rotation: Whether to create one log file per day
+        max_bytes: Rotate the log file when it would exceed this size (0 disables)
+        backup_count: Number of finished log files to keep (0 keeps all)
+        compress_rotated: Gzip finished log files in the background
         max_message_size: Maximum size of a single log message in bytes
+        buffered_file: Keep the log file open and buffer writes in memory
+        file_buffer_size: Size of the file write buffer in bytes
+        flush_interval: Maximum seconds between two flushes of the file buffer
+        flush_level: Records at or above this level flush the file buffer
+        async_dispatch: Hand records to a background writer thread
+        queue_size: Maximum number of records waiting for the writer thread
+        overflow_policy: What to do when the queue is full
+        capture_caller: Record file/function/line of the log call; disabling it
+            skips frame introspection (and ignored_files) for maximum throughput
+        timestamp_format: How record timestamps are rendered
+        file_format: Record format of the log file: "text", "jsonl" (JSON
+            Lines), "msgpack" or "binary" (compact, with interned strings);
+            structured formats keep every field separate
+        compression: Write the log file as independently compressed blocks:
+            "auto", "zstd", "gzip" or "lzma"; None writes it uncompressed
+        compression_block_size: Uncompressed bytes collected per block
+        multiprocess: Let several processes (e.g. forked server workers)
+            append to the same log file; every write is a single O_APPEND
+            write of whole records and size rotation is coordinated with
+            flock (POSIX only)
     """
 
     name: str
@@ -53,7 +110,26 @@ class LogConfig:
     auto_print_level: LogLevel = LogLevel.ERROR
     ignored_files: list[str] = field(default_factory=list)
     daily_rotation: bool = True
+    max_bytes: int = 0
+    backup_count: int = 0
+    compress_rotated: bool = False
     max_message_size: int = 10_000  # 10KB default
+    buffered_file: bool = False
+    file_buffer_size: int = 64 * 1024  # 64KB default
+    flush_interval: float = 1.0
+    flush_level: LogLevel = LogLevel.ERROR
+    async_dispatch: bool = False
+    queue_size: int = 10_000
+    overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK
+    capture_caller: bool = True
+    timestamp_format: TimestampFormat = TimestampFormat.TIME
+    file_format: str = "text"
+    compression: Optional[str] = None
+    compression_block_size: int = 64 * 1024
+    multiprocess: bool = False
+    _template: Optional[CompiledFormat] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Validate and normalize configuration after initialization."""
@@ -77,10 +153,54 @@ class LogConfig:
         if not self.format_string:
             raise ConfigurationError("Format string cannot be empty")
 
+        # Compile the format string once; this also validates it
+        try:
+            self._template = compile_format(self.format_string)
+        except FormatterError as e:
+            raise ConfigurationError(str(e)) from e
+
         # Validate max message size
         if self.max_message_size <= 0:
             raise ConfigurationError("max_message_size must be positive")
 
+        # Validate rotation options
+        if self.max_bytes < 0:
+            raise ConfigurationError("max_bytes cannot be negative")
+        if self.backup_count < 0:
+            raise ConfigurationError("backup_count cannot be negative")
+
+        # Validate file buffering options
+        if self.file_buffer_size <= 0:
+            raise ConfigurationError("file_buffer_size must be positive")
+        if self.flush_interval < 0:
+            raise ConfigurationError("flush_interval cannot be negative")
+
+        # Validate asynchronous dispatch options
+        if self.queue_size <= 0:
+            raise ConfigurationError("queue_size must be positive")
+        if not isinstance(self.overflow_policy, OverflowPolicy):
+            raise ConfigurationError(f"Invalid overflow policy: {self.overflow_policy}")
+
+        # Validate timestamp format
+        if not isinstance(self.timestamp_format, TimestampFormat):
+            raise ConfigurationError(f"Invalid timestamp format: {self.timestamp_format}")
+
+        # Validate file format
+        if self.file_format not in FILE_FORMATS:
+            raise ConfigurationError(
+                f"Invalid file format: {self.file_format!r}, "
+                f"expected one of {', '.join(FILE_FORMATS)}"
+            )
+
+        # Validate block compression options
+        if self.compression is not None and self.compression not in COMPRESSIONS:
+            raise ConfigurationError(
+                f"Invalid compression: {self.compression!r}, "
+                f"expected one of {', '.join(COMPRESSIONS)}"
+            )
+        if self.compression_block_size <= 0:
+            raise ConfigurationError("compression_block_size must be positive")
+
         # Convert log_dir to Path if it's a string
         if isinstance(self.log_dir, str):
             self.log_dir = Path(self.log_dir)
@@ -94,6 +214,14 @@ class LogConfig:
         # Normalize ignored files to lowercase
         self.ignored_files = [f.lower() for f in self.ignored_files]
 
+    @property
+    def template(self) -> CompiledFormat:
+        """Compiled form of ``format_string``, recompiled if the string changes."""
+        template = self._template
+        if template is None or template.format_string is not self.format_string:
+            template = self._template = compile_format(self.format_string)
+        return template
+
     def should_ignore_file(self, filepath: str) -> bool:
         """Check if a file should be ignored based on configuration.
 
@@ -115,13 +243,15 @@ class LogRecord:
     including metadata and the message itself.
 
     Attributes:
-        timestamp: Time when the log was created (HH:MM:SS format)
+        timestamp: Time when the log was created (HH:MM:SS unless configured
+            otherwise through ``LogConfig.timestamp_format``)
         level: Severity level of the log
         message: The log message content
         filename: Name of the file where log was called
         function: Name of the function where log was called
         line_number: Line number where log was called
         extra: Additional metadata as key-value pairs
+        created: Unix time the record was created, 0 if unknown
     """
 
     timestamp: str
@@ -131,6 +261,7 @@ class LogRecord:
     function: str
     line_number: int
     extra: dict[str, str] = field(default_factory=dict)
+    created: float = 0.0
 
     def format(self, format_string: str) -> str:
         """Format the log record using the provided format string.
@@ -141,11 +272,4 @@ class LogRecord:
         Returns:
             Formatted log message
         """
-        return format_string.format(
-            time=self.timestamp,
-            level=self.level.name,
-            filename=self.filename,
-            function=f"{self.function}:{self.line_number}",
-            message=self.message,
-            **self.extra,
-        )
+        return compile_format(format_string).render(self)
@@ -34,6 +34,15 @@ class LogFileError(LoggesError):
     """
 
 
+class LogFormatError(LogFileError):
+    """Raised when a log file holds records of another format.
+
+    Examples:
+        - Appending compressed blocks to a text log
+        - Appending text records to a binary log
+    """
+
+
 class HandlerError(LoggesError):
     """Raised when a log handler encounters an error.
 
@@ -72,3 +81,11 @@ class RotationError(LoggesError):
         - Cannot delete old log files
         - Rotation policy violation
     """
+
+
+class SearchError(LoggesError):
+    """Raised when a log search query is invalid.
+
+    Examples:
+        - Invalid regular expression in regex mode
+    """
@@ -0,0 +1,177 @@
+"""Precompiled format templates for the Logges library.
+
+This module turns a ``LogConfig.format_string`` into a render function once,
+instead of re-parsing the template with ``str.format`` for every record.
+"""
+
+import string
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from .exceptions import FormatterError
+
+if TYPE_CHECKING:
+    from .config import LogRecord
+
+# Source expressions for the built-in fields, evaluated against ``record``
+_FIELD_EXPRESSIONS = {
+    "time": "record.timestamp",
+    "level": "record.level.name",
+    "filename": "record.filename",
+    "function": "(record.function + ':' + str(record.line_number))",
+    "message": "record.message",
+}
+
+# Rendered in place of an extra field the record doesn't have
+MISSING_FIELD = ""
+
+# Conversions str.format accepts (None: no conversion)
+_CONVERSIONS = (None, "s", "r", "a")
+
+
+class CompiledFormat:
+    """A format string parsed once into a specialized render function.
+
+    Simple templates (plain field names with optional conversion and format
+    spec) are compiled into a single f-string. Templates using attribute
+    access, indexing or nested format specs fall back to ``str.format``.
+
+    Fields that are not built in (``time``, ``level``, ``filename``,
+    ``function``, ``message``) are looked up in the record's ``extra``. A
+    field the record doesn't have renders as ``MISSING_FIELD`` (empty), so
+    records logged without a context value still get written.
+
+    Attributes:
+        format_string: The template this object was compiled from
+        fields: Names of the fields referenced by the template
+        compiled: Whether a specialized renderer is used (False means fallback)
+    """
+
+    def __init__(self, format_string: str) -> None:
+        """Parse and compile a format string.
+
+        Args:
+            format_string: Template with ``str.format`` placeholders
+
+        Raises:
+            FormatterError: If the format string cannot be parsed
+        """
+        self.format_string = format_string
+        try:
+            parsed = list(string.Formatter().parse(format_string))
+        except ValueError as e:
+            raise FormatterError(f"Invalid format string {format_string!r}: {e}") from e
+
+        self.fields = tuple(name for _, name, _, _ in parsed if name is not None)
+        self._render = _compile(parsed)
+        self.compiled = self._render is not None
+
+    def render(self, record: "LogRecord") -> str:
+        """Render a log record with this template.
+
+        Args:
+            record: The log record to render
+
+        Returns:
+            Formatted log message
+
+        Raises:
+            FormatterError: If a field can't be rendered, e.g. a missing extra
+                field with a numeric format spec
+        """
+        try:
+            if self._render is not None:
+                return self._render(record)
+            return self.format_string.format_map(
+                _Fields(
+                    record.extra,
+                    time=record.timestamp,
+                    level=record.level.name,
+                    filename=record.filename,
+                    function=f"{record.function}:{record.line_number}",
+                    message=record.message,
+                )
+            )
+        except (AttributeError, IndexError, KeyError, TypeError, ValueError) as e:
+            raise FormatterError(f"Cannot render format string: {e}") from e
+
+    def __repr__(self) -> str:
+        return f"CompiledFormat({self.format_string!r})"
+
+
+class _Fields(dict):
+    """Fields for ``str.format_map``; extra fields the record lacks are ``MISSING_FIELD``."""
+
+    def __missing__(self, key: str) -> str:
+        return MISSING_FIELD
+
+
+def _compile(
+    parsed: list[tuple[str, Optional[str], Optional[str], Optional[str]]]
+) -> Optional[Callable[["LogRecord"], str]]:
+    """Generate a render function for a parsed template.
+
+    Literal text and format specs are passed in through the function's
+    namespace, so only validated field names end up in the generated source.
+
+    Args:
+        parsed: Output of ``string.Formatter().parse``
+
+    Returns:
+        The render function, or None if the template needs ``str.format``
+
+    Raises:
+        FormatterError: If a field has an unknown conversion or the
+            generated function doesn't compile
+    """
+    namespace: dict[str, Any] = {"_missing": MISSING_FIELD}
+    pieces = []
+
+    for index, (literal, name, spec, conversion) in enumerate(parsed):
+        if literal:
+            namespace[f"_l{index}"] = literal
+            pieces.append(f"{{_l{index}}}")
+        if name is None:
+            continue
+        if conversion not in _CONVERSIONS:
+            raise FormatterError(f"Unknown conversion !{conversion} in field {name!r}")
+        if not name.isidentifier() or (spec and "{" in spec):
+            return None
+
+        expression = _FIELD_EXPRESSIONS.get(name, f"record.extra.get({name!r}, _missing)")
+        if name == "function" and not spec and not conversion:
+            # Avoid building the "function:line" string separately
+            pieces.append("{record.function}:{record.line_number}")
+            continue
+
+        piece = expression
+        if conversion:
+            piece += f"!{conversion}"
+        if spec:
+            namespace[f"_s{index}"] = spec
+            piece += f":{{_s{index}}}"
+        pieces.append(f"{{{piece}}}")
+
+    source = 'def render(record):\n    return f"' + "".join(pieces) + '"\n'
+    try:
+        exec(compile(source, "<Logges format>", "exec"), namespace)
+    except SyntaxError as e:
+        raise FormatterError(f"Cannot compile format string: {e.msg}") from e
+    render: Callable[["LogRecord"], str] = namespace["render"]
+    return render
+
+
+@lru_cache(maxsize=32)
+def compile_format(format_string: str) -> CompiledFormat:
+    """Return the compiled template for ``format_string``, reusing earlier ones.
+
+    Args:
+        format_string: Template with ``str.format`` placeholders
+
+    Returns:
+        Compiled template
+
+    Raises:
+        FormatterError: If the format string cannot be parsed
+    """
+    return CompiledFormat(format_string)
@@ -4,13 +4,32 @@ This module provides the handler pattern for flexible log output destinations.
 Handlers can write to files, console, or other destinations.
 """
 
+import atexit
+import gzip
+import os
+import re
+import shutil
 import sys
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Sequence
 from pathlib import Path
-from typing import Optional, TextIO
+from typing import BinaryIO, Optional, TextIO
 
-from .config import LogRecord
-from .exceptions import HandlerError, LogFileError
+from .blocks import BLOCK_MAGIC, BlockWriter, get_codec, repair
+from .config import LogLevel, LogRecord, OverflowPolicy
+from .exceptions import HandlerError, LogFileError, LogFormatError, RotationError
+from .parser import detect_format
+from .serializers import BINARY_MAGIC, RecordSerializer, TextSerializer
+from .timestamps import TimestampProvider
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
 
 
 class LogHandler(ABC):
@@ -34,6 +53,37 @@ class LogHandler(ABC):
         """
         pass
 
+    def emit_batch(self, records: Sequence[LogRecord], formatted_messages: Sequence[str]) -> None:
+        """Write several log records at once.
+
+        The default implementation calls ``emit`` for every record. Handlers
+        that can write a whole batch more cheaply should override it.
+
+        Args:
+            records: The log records to write
+            formatted_messages: Pre-formatted messages, one per record
+
+        Raises:
+            HandlerError: If the handler cannot write the logs
+        """
+        for record, formatted_message in zip(records, formatted_messages):
+            self.emit(record, formatted_message)
+
+    def flush(self) -> None:
+        """Flush any buffered output to the handler's destination.
+
+        Handlers that write through immediately don't need to override this.
+        """
+
+    def _before_fork(self) -> None:
+        """Prepare for ``os.fork()``, e.g. by taking locks. Called in the parent."""
+
+    def _after_fork_in_parent(self) -> None:
+        """Undo ``_before_fork`` in the parent once it has forked."""
+
+    def _after_fork_in_child(self) -> None:
+        """Make the child's copy of the handler usable, e.g. replace locks."""
+
     @abstractmethod
     def close(self) -> None:
         """Clean up handler resources.
@@ -55,37 +105,191 @@ class LogHandler(ABC):
 class FileHandler(LogHandler):
     """Handler that writes logs to a file with proper resource management.
 
-    This handler opens a file for appending and writes log records to it.
-    It uses context managers to ensure proper file closure even in error cases.
+    By default this handler opens the file for appending, writes a single
+    record and closes it again, so the file on disk is always complete.
+
+    In buffered mode the handler keeps one file descriptor open and writes
+    through a bounded in-memory buffer. The buffer is flushed when it fills
+    up, when a record at or above ``flush_level`` arrives, when
+    ``flush_interval`` seconds have passed since the last flush, and on
+    ``flush()``/``close()``. A shared background thread enforces the
+    interval while the logger is idle, so records never wait much longer
+    than ``flush_interval`` to reach the file. Records still held in memory
+    when the interpreter exits are written by an ``atexit`` hook, also for
+    handlers that were never closed. A process ending with ``os._exit()``
+    skips that hook and loses them, as do ``multiprocessing`` children
+    started by fork: call ``flush()`` or ``close()`` before.
+
+    Records are encoded by ``serializer``: formatted text lines by default,
+    or a structured format such as JSON Lines. Stateful serializers (the
+    binary format) encode under the lock and get their preamble written
+    whenever the handler starts on a file.
+
+    With ``compression`` the file is written as independently compressed
+    blocks (see ``blocks``). Records collect in memory until ``block_size``
+    bytes are reached, a record at ``flush_level`` arrives,
+    ``flush_interval`` seconds have passed since the last block, or on
+    ``flush()``/``close()``; each block is then appended with one write.
+    Stateful serializers repeat their preamble in every block, so blocks
+    can be read on their own. ``buffered`` has no effect then.
+
+    The handler never appends to an existing file of another record format
+    (e.g. compressed blocks to a text log, or text to a binary log): it
+    raises ``LogFormatError`` instead. Only the compressed and binary
+    formats are known for certain, from their magic bytes; text, JSON Lines
+    and msgpack files are not told apart.
+
+    With ``multiprocess`` several processes, such as forked server workers,
+    can append to the same file. The handler keeps a descriptor opened with
+    ``O_APPEND`` and appends every record, batch, buffer or compressed block
+    with a single ``write()``, so on a local filesystem records never
+    interleave or overwrite each other, whatever their size. In buffered
+    mode whole records are collected up to ``buffer_size`` bytes and never
+    split across writes. Stateful serializers start every write with the
+    definitions it needs, and a file header (binary magic, compressed
+    header) is written once under an ``flock``. Network filesystems such as
+    NFS don't make ``O_APPEND`` atomic, and the mode needs ``fcntl``
+    (POSIX).
+
+    Across ``fork()`` every handler is left consistent: its lock is held
+    while the process forks and replaced in the child, and the child drops
+    the records buffered before the fork, which remain the parent's to
+    write.
 
     Attributes:
         filepath: Path to the log file
+        serializer: Encodes records for the file
+        buffered: Whether the persistent buffered stream is used
+        multiprocess: Whether other processes may append to the same file
+        buffer_size: Size of the in-memory write buffer in bytes
+        flush_interval: Maximum seconds between two flushes (buffered mode)
+        flush_level: Records at or above this level are flushed immediately
         _fallback_file: Fallback file for critical errors
         _stderr_failed: Flag to track if stderr writing failed
     """
 
-    def __init__(self, filepath: Path) -> None:
+    def __init__(
+        self,
+        filepath: Path,
+        buffered: bool = False,
+        buffer_size: int = 64 * 1024,
+        flush_interval: float = 1.0,
+        flush_level: LogLevel = LogLevel.ERROR,
+        serializer: Optional[RecordSerializer] = None,
+        compression: Optional[str] = None,
+        block_size: int = 64 * 1024,
+        multiprocess: bool = False,
+    ) -> None:
         """Initialize file handler.
 
         Args:
             filepath: Path where logs should be written
+            buffered: Keep the file open and buffer writes in memory
+            buffer_size: Size of the write buffer in bytes (buffered mode)
+            flush_interval: Maximum seconds between flushes (buffered mode)
+            flush_level: Flush immediately for records at or above this level
+            serializer: Encodes records; formatted text lines if None
+            compression: Block compression ("auto", "zstd", "gzip" or
+                "lzma"), or None to write uncompressed
+            block_size: Uncompressed bytes per compressed block
+            multiprocess: Let other processes append to the same file
 
         Raises:
+            HandlerError: If an option is invalid, or the compression or
+                multiprocess mode is not available
             LogFileError: If the file cannot be opened for writing
+            LogFormatError: If the file holds records of another format
         """
+        if buffer_size <= 0:
+            raise HandlerError("buffer_size must be positive")
+        if flush_interval < 0:
+            raise HandlerError("flush_interval cannot be negative")
+        if block_size <= 0:
+            raise HandlerError("block_size must be positive")
+        if multiprocess and fcntl is None:
+            raise HandlerError("multiprocess mode needs a POSIX system (fcntl)")
+
         self.filepath = filepath
+        self.serializer = serializer if serializer is not None else TextSerializer()
+        self._blocks = BlockWriter(get_codec(compression), block_size) if compression else None
+        self.buffered = buffered and self._blocks is None
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self.multiprocess = multiprocess
         self._stderr_failed = False
         self._fallback_file = Path("/tmp/logges_errors.log")
+        self._lock = threading.Lock()
+        self._stream: Optional[BinaryIO] = None
+        self._stream_path: Optional[Path] = None
+        # Whether the buffered stream holds records that weren't flushed yet
+        self._unflushed = False
+        # File the stateful serializer's preamble was written to
+        self._preamble_path: Optional[Path] = None
+        # What parser.detect_format reports for the files this handler writes
+        self._file_format = (
+            "compressed" if self._blocks is not None else self.serializer.file_format
+        )
+        # Records of the data passed to _write, for the block index
+        self._writing: Sequence[LogRecord] = ()
+        # File this handler last appended a compressed block to
+        self._block_path: Optional[Path] = None
+        self._last_flush = time.monotonic()
+        # Multiprocess mode: shared O_APPEND descriptor and whole buffered records
+        self._fd: Optional[int] = None
+        self._pending = bytearray()
+        # Whether the file behind _fd is known to start with its header
+        self._header_written = True
+        # Check before each write that no other process rotated the file away
+        self._guard_writes = False
 
         # Ensure parent directory exists
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self._check_file_format()
 
-        # Test that we can write to the file
+        # Test that we can write to the file (and keep it open in buffered
+        # and multiprocess mode)
         try:
-            with open(self.filepath, "a") as f:
-                pass  # Just test we can open it
+            if self.buffered or self.multiprocess:
+                self._open_stream()
+            else:
+                with open(self.filepath, "a"):
+                    pass  # Just test we can open it
         except (IOError, OSError) as e:
             raise LogFileError(f"Cannot write to log file {filepath}: {e}") from e
+        _fork_handlers.add(self)
+        _exit_handlers.add(self)
+        if (self.buffered or self._blocks is not None) and self.flush_interval > 0:
+            _watch_interval(self)
+
+    def _open_stream(self) -> None:
+        """Open the persistent stream (multiprocess: descriptor) for ``self.filepath``."""
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        if self.multiprocess:
+            self._fd = os.open(self.filepath, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            self._header_written = self._blocks is None and not self.serializer.stateful
+        else:
+            # Kept open across writes; _close_stream() closes it
+            self._stream = open(self.filepath, "ab", buffering=self.buffer_size)  # noqa: SIM115
+        self._stream_path = self.filepath
+        self._preamble_path = None
+        self._last_flush = time.monotonic()
+
+    def _close_stream(self) -> None:
+        """Flush and release the persistent stream or descriptor, if any.
+
+        A partly filled compressed block is written out first.
+        """
+        self._flush_block()
+        self._flush_pending()
+        fd, self._fd = self._fd, None
+        if fd is not None:
+            os.close(fd)
+        stream, self._stream = self._stream, None
+        self._stream_path = None
+        self._unflushed = False
+        if stream is not None:
+            stream.close()
 
     def emit(self, record: LogRecord, formatted_message: str) -> None:
         """Write a log record to the file.
@@ -97,33 +301,794 @@ class FileHandler(LogHandler):
         Raises:
             HandlerError: If writing to the file fails
         """
+        serializer = self.serializer
         try:
-            with open(self.filepath, "a") as f:
-                f.write(formatted_message + "\n")
-        except (IOError, OSError) as e:
+            if serializer.stateful:
+                with self._lock:
+                    if self.multiprocess:
+                        serializer.reset()
+                    self._writing = (record,)
+                    self._write(serializer.serialize(record, formatted_message), record.level)
+            else:
+                data = serializer.serialize(record, formatted_message)
+                with self._lock:
+                    self._writing = (record,)
+                    self._write(data, record.level)
+        except (IOError, OSError, ValueError, LogFileError) as e:
             # Don't let logging errors crash the application
-            # Try to write to stderr as fallback
+            self._handle_error(e, formatted_message)
+
+    def emit_batch(self, records: Sequence[LogRecord], formatted_messages: Sequence[str]) -> None:
+        """Write several log records with a single write call.
+
+        Args:
+            records: The log records to write
+            formatted_messages: Pre-formatted messages, one per record
+        """
+        if not records:
+            return
+        serializer = self.serializer
+        level = max(record.level for record in records)
+        try:
+            if serializer.stateful:
+                with self._lock:
+                    if self.multiprocess:
+                        serializer.reset()
+                    self._writing = records
+                    self._write(serializer.serialize_batch(records, formatted_messages), level)
+            else:
+                data = serializer.serialize_batch(records, formatted_messages)
+                with self._lock:
+                    self._writing = records
+                    self._write(data, level)
+        except (IOError, OSError, ValueError, LogFileError) as e:
+            self._handle_error(e, "\n".join(formatted_messages))
+
+    def _write(self, data: bytes, level: LogLevel) -> None:
+        """Write encoded records to the file. Must be called with ``_lock`` held.
+
+        Args:
+            data: Encoded records
+            level: Highest level among the records, used for flush_level
+        """
+        if self._blocks is not None:
+            self._add_to_block(data, level)
+            return
+
+        if self.multiprocess:
+            self._write_shared(data, level)
+            return
+
+        if not self.buffered:
+            with open(self.filepath, "ab") as f:
+                if self.serializer.stateful:
+                    self._write_preamble(f)
+                f.write(data)
+            return
+
+        # Reopen when the target file changed (e.g. a new daily file)
+        if self._stream is None or self._stream_path != self.filepath:
+            self._close_stream()
+            self._open_stream()
+
+        stream = self._stream
+        assert stream is not None
+        if self.serializer.stateful:
+            self._write_preamble(stream)
+        stream.write(data)
+        self._unflushed = True
+
+        now = time.monotonic()
+        if level >= self.flush_level or now - self._last_flush >= self.flush_interval:
+            stream.flush()
+            self._unflushed = False
+            self._last_flush = now
+
+    def _write_shared(self, data: bytes, level: LogLevel) -> None:
+        """Write encoded records in multiprocess mode. Must be called with ``_lock`` held.
+
+        Args:
+            data: Encoded records
+            level: Highest level among the records
+        """
+        if not self.buffered:
+            self._append(data)
+            return
+
+        # Whole records only: flush before a record that would overflow the buffer
+        if self._pending and len(self._pending) + len(data) > self.buffer_size:
+            self._flush_pending()
+        self._pending += data
+
+        if (
+            len(self._pending) >= self.buffer_size
+            or level >= self.flush_level
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        """Append the records buffered in multiprocess mode, if any.
+
+        Must be called with ``_lock`` held.
+        """
+        if not self._pending:
+            return
+        data = bytes(self._pending)
+        self._pending.clear()
+        try:
+            self._append(data)
+        except (IOError, OSError) as e:
+            self._handle_error(e, "<buffered records>")
+        self._last_flush = time.monotonic()
+
+    def _append(self, data: bytes) -> None:
+        """Append ``data`` to the shared file with a single write.
+
+        Must be called with ``_lock`` held. A new file gets its header first;
+        the check runs under an exclusive ``flock``, so only one process
+        writes it. With ``_guard_writes`` the write holds a shared ``flock``,
+        and a file that another process rotated away is reopened first.
+
+        Args:
+            data: Encoded records or a compressed block
+
+        Raises:
+            OSError: If the file cannot be opened or written
+        """
+        while True:
+            if self._fd is None:
+                self._open_stream()
+            fd = self._fd
+            assert fd is not None
+            if self._header_written and not self._guard_writes:
+                _write_all(fd, data)
+                return
+
+            fcntl.flock(fd, fcntl.LOCK_SH if self._header_written else fcntl.LOCK_EX)
             try:
-                print(f"Logging error: {e}", file=sys.stderr)
-                print(f"Failed to log: {formatted_message}", file=sys.stderr)
-            except Exception:
-                # Last resort: try to write to a fallback file
-                if not self._stderr_failed:
-                    self._stderr_failed = True
-                    try:
-                        with open(self._fallback_file, "a") as f:
-                            f.write(f"[CRITICAL] Logging system failure: {e}\n")
-                            f.write(f"Failed message: {formatted_message}\n")
-                    except Exception:
-                        pass  # If fallback also fails, give up silently
+                current = not self._guard_writes or self._is_current(fd)
+                if current:
+                    if not self._header_written:
+                        if os.fstat(fd).st_size == 0:
+                            data = self._file_header() + data
+                        self._header_written = True
+                    _write_all(fd, data)
+                    return
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            self._fd = None
+            os.close(fd)
+
+    def _is_current(self, fd: int) -> bool:
+        """Whether ``fd`` still refers to the file at ``self.filepath``."""
+        try:
+            linked = os.stat(self.filepath)
+        except FileNotFoundError:
+            return False
+        opened = os.fstat(fd)
+        return (linked.st_ino, linked.st_dev) == (opened.st_ino, opened.st_dev)
+
+    def _file_header(self) -> bytes:
+        """Bytes a new file starts with in multiprocess mode."""
+        if self._blocks is not None:
+            return self._blocks.file_header
+        if self.serializer.stateful:
+            return self.serializer.preamble(True)
+        return b""
+
+    def _add_to_block(self, data: bytes, level: LogLevel) -> None:
+        """Collect encoded records and write the block once it is complete.
+
+        Must be called with ``_lock`` held.
+
+        Args:
+            data: Encoded records
+            level: Highest level among the records
+        """
+        blocks = self._blocks
+        assert blocks is not None
+        now = time.time()
+        if not blocks.pending and self.serializer.stateful:
+            # Every block starts with the definitions its records refer to
+            try:
+                empty = self.filepath.stat().st_size == 0
+            except OSError:
+                empty = True
+            blocks.add(self.serializer.preamble(empty), (), now)
+        blocks.add(data, self._writing, now)
+
+        if (
+            blocks.full
+            or level >= self.flush_level
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self._flush_block()
+
+    def _flush_block(self) -> None:
+        """Compress and append the collected records, if any.
+
+        Must be called with ``_lock`` held. The first block a handler writes
+        to an existing file is preceded by cutting off a block torn by a
+        crash, so the file stays readable. Not in multiprocess mode, where
+        another process may be writing the last block. A block is never
+        appended to a file that isn't a compressed log.
+        """
+        blocks = self._blocks
+        if blocks is None or not blocks.pending:
+            return
+        block = blocks.take()
+        try:
+            if self.multiprocess:
+                # Other processes may be appending: no repair, one write per block
+                self._append(block)
+                self._last_flush = time.monotonic()
+                return
+            self.filepath.parent.mkdir(parents=True, exist_ok=True)
+            if self._block_path != self.filepath:
+                # The file may have been replaced since the handler opened it
+                self._check_file_format()
+            with open(self.filepath, "ab") as f:
+                if f.tell() == 0:
+                    block = blocks.file_header + block
+                elif self._block_path != self.filepath:
+                    repair(self.filepath)
+                f.write(block)
+            self._block_path = self.filepath
+        except (IOError, OSError, LogFileError) as e:
+            self._handle_error(e, "<compressed block>")
+        self._last_flush = time.monotonic()
+
+    def _foreign_format(self) -> Optional[str]:
+        """Record format of the existing file, if it isn't the one this handler writes.
+
+        Returns:
+            The format found, or None if the file is missing or empty,
+            matches, or the serializer's format is unknown
+        """
+        if self._file_format is None:
+            return None
+        try:
+            with open(self.filepath, "rb") as f:
+                head = f.read(len(BLOCK_MAGIC))
+            if not head:
+                return None
+            found = _MAGIC_FORMATS.get(head)
+            expected = self._file_format if self._file_format in _MAGIC_FORMATS.values() else None
+            if found == expected:
+                return None
+            return found if found is not None else detect_format(self.filepath)
+        except OSError:
+            return None
+
+    def _check_file_format(self) -> None:
+        """Refuse to append to an existing file of another record format.
+
+        Raises:
+            LogFormatError: If the file holds records of another format
+        """
+        found = self._foreign_format()
+        if found is not None:
+            raise LogFormatError(
+                f"Cannot append {self._file_format} records to {self.filepath}, "
+                f"which holds {found} records"
+            )
+
+    def _write_preamble(self, stream: BinaryIO) -> None:
+        """Write the serializer's preamble if ``stream`` is a file it hasn't started.
+
+        Args:
+            stream: Stream appending to ``self.filepath``
+        """
+        empty = stream.tell() == 0
+        if empty or self._preamble_path != self.filepath:
+            stream.write(self.serializer.preamble(empty))
+            self._preamble_path = self.filepath
+
+    def _handle_error(self, error: Exception, formatted_message: str) -> None:
+        """Report a failed write without letting it crash the application.
+
+        Args:
+            error: The exception raised while writing
+            formatted_message: The message that could not be written
+        """
+        # Try to write to stderr as fallback
+        try:
+            print(f"Logging error: {error}", file=sys.stderr)
+            print(f"Failed to log: {formatted_message}", file=sys.stderr)
+        except Exception:
+            # Last resort: try to write to a fallback file
+            if not self._stderr_failed:
+                self._stderr_failed = True
+                try:
+                    with open(self._fallback_file, "a") as f:
+                        f.write(f"[CRITICAL] Logging system failure: {error}\n")
+                        f.write(f"Failed message: {formatted_message}\n")
+                except Exception:
+                    pass  # If fallback also fails, give up silently
+
+    def flush(self) -> None:
+        """Write any buffered records to disk."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        """Write any buffered records to disk. Must be called with ``_lock`` held."""
+        self._flush_block()
+        self._flush_pending()
+        if self._stream is not None:
+            try:
+                self._stream.flush()
+            except (IOError, OSError) as e:
+                self._handle_error(e, "<buffered records>")
+            self._unflushed = False
+            self._last_flush = time.monotonic()
+
+    def _has_unwritten(self) -> bool:
+        """Whether records are held in memory (stream buffer, pending records or block)."""
+        return bool(
+            self._unflushed
+            or self._pending
+            or (self._blocks is not None and self._blocks.pending)
+        )
+
+    def _flush_if_due(self) -> None:
+        """Flush if records have waited ``flush_interval`` seconds. Run by the flusher thread."""
+        if not self._has_unwritten() or time.monotonic() - self._last_flush < self.flush_interval:
+            return
+        # A writer holding the lock checks the interval itself
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            self._flush_locked()
+        finally:
+            self._lock.release()
+
+    def reopen(self, filepath: Optional[Path] = None) -> None:
+        """Flush and close the current file and continue writing to ``filepath``.
+
+        Args:
+            filepath: New log file path. If None, the current path is reopened,
+                which is useful after the file was moved away externally.
+
+        Raises:
+            LogFileError: If the new file cannot be opened for writing
+            LogFormatError: If the new file holds records of another format
+        """
+        with self._lock:
+            self._close_stream()
+            self._preamble_path = None
+            if filepath is not None:
+                self.filepath = filepath
+            self._check_file_format()
+            if self.buffered:
+                try:
+                    self._open_stream()
+                except (IOError, OSError) as e:
+                    raise LogFileError(f"Cannot write to log file {self.filepath}: {e}") from e
 
     def close(self) -> None:
         """Close the file handler.
 
-        Note: This handler uses context managers internally,
-        so there's no persistent file handle to close.
+        Flushes buffered records and releases the file descriptor. In
+        unbuffered mode there is no persistent handle; only a partly filled
+        compressed block is written out.
+        """
+        with self._lock:
+            self._close_stream()
+
+    def _before_fork(self) -> None:
+        """Hold the lock while the process forks, with the stream flushed."""
+        self._lock.acquire()
+        if self._stream is not None:
+            try:
+                self._stream.flush()
+                self._unflushed = False
+            except (IOError, OSError) as e:
+                self._handle_error(e, "<buffered records>")
+
+    def _after_fork_in_parent(self) -> None:
+        """Release the lock taken before the fork."""
+        self._lock.release()
+
+    def _after_fork_in_child(self) -> None:
+        """Start the child with a free lock and without the parent's records."""
+        self._lock = threading.Lock()
+        self._pending.clear()
+        if self._blocks is not None:
+            self._blocks = BlockWriter(self._blocks.codec, self._blocks.block_size)
+        if self._fd is not None:
+            # flock() locks belong to the open file, which the copy shares
+            # with the parent: the child opens its own
+            os.close(self._fd)
+            self._fd = None
+        self._last_flush = time.monotonic()
+
+
+class RotatingFileHandler(FileHandler):
+    """File handler with daily and size-based rotation.
+
+    With ``daily=True`` records go to ``YYYY-MM-DD_<name>.log`` and the handler
+    switches to the next dated file at local midnight. The deadline is
+    precomputed, so the per-record check is a single comparison.
+
+    With ``max_bytes`` set, a file that would grow past the limit is renamed to
+    ``<stem>.<n>.log`` (``n`` counting up) and a fresh file is started.
+    ``backup_count`` limits how many finished files (previous days and size
+    backups) are kept for this logger; older ones are deleted. Finished files
+    can be gzip-compressed on a background thread. For block-compressed files
+    ``max_bytes`` counts the uncompressed bytes written since the file was
+    opened, so the files on disk stay smaller than the limit.
+
+    An existing file of another record format (e.g. today's text log after
+    switching to ``file_format="binary"``) is renamed like a size backup and
+    finished, and a fresh file is started.
+
+    In multiprocess mode ``max_bytes`` counts the bytes on disk, written by
+    any process. The process that rotates holds an exclusive ``flock`` on
+    the file while renaming it and checks again that the file is still full,
+    so several workers hitting the limit together rotate it once. With size
+    rotation, retention or compression every write holds a shared ``flock``
+    and first checks that the file wasn't rotated away, so no record lands
+    in a backup that is being compressed. Only one process compresses a
+    finished file.
+
+    Attributes:
+        log_dir: Directory holding the log files
+        name: Logger name used in the file names
+        daily: Whether a new dated file is started every day
+        max_bytes: Rotate when a file would exceed this size (0 disables)
+        backup_count: Number of finished files to keep (0 keeps all)
+        compress: Gzip finished files in the background
+    """
+
+    def __init__(
+        self,
+        log_dir: Path,
+        name: str,
+        daily: bool = True,
+        max_bytes: int = 0,
+        backup_count: int = 0,
+        compress: bool = False,
+        clock: Optional[TimestampProvider] = None,
+        buffered: bool = False,
+        buffer_size: int = 64 * 1024,
+        flush_interval: float = 1.0,
+        flush_level: LogLevel = LogLevel.ERROR,
+        serializer: Optional[RecordSerializer] = None,
+        compression: Optional[str] = None,
+        block_size: int = 64 * 1024,
+        multiprocess: bool = False,
+    ) -> None:
+        """Initialize the rotating file handler.
+
+        Args:
+            log_dir: Directory holding the log files
+            name: Logger name used in the file names
+            daily: Start a new dated file every day
+            max_bytes: Rotate when a file would exceed this size (0 disables)
+            backup_count: Number of finished files to keep (0 keeps all)
+            compress: Gzip finished files in the background
+            clock: Timestamp provider used to find the current date
+            buffered: Keep the file open and buffer writes in memory
+            buffer_size: Size of the write buffer in bytes (buffered mode)
+            flush_interval: Maximum seconds between flushes (buffered mode)
+            flush_level: Flush immediately for records at or above this level
+            serializer: Encodes records; formatted text lines if None
+            compression: Block compression ("auto", "zstd", "gzip" or
+                "lzma"), or None to write uncompressed
+            block_size: Uncompressed bytes per compressed block
+            multiprocess: Let other processes append to the same files
+
+        Raises:
+            HandlerError: If max_bytes or backup_count is negative, or
+                multiprocess mode is not available
+            LogFileError: If the file cannot be opened for writing
+        """
+        if max_bytes < 0:
+            raise HandlerError("max_bytes cannot be negative")
+        if backup_count < 0:
+            raise HandlerError("backup_count cannot be negative")
+
+        self.log_dir = Path(log_dir)
+        self.name = name
+        self.daily = daily
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.compress = compress
+        self._clock = clock if clock is not None else TimestampProvider()
+        self._compressors: list[threading.Thread] = []
+        self._rotated_pattern = re.compile(
+            r"^(?:(\d{4}-\d{2}-\d{2})_)?"
+            + re.escape(name)
+            + r"(?:\.(\d+))?\.log(?:\.gz)?$"
+        )
+
+        super().__init__(
+            self._current_path(),
+            buffered=buffered,
+            buffer_size=buffer_size,
+            flush_interval=flush_interval,
+            flush_level=flush_level,
+            serializer=serializer,
+            compression=compression,
+            block_size=block_size,
+            multiprocess=multiprocess,
+        )
+        self._rollover_at = self._clock.next_midnight if daily else float("inf")
+        self._size = self._file_size(self.filepath)
+        self._guard_writes = multiprocess and bool(max_bytes or backup_count or compress)
+
+    def _current_path(self) -> Path:
+        """Path of the file records should currently go to."""
+        if self.daily:
+            return self.log_dir / f"{self._clock.date()}_{self.name}.log"
+        return self.log_dir / f"{self.name}.log"
+
+    @staticmethod
+    def _file_size(path: Path) -> int:
+        """Size of ``path`` in bytes, or 0 if it doesn't exist."""
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+
+    def _write(self, data: bytes, level: LogLevel) -> None:
+        """Rotate if needed, then write. Must be called with ``_lock`` held.
+
+        Args:
+            data: Encoded records
+            level: Highest level among the records
+        """
+        try:
+            if time.time() >= self._rollover_at:
+                self._rollover_day()
+            elif self.max_bytes:
+                size = self._shared_size() if self.multiprocess else self._size
+                if size and size + len(data) > self.max_bytes:
+                    self._rollover_size(len(data))
+        except RotationError as e:
+            # Keep logging to the current file rather than losing records
+            print(f"Log rotation error: {e}", file=sys.stderr)
+
+        super()._write(data, level)
+        self._size += len(data)
+
+    def _shared_size(self) -> int:
+        """Bytes in the file of all processes plus this one's buffered records."""
+        if self._fd is None:
+            self._open_stream()
+        assert self._fd is not None
+        return os.fstat(self._fd).st_size + len(self._pending)
+
+    def _switch_to(self, path: Path) -> None:
+        """Point the handler at ``path``, releasing the previous file.
+
+        Raises:
+            LogFormatError: If ``path`` holds records of another format and
+                cannot be moved aside
         """
-        pass  # Nothing to close since we use context managers
+        self._close_stream()
+        self.filepath = path
+        self._check_file_format()
+        self._size = self._file_size(path)
+        if self.buffered:
+            self._open_stream()
+
+    def _rollover_day(self) -> None:
+        """Move on to the file for the new day."""
+        finished = self.filepath
+        self._switch_to(self._current_path())
+        self._rollover_at = self._clock.next_midnight
+        if finished != self.filepath:
+            self._finish(finished)
+
+    def _rollover_size(self, incoming: Optional[int] = None) -> None:
+        """Rename the full file to the next free backup name and start anew.
+
+        Args:
+            incoming: Size of the records about to be written. In
+                multiprocess mode the file is only renamed if they still
+                don't fit, as another process may have rotated it already.
+                None renames unconditionally.
+
+        Raises:
+            RotationError: If the file cannot be renamed
+        """
+        self._close_stream()
+        try:
+            if self.multiprocess:
+                backup = self._rename_shared(incoming)
+            else:
+                backup = self._backup_path()
+                self._rename(backup)
+        finally:
+            self._switch_to(self.filepath)
+        if backup is not None:
+            self._finish(backup)
+
+    def _backup_path(self) -> Path:
+        """Next free backup name of the current file."""
+        stem = self.filepath.name[: -len(".log")]
+        index = 1 + max(
+            (int(match.group(2)) for match in self._matching_files() if match.group(2)),
+            default=0,
+        )
+        return self.filepath.with_name(f"{stem}.{index}.log")
+
+    def _rename(self, backup: Path) -> None:
+        """Rename the current file to ``backup``.
+
+        Raises:
+            RotationError: If the file cannot be renamed
+        """
+        try:
+            os.replace(self.filepath, backup)
+        except OSError as e:
+            raise RotationError(f"Cannot rename {self.filepath} to {backup}: {e}") from e
+
+    def _rename_shared(self, incoming: Optional[int], foreign: bool = False) -> Optional[Path]:
+        """Rename the current file unless another process rotated it already.
+
+        Args:
+            incoming: Size of the records about to be written, or None to
+                rename any non-empty file
+            foreign: Only rename the file if it holds records of another
+                format, which another process may have moved aside already
+
+        Returns:
+            The backup path, or None if the file was left alone
+
+        Raises:
+            RotationError: If the file cannot be renamed
+        """
+        try:
+            fd = os.open(self.filepath, os.O_RDONLY)
+        except FileNotFoundError:
+            return None
+        try:
+            # Writers hold a shared lock: none is still appending once we get it
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            size = os.fstat(fd).st_size
+            if not self._is_current(fd) or not size:
+                return None
+            if incoming is not None and size + incoming <= self.max_bytes:
+                return None
+            if foreign and self._foreign_format() is None:
+                return None
+            backup = self._backup_path()
+            self._rename(backup)
+            return backup
+        finally:
+            os.close(fd)
+
+    def _check_file_format(self) -> None:
+        """Move an existing file of another record format aside and finish it.
+
+        Raises:
+            LogFormatError: If the file cannot be renamed
+        """
+        found = self._foreign_format()
+        if found is None:
+            return
+        try:
+            if self.multiprocess:
+                backup = self._rename_shared(None, foreign=True)
+            else:
+                backup = self._backup_path()
+                self._rename(backup)
+        except RotationError as e:
+            raise LogFormatError(
+                f"Cannot append {self._file_format} records to {self.filepath}, "
+                f"which holds {found} records: {e}"
+            ) from e
+        if backup is not None:
+            print(
+                f"Log format warning: {self.filepath} holds {found} records, "
+                f"moved it to {backup.name}",
+                file=sys.stderr,
+            )
+            self._finish(backup)
+
+    def _matching_files(self) -> list[re.Match[str]]:
+        """Name matches for all files in log_dir that belong to this logger."""
+        matches = []
+        for entry in os.scandir(self.log_dir):
+            match = self._rotated_pattern.match(entry.name)
+            if match and bool(match.group(1)) == self.daily:
+                matches.append(match)
+        return matches
+
+    def _finish(self, path: Path) -> None:
+        """Compress a finished file if requested and apply the retention limit.
+
+        Args:
+            path: A file the handler no longer writes to
+        """
+        if self.compress:
+            thread = threading.Thread(
+                target=self._compress, args=(path,), name="Logges-compress"
+            )
+            thread.start()
+            self._compressors = [t for t in self._compressors if t.is_alive()] + [thread]
+        else:
+            self._apply_retention()
+
+    def _compress(self, path: Path) -> None:
+        """Gzip ``path`` next to itself and remove the original.
+
+        Args:
+            path: File to compress
+        """
+        target = path.with_name(path.name + ".gz")
+        partial = path.with_name(path.name + ".gz.tmp")
+        try:
+            with open(path, "rb") as source:
+                if self.multiprocess:
+                    # Wait for writers still appending; only one process
+                    # gets to create the partial file
+                    fcntl.flock(source.fileno(), fcntl.LOCK_EX)
+                    mode = "xb"
+                else:
+                    mode = "wb"
+                with gzip.open(partial, mode) as destination:
+                    shutil.copyfileobj(source, destination)
+            os.replace(partial, target)
+            os.remove(path)
+            with self._lock:
+                self._apply_retention()
+        except (FileNotFoundError, FileExistsError) as e:
+            # Another process compressed the file or is compressing it
+            if not self.multiprocess:
+                print(f"Log rotation error: cannot compress {path}: {e}", file=sys.stderr)
+        except (OSError, RotationError) as e:
+            print(f"Log rotation error: cannot compress {path}: {e}", file=sys.stderr)
+
+    def _apply_retention(self) -> None:
+        """Delete the oldest finished files beyond ``backup_count``.
+
+        Raises:
+            RotationError: If an old file cannot be deleted
+        """
+        if not self.backup_count:
+            return
+
+        finished = [
+            match for match in self._matching_files() if match.string != self.filepath.name
+        ]
+        # Oldest first: by date, then numbered backups before the day's last file
+        finished.sort(
+            key=lambda match: (match.group(1) or "", int(match.group(2) or sys.maxsize))
+        )
+        for match in finished[: max(0, len(finished) - self.backup_count)]:
+            try:
+                os.remove(self.log_dir / match.string)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                raise RotationError(f"Cannot delete old log file {match.string}: {e}") from e
+
+    def rotate(self) -> None:
+        """Force a size rotation of the current file now.
+
+        Raises:
+            RotationError: If the file cannot be renamed
+        """
+        with self._lock:
+            if self.filepath.exists():
+                self._rollover_size()
+
+    def close(self) -> None:
+        """Close the file and wait for background compression to finish."""
+        super().close()
+        for thread in self._compressors:
+            thread.join()
+        self._compressors = []
+
+    def _after_fork_in_child(self) -> None:
+        """Reset the handler; compression threads are left to the parent."""
+        super()._after_fork_in_child()
+        self._compressors = []
 
 
 class ConsoleHandler(LogHandler):
@@ -151,16 +1116,44 @@ class ConsoleHandler(LogHandler):
             record: The log record to write
             formatted_message: Pre-formatted log message
         """
-        from .config import LogLevel
-
         # Determine output stream
         if self.use_stderr_for_errors and record.level >= LogLevel.ERROR:
             output = sys.stderr
         else:
             output = sys.stdout
 
+        self._print(formatted_message, output)
+
+    def emit_batch(self, records: Sequence[LogRecord], formatted_messages: Sequence[str]) -> None:
+        """Write several log records with one write per output stream.
+
+        Args:
+            records: The log records to write
+            formatted_messages: Pre-formatted messages, one per record
+        """
+        stdout_lines = []
+        stderr_lines = []
+        for record, formatted_message in zip(records, formatted_messages):
+            if self.use_stderr_for_errors and record.level >= LogLevel.ERROR:
+                stderr_lines.append(formatted_message)
+            else:
+                stdout_lines.append(formatted_message)
+
+        if stdout_lines:
+            self._print("\n".join(stdout_lines), sys.stdout)
+        if stderr_lines:
+            self._print("\n".join(stderr_lines), sys.stderr)
+
+    @staticmethod
+    def _print(text: str, output: TextIO) -> None:
+        """Print ``text`` to ``output`` without letting failures escape.
+
+        Args:
+            text: Text to print, without the trailing newline
+            output: Stream to print to
+        """
         try:
-            print(formatted_message, file=output)
+            print(text, file=output)
         except Exception as e:
             # If console printing fails, there's not much we can do
             # Try stderr as last resort
@@ -175,3 +1168,305 @@ class ConsoleHandler(LogHandler):
         Note: We don't close stdout/stderr as they're system streams.
         """
         pass  # Don't close system streams
+
+
+class QueueHandler(LogHandler):
+    """Handler that hands records to a background writer thread.
+
+    ``emit`` only appends the record to a bounded in-memory queue, so a slow
+    disk or a blocked terminal no longer adds to the caller's latency. A
+    dedicated writer thread drains the queue in batches and forwards every
+    record to the wrapped handlers.
+
+    When the queue is full the ``overflow_policy`` decides whether the caller
+    waits (BLOCK), the oldest queued record is discarded (DROP_OLDEST) or the
+    new record is discarded (DROP_NEW). Discarded records are counted in
+    ``dropped``.
+
+    ``close()`` drains every queued record before closing the wrapped
+    handlers, and is also registered with ``atexit`` so records still queued
+    at interpreter shutdown are written out.
+
+    A forked child starts its own writer thread with an empty queue; records
+    queued before the fork are written by the parent.
+
+    Attributes:
+        handlers: Handlers the writer thread forwards records to
+        maxsize: Maximum number of queued records
+        overflow_policy: Behaviour when the queue is full
+        batch_size: Maximum number of records taken from the queue at once
+        dropped: Number of records discarded because the queue was full
+    """
+
+    def __init__(
+        self,
+        handlers: list[LogHandler],
+        maxsize: int = 10_000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        batch_size: int = 256,
+    ) -> None:
+        """Initialize the queue and start the writer thread.
+
+        Args:
+            handlers: Handlers that should receive the records
+            maxsize: Maximum number of queued records
+            overflow_policy: Behaviour when the queue is full
+            batch_size: Maximum number of records handled per batch
+
+        Raises:
+            HandlerError: If maxsize or batch_size is not positive
+        """
+        if maxsize <= 0:
+            raise HandlerError("maxsize must be positive")
+        if batch_size <= 0:
+            raise HandlerError("batch_size must be positive")
+
+        self.handlers = list(handlers)
+        self.maxsize = maxsize
+        self.overflow_policy = overflow_policy
+        self.batch_size = batch_size
+        self.dropped = 0
+
+        self._queue: deque[tuple[LogRecord, str]] = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._drained = threading.Condition(self._lock)
+        self._in_flight = 0
+        self._closing = False
+
+        self._thread = threading.Thread(target=self._run, name="Logges-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+        _fork_handlers.add(self)
+
+    def emit(self, record: LogRecord, formatted_message: str) -> None:
+        """Queue a log record for the writer thread.
+
+        Args:
+            record: The log record to write
+            formatted_message: Pre-formatted log message
+        """
+        with self._lock:
+            while not self._closing and len(self._queue) >= self.maxsize:
+                if self.overflow_policy is OverflowPolicy.DROP_NEW:
+                    self.dropped += 1
+                    return
+                if self.overflow_policy is OverflowPolicy.DROP_OLDEST:
+                    self._queue.popleft()
+                    self.dropped += 1
+                    break
+                if threading.current_thread() is self._thread:
+                    # A wrapped handler is logging; waiting here would deadlock
+                    break
+                self._not_full.wait()
+
+            if not self._closing:
+                self._queue.append((record, formatted_message))
+                self._not_empty.notify()
+                return
+
+        # Records arriving after close() are written synchronously
+        self._dispatch([(record, formatted_message)])
+
+    def _run(self) -> None:
+        """Writer thread loop: take batches off the queue until closed."""
+        while True:
+            with self._lock:
+                while not self._queue and not self._closing:
+                    self._not_empty.wait()
+                if not self._queue:
+                    return
+                count = min(len(self._queue), self.batch_size)
+                batch = [self._queue.popleft() for _ in range(count)]
+                self._in_flight = count
+                self._not_full.notify_all()
+
+            self._dispatch(batch)
+
+            with self._lock:
+                self._in_flight = 0
+                if not self._queue:
+                    self._drained.notify_all()
+
+    def _dispatch(self, batch: list[tuple[LogRecord, str]]) -> None:
+        """Forward a batch of records to the wrapped handlers.
+
+        Args:
+            batch: Records and their formatted messages
+        """
+        records = [record for record, _ in batch]
+        formatted_messages = [formatted_message for _, formatted_message in batch]
+        for handler in self.handlers:
+            try:
+                handler.emit_batch(records, formatted_messages)
+            except Exception as e:
+                # The writer thread must survive misbehaving handlers
+                print(f"Handler error: {e}", file=sys.stderr)
+
+    def flush(self) -> None:
+        """Wait until every queued record was written, then flush the handlers."""
+        if threading.current_thread() is not self._thread:
+            with self._lock:
+                while (self._queue or self._in_flight) and self._thread.is_alive():
+                    self._drained.wait(timeout=0.1)
+
+        for handler in self.handlers:
+            handler.flush()
+
+    def close(self) -> None:
+        """Drain the queue, stop the writer thread and close the handlers."""
+        with self._lock:
+            if self._closing:
+                return
+            self._closing = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+        if threading.current_thread() is not self._thread:
+            self._thread.join()
+        atexit.unregister(self.close)
+
+        for handler in self.handlers:
+            try:
+                handler.close()
+            except Exception as e:
+                print(f"Error closing handler: {e}", file=sys.stderr)
+
+    def _before_fork(self) -> None:
+        """Hold the queue lock while the process forks."""
+        self._lock.acquire()
+
+    def _after_fork_in_parent(self) -> None:
+        """Release the lock taken before the fork."""
+        self._lock.release()
+
+    def _after_fork_in_child(self) -> None:
+        """Replace the lock and the writer thread, which don't survive fork."""
+        self._queue.clear()
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._drained = threading.Condition(self._lock)
+        self._thread = threading.Thread(target=self._run, name="Logges-writer", daemon=True)
+        if not self._closing:
+            self._thread.start()
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write ``data`` to ``fd``, continuing after a short write.
+
+    Regular files only return short writes when the disk is full or the
+    file size limit is hit, so in practice this is a single ``write()``.
+    """
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+# File handlers whose buffered records the flusher thread writes out once
+# their flush_interval has passed, also while the logger is idle
+_interval_handlers: "weakref.WeakSet[FileHandler]" = weakref.WeakSet()
+_flusher: Optional[threading.Thread] = None
+_flusher_lock = threading.Lock()
+
+# Shortest and longest sleep of the flusher thread, in seconds
+_FLUSHER_MIN_TICK = 0.01
+_FLUSHER_MAX_TICK = 1.0
+
+
+def _watch_interval(handler: FileHandler) -> None:
+    """Have the flusher thread enforce ``handler.flush_interval``, starting it if needed."""
+    global _flusher
+    with _flusher_lock:
+        _interval_handlers.add(handler)
+        if _flusher is None or not _flusher.is_alive():
+            _flusher = threading.Thread(target=_run_flusher, name="Logges-flusher", daemon=True)
+            _flusher.start()
+
+
+def _run_flusher() -> None:
+    """Flusher thread loop: flush handlers whose interval passed; stop when none is left."""
+    global _flusher
+    while True:
+        handlers = list(_interval_handlers)
+        if not handlers:
+            with _flusher_lock:
+                if not _interval_handlers:
+                    _flusher = None
+                    return
+            continue
+        # Half the shortest interval keeps every flush within 1.5 intervals
+        tick = min(handler.flush_interval for handler in handlers) / 2
+        del handlers
+        time.sleep(min(max(tick, _FLUSHER_MIN_TICK), _FLUSHER_MAX_TICK))
+        for handler in list(_interval_handlers):
+            try:
+                handler._flush_if_due()
+            except Exception as e:
+                # The flusher thread must survive misbehaving handlers
+                print(f"Handler error: {e}", file=sys.stderr)
+
+
+# Formats a file is known to hold from its first bytes. Text, JSON Lines and
+# msgpack have no magic bytes and can't be told apart reliably.
+_MAGIC_FORMATS = {BLOCK_MAGIC: "compressed", BINARY_MAGIC: "binary"}
+
+
+# File handlers that may hold records in memory when the interpreter exits
+_exit_handlers: "weakref.WeakSet[FileHandler]" = weakref.WeakSet()
+
+
+def _flush_at_exit() -> None:
+    """Write the records that file handlers still hold in memory at exit.
+
+    Registered when this module is imported, so it runs after the
+    ``QueueHandler``s (registered later) have handed over their records.
+    """
+    for handler in list(_exit_handlers):
+        if handler._has_unwritten():
+            try:
+                handler.flush()
+            except Exception as e:
+                print(f"Handler error: {e}", file=sys.stderr)
+
+
+atexit.register(_flush_at_exit)
+
+
+# Handlers that need their locks and buffers made consistent across fork()
+_fork_handlers: "weakref.WeakSet[LogHandler]" = weakref.WeakSet()
+
+
+def _before_fork() -> None:
+    """Take the handlers' locks before the process forks."""
+    for handler in list(_fork_handlers):
+        handler._before_fork()
+
+
+def _after_fork_in_parent() -> None:
+    """Release the handlers' locks in the parent."""
+    for handler in list(_fork_handlers):
+        handler._after_fork_in_parent()
+
+
+def _after_fork_in_child() -> None:
+    """Reset the handlers in the new child process."""
+    global _flusher, _flusher_lock
+    for handler in list(_fork_handlers):
+        handler._after_fork_in_child()
+    # Threads don't survive fork: start a flusher of the child's own
+    _flusher = None
+    _flusher_lock = threading.Lock()
+    handlers = list(_interval_handlers)
+    if handlers:
+        _watch_interval(handlers[0])
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=_before_fork,
+        after_in_parent=_after_fork_in_parent,
+        after_in_child=_after_fork_in_child,
+    )
@@ -0,0 +1,330 @@
+"""Sidecar search indexes for Logges log files.
+
+Each log file can have a hidden sidecar (``.2026-01-30_app.idx`` next to
+``2026-01-30_app.log``) holding the byte offset of every record, posting
+lists per level, file and function, and an inverted index of the message
+tokens. Searches intersect posting lists first and then decode only the
+candidate records, so a query over weeks of logs never reads the rest.
+
+The sidecar is built lazily on first search. When the log only grew since
+it was indexed, just the new records are added; any other change (size
+shrunk, rewritten in place, different inode) rebuilds it.
+"""
+
+import json
+import os
+import re
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Optional, Union
+
+from .parser import LogEntry
+from .reader import MappedLogReader, MappedRecord
+
+INDEX_VERSION = 1
+
+# Message tokens; bytes \w is ASCII-only, so other bytes act as separators
+_TOKEN = re.compile(rb"\w+")
+
+Postings = dict[str, list[int]]
+
+
+def index_path(log_path: Union[str, Path]) -> Path:
+    """Return the sidecar path of a log file.
+
+    The sidecar is hidden and its name doesn't contain ``.log``, so it never
+    shows up in log file listings.
+
+    Args:
+        log_path: Path of the log file
+
+    Returns:
+        Path of the sidecar index
+    """
+    log_path = Path(log_path)
+    return log_path.with_name(f".{log_path.stem}.idx")
+
+
+def _function_key(function: str) -> str:
+    """Normalize a function name the way the CLI filter compares it."""
+    return function.split(":")[0].replace("<", "").replace(">", "")
+
+
+class LogIndex:
+    """Record offsets and posting lists for one log file.
+
+    Record ids are positions in ``offsets``; every posting list is sorted.
+
+    Attributes:
+        path: Path of the indexed log file
+        size: Number of bytes of the log covered by the index
+        offsets: Start offset of every record
+        levels: Record ids per level name
+        files: Record ids per file name
+        functions: Record ids per function name (without line number or
+            angle brackets, e.g. ``module`` for ``<module>:3``)
+        tokens: Record ids per message token
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Create an empty index for a log file.
+
+        Args:
+            path: Path of the log file
+        """
+        self.path = Path(path)
+        self._clear()
+
+    def _clear(self) -> None:
+        """Drop everything indexed so far."""
+        self.size = 0
+        self.mtime_ns = 0
+        self.inode = 0
+        self.offsets: list[int] = []
+        self.levels: Postings = {}
+        self.files: Postings = {}
+        self.functions: Postings = {}
+        self.tokens: Postings = {}
+
+    @classmethod
+    def open(cls, path: Union[str, Path], save: bool = True) -> "LogIndex":
+        """Load the index of a log file, bringing it up to date first.
+
+        Args:
+            path: Path of the log file
+            save: Write the sidecar back if it had to be built or extended
+
+        Returns:
+            An index covering the whole file
+
+        Raises:
+            OSError: If the log file cannot be read
+        """
+        path = Path(path)
+        stat = path.stat()
+        index = cls._load(path)
+        if index is None or not index._can_extend(stat):
+            index = cls(path)
+
+        if (index.size, index.mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+            index.update(stat)
+            if save:
+                index.save()
+        return index
+
+    @classmethod
+    def _load(cls, path: Path) -> Optional["LogIndex"]:
+        """Read the sidecar of ``path``; None if missing or unreadable."""
+        try:
+            with open(index_path(path), "r") as sidecar:
+                data = json.load(sidecar)
+            if data["version"] != INDEX_VERSION:
+                return None
+            index = cls(path)
+            for name in ("size", "mtime_ns", "inode", "offsets", "levels", "files", "functions", "tokens"):
+                setattr(index, name, data[name])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return index
+
+    def _can_extend(self, stat: os.stat_result) -> bool:
+        """Whether the file only grew since it was indexed."""
+        if stat.st_ino != self.inode or stat.st_size < self.size:
+            return False
+        return stat.st_size > self.size or stat.st_mtime_ns == self.mtime_ns
+
+    def save(self) -> None:
+        """Write the sidecar; failures are ignored.
+
+        The sidecar is rewritten in place rather than renamed over, so that
+        updating it doesn't change the directory's modification time (which
+        invalidates the log catalog). A torn write only means a rebuild.
+        An index that cannot be saved (e.g. read-only log directory) is still
+        usable, it is just rebuilt next time.
+        """
+        data = {
+            "version": INDEX_VERSION,
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "inode": self.inode,
+            "offsets": self.offsets,
+            "levels": self.levels,
+            "files": self.files,
+            "functions": self.functions,
+            "tokens": self.tokens,
+        }
+        try:
+            with open(index_path(self.path), "w") as sidecar:
+                json.dump(data, sidecar, separators=(",", ":"))
+        except OSError:
+            pass
+
+    def update(self, stat: Optional[os.stat_result] = None) -> None:
+        """Index the records appended since the last update.
+
+        The last indexed record is re-indexed, as continuation lines may
+        have been appended to it.
+
+        Args:
+            stat: Result of ``os.stat`` on the log, if already known
+        """
+        stat = stat or self.path.stat()
+        with MappedLogReader(self.path) as reader:
+            start = 0
+            if self.offsets:
+                last = reader.record_at(self.offsets[-1], self.size)
+                if last is None:
+                    # Not the file we indexed after all
+                    self._clear()
+                else:
+                    start = last.start
+                    self._remove_last(last)
+
+            for record in reader.records(start=start):
+                self._add(record)
+            self.size = len(reader)
+
+        self.mtime_ns = stat.st_mtime_ns
+        self.inode = stat.st_ino
+
+    def _keys(self, record: MappedRecord) -> Iterator[tuple[Postings, str]]:
+        """Yield every (posting dict, key) pair a record belongs to."""
+        yield self.levels, bytes(record.level).decode()
+        yield self.files, bytes(record.filename).decode("utf-8", "replace")
+        yield self.functions, _function_key(bytes(record.function).decode("utf-8", "replace"))
+        for token in set(_TOKEN.findall(record.message)):
+            yield self.tokens, token.decode("ascii")
+
+    def _add(self, record: MappedRecord) -> None:
+        """Append a record to the offsets and posting lists."""
+        record_id = len(self.offsets)
+        self.offsets.append(record.start)
+        for postings, key in self._keys(record):
+            postings.setdefault(key, []).append(record_id)
+
+    def _remove_last(self, record: MappedRecord) -> None:
+        """Remove the last record, given as it was when indexed."""
+        record_id = len(self.offsets) - 1
+        for postings, key in self._keys(record):
+            ids = postings.get(key)
+            if ids and ids[-1] == record_id:
+                ids.pop()
+                if not ids:
+                    del postings[key]
+        self.offsets.pop()
+
+    def _sentence_candidates(self, needle: bytes) -> Optional[set[int]]:
+        """Record ids whose message may contain ``needle``.
+
+        Tokens inside the needle must match a message token exactly; the
+        first and last may be cut off, so they are matched as suffix and
+        prefix against the token vocabulary.
+
+        Returns:
+            Candidate ids, or None if the needle has no tokens to look up
+        """
+        result: Optional[set[int]] = None
+        for match in _TOKEN.finditer(needle):
+            token = match.group().decode("ascii")
+            open_start = match.start() == 0
+            open_end = match.end() == len(needle)
+            if not open_start and not open_end:
+                ids = set(self.tokens.get(token, ()))
+            else:
+                ids = set()
+                for key, postings in self.tokens.items():
+                    if open_start and open_end:
+                        found = token in key
+                    elif open_start:
+                        found = key.endswith(token)
+                    else:
+                        found = key.startswith(token)
+                    if found:
+                        ids.update(postings)
+
+            result = ids if result is None else result & ids
+            if not result:
+                break
+        return result
+
+    def candidates(
+        self,
+        sentences: Optional[Iterable[str]] = None,
+        levels: Optional[Iterable[str]] = None,
+        files: Optional[Iterable[str]] = None,
+        functions: Optional[Iterable[str]] = None,
+    ) -> list[int]:
+        """Return the ids of records that may match a query.
+
+        Filters left as None are not applied. A record is a candidate if it
+        passes every given filter and may contain any of the sentences.
+
+        Args:
+            sentences: Text that must occur in the message (any of them)
+            levels: Level names
+            files: File names
+            functions: Function names, angle brackets optional
+
+        Returns:
+            Sorted record ids
+        """
+        selected: Optional[set[int]] = None
+        lookups = (
+            (self.levels, levels),
+            (self.files, files),
+            (self.functions, None if functions is None else map(_function_key, functions)),
+        )
+        for postings, wanted in lookups:
+            if wanted is None:
+                continue
+            ids: set[int] = set()
+            for key in wanted:
+                ids.update(postings.get(key, ()))
+            selected = ids if selected is None else selected & ids
+
+        if sentences is not None:
+            matched: set[int] = set()
+            for sentence in sentences:
+                sentence_ids = self._sentence_candidates(sentence.encode())
+                if sentence_ids is None:
+                    # Can't be narrowed down, every record may match
+                    break
+                matched |= sentence_ids
+            else:
+                selected = matched if selected is None else selected & matched
+
+        if selected is None:
+            return list(range(len(self.offsets)))
+        return sorted(selected)
+
+    def search(
+        self,
+        sentences: Optional[Iterable[str]] = None,
+        levels: Optional[Iterable[str]] = None,
+        files: Optional[Iterable[str]] = None,
+        functions: Optional[Iterable[str]] = None,
+    ) -> Iterator[LogEntry]:
+        """Decode the candidate records of a query.
+
+        Only the candidates are read from the log. Callers should still
+        check the sentences against each message, as token matches are a
+        superset of substring matches.
+
+        Args:
+            sentences: Text that must occur in the message (any of them)
+            levels: Level names
+            files: File names
+            functions: Function names, angle brackets optional
+
+        Yields:
+            Decoded candidate records, in file order
+        """
+        record_ids = self.candidates(sentences, levels, files, functions)
+        if not record_ids:
+            return
+        with MappedLogReader(self.path) as reader:
+            for record_id in record_ids:
+                end = self.offsets[record_id + 1] if record_id + 1 < len(self.offsets) else self.size
+                record = reader.record_at(self.offsets[record_id], end)
+                if record is not None:
+                    yield record.decode()
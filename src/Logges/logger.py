@@ -4,15 +4,46 @@ This module provides the new, improved Logger class that replaces the static
 methods of the old Logges class with proper instance-based design.
 """
 
-import datetime
+import os
 import sys
+import time
+from collections.abc import Iterable, Mapping
 from pathlib import Path
-from types import FrameType
+from types import CodeType, FrameType
 from typing import Any, Optional
 
 from .config import LogConfig, LogLevel, LogRecord
-from .exceptions import ConfigurationError, HandlerError
-from .handlers import ConsoleHandler, FileHandler, LogHandler
+from .exceptions import ConfigurationError, HandlerError, LogFormatError
+from .handlers import (
+    ConsoleHandler,
+    FileHandler,
+    LogHandler,
+    QueueHandler,
+    RotatingFileHandler,
+)
+from .serializers import get_serializer
+from .timestamps import TimestampProvider
+
+# Plain int copies of the levels, so the disabled-level check in the
+# convenience methods is a single int comparison without enum lookups
+_DEBUG = int(LogLevel.DEBUG)
+_INFO = int(LogLevel.INFO)
+_WARNING = int(LogLevel.WARNING)
+_ERROR = int(LogLevel.ERROR)
+_CRITICAL = int(LogLevel.CRITICAL)
+
+# Frames from modules in this directory (Logger itself, the legacy Logges
+# wrapper) are skipped when looking for the code that issued a log call
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Cache entry for code objects that belong to the Logges package
+_INTERNAL_CODE = ("", "", True)
+
+# Number of records log_many() hands to the handlers at once
+_BATCH_SIZE = 1024
+
+# Upper bound on cached call sites, in case code objects are created dynamically
+_CALLER_CACHE_SIZE = 4096
 
 
 class Logger:
@@ -47,29 +78,84 @@ class Logger:
 
         Raises:
             ConfigurationError: If configuration is invalid
+            LogFormatError: If the log file holds records of another format
         """
         self.config = config
 
+        # Cached effective level; kept in sync by set_level()
+        self._min_level = int(config.level)
+
+        # Renders timestamps and dates once per second/day
+        self._clock = TimestampProvider(config.timestamp_format)
+
+        # Per-call-site cache: code object -> (filename, function, ignored)
+        self._caller_cache: dict[CodeType, tuple[str, str, bool]] = {}
+
         # Set up handlers
-        if handlers is not None:
-            self.handlers = handlers
-        else:
+        if handlers is None:
             # Create default handlers
-            self.handlers = self._create_default_handlers()
+            handlers = self._create_default_handlers()
+
+        # Hand records to a background writer thread if requested
+        if self.config.async_dispatch and handlers:
+            handlers = [
+                QueueHandler(
+                    handlers,
+                    maxsize=self.config.queue_size,
+                    overflow_policy=self.config.overflow_policy,
+                )
+            ]
+
+        self.handlers = handlers
 
     def _create_default_handlers(self) -> list[LogHandler]:
         """Create default file and console handlers.
 
         Returns:
             List containing a file handler and optional console handler
+
+        Raises:
+            LogFormatError: If the log file holds records of another format
         """
         handlers: list[LogHandler] = []
 
         # File handler - always enabled
-        log_file = self._get_log_filepath()
         try:
-            file_handler = FileHandler(log_file)
+            file_handler: FileHandler
+            if self.config.daily_rotation or self.config.max_bytes:
+                file_handler = RotatingFileHandler(
+                    self.config.log_dir,
+                    self.config.name,
+                    daily=self.config.daily_rotation,
+                    max_bytes=self.config.max_bytes,
+                    backup_count=self.config.backup_count,
+                    compress=self.config.compress_rotated,
+                    clock=self._clock,
+                    buffered=self.config.buffered_file,
+                    buffer_size=self.config.file_buffer_size,
+                    flush_interval=self.config.flush_interval,
+                    flush_level=self.config.flush_level,
+                    serializer=get_serializer(self.config.file_format),
+                    compression=self.config.compression,
+                    block_size=self.config.compression_block_size,
+                    multiprocess=self.config.multiprocess,
+                )
+            else:
+                file_handler = FileHandler(
+                    self._get_log_filepath(),
+                    buffered=self.config.buffered_file,
+                    buffer_size=self.config.file_buffer_size,
+                    flush_interval=self.config.flush_interval,
+                    flush_level=self.config.flush_level,
+                    serializer=get_serializer(self.config.file_format),
+                    compression=self.config.compression,
+                    block_size=self.config.compression_block_size,
+                    multiprocess=self.config.multiprocess,
+                )
             handlers.append(file_handler)
+        except LogFormatError:
+            # Writing would corrupt the file, and dropping file output quietly hides it
+            raise
         except Exception as e:
             # If we can't create file handler, warn but continue with console only
             print(f"Warning: Could not create file handler: {e}", file=sys.stderr)
@@ -89,111 +175,194 @@ class Logger:
         """
         if self.config.daily_rotation:
             # Include date in filename
-            date_str = datetime.datetime.now().strftime("%Y-%m-%d")
+            date_str = self._clock.date()
             filename = f"{date_str}_{self.config.name}.log"
         else:
             filename = f"{self.config.name}.log"
 
         return self.config.log_dir / filename
 
-    def _get_caller_info(self, depth: int = 3) -> tuple[str, str, int]:
+    def _resolve_code(self, code: CodeType) -> tuple[str, str, bool]:
+        """Compute the cached per-call-site information for a code object.
+
+        Args:
+            code: Code object of a frame on the call stack
+
+        Returns:
+            Tuple of (filename, function_name, ignored), or ``_INTERNAL_CODE``
+            for code that belongs to the Logges package
+        """
+        filepath = code.co_filename
+        if os.path.dirname(os.path.abspath(filepath)) == _PACKAGE_DIR:
+            return _INTERNAL_CODE
+
+        # Extract just the filename from the full path
+        filename = os.path.basename(filepath)
+        return (filename, code.co_name, self.config.should_ignore_file(filename))
+
+    def _get_caller_info(self) -> tuple[str, str, int, bool]:
         """Get information about the caller of the log method.
 
-        Uses frame introspection to determine the file, function, and line number
-        where the log method was called. Tries multiple depths if the specified
-        depth fails.
+        Walks up from the caller of ``log()`` past any Logges frames (the
+        level convenience methods, the legacy API) to the code that issued the
+        log call. Basename, function name and ignore decision are cached per
+        code object, so repeated calls from the same site cost one dict lookup.
+
+        Returns:
+            Tuple of (filename, function_name, line_number, ignored)
+        """
+        if not self.config.capture_caller:
+            return ("unknown", "unknown", 0, False)
+
+        cache = self._caller_cache
+        try:
+            # Frame 0 is this method, frame 1 is log(), frame 2 its caller
+            frame: Optional[FrameType] = sys._getframe(2)
+        except ValueError:
+            return ("unknown", "unknown", 0, False)
+
+        while frame is not None:
+            code = frame.f_code
+            entry = cache.get(code)
+            if entry is None:
+                if len(cache) >= _CALLER_CACHE_SIZE:
+                    cache.clear()
+                entry = cache[code] = self._resolve_code(code)
+            if entry is not _INTERNAL_CODE:
+                return (entry[0], entry[1], frame.f_lineno, entry[2])
+            frame = frame.f_back
+
+        # If all else fails, return unknowns
+        return ("unknown", "unknown", 0, False)
+
+    def set_ignored_files(self, patterns: list[str]) -> None:
+        """Replace the list of ignored file patterns.
+
+        Use this instead of assigning ``config.ignored_files`` directly, so
+        cached ignore decisions are recomputed.
 
         Args:
-            depth: Stack depth to check (default: 3)
+            patterns: File name patterns; matching is case-insensitive
+        """
+        self.config.ignored_files = [pattern.lower() for pattern in patterns]
+        self._caller_cache.clear()
+
+    def set_level(self, level: LogLevel) -> None:
+        """Change the minimum level of this logger.
+
+        Use this instead of assigning ``config.level`` directly, so the cached
+        effective level used by the fast rejection path stays in sync.
+
+        Args:
+            level: New minimum log level
+
+        Raises:
+            ConfigurationError: If level is not a LogLevel
+        """
+        if not isinstance(level, LogLevel):
+            raise ConfigurationError(f"Invalid log level: {level}")
+        self.config.level = level
+        self._min_level = int(level)
+
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Check whether a message at ``level`` would be recorded.
+
+        Useful to guard expensive message construction.
+
+        Args:
+            level: Log level to check
 
         Returns:
-            Tuple of (filepath, function_name, line_number)
+            True if messages at this level pass the level filter
         """
-        try:
-            # Try the specified depth first
-            frame: Optional[FrameType] = sys._getframe(depth)
-            if frame is None:
-                return ("unknown", "unknown", 0)
-
-            filepath = frame.f_code.co_filename
-            function_name = frame.f_code.co_name
-            line_number = frame.f_lineno
-
-            # Extract just the filename from the full path
-            filename = Path(filepath).name
-
-            return (filename, function_name, line_number)
-        except (ValueError, AttributeError):
-            # If specified depth fails, try to find the right frame
-            # by looking for a frame that's not in logger.py
-            try:
-                for d in range(2, 7):
-                    try:
-                        frame = sys._getframe(d)
-                        if frame and "logger.py" not in frame.f_code.co_filename:
-                            filepath = frame.f_code.co_filename
-                            function_name = frame.f_code.co_name
-                            line_number = frame.f_lineno
-                            filename = Path(filepath).name
-                            return (filename, function_name, line_number)
-                    except ValueError:
-                        continue
-            except Exception:
-                pass
-
-            # If all else fails, return unknowns
-            return ("unknown", "unknown", 0)
-
-    def _should_log(self, level: LogLevel, filepath: str) -> bool:
-        """Determine if a log message should be recorded.
+        return level >= self._min_level
+
+    @staticmethod
+    def _build_message(message: str | Any, args: tuple[Any, ...]) -> str:
+        """Turn a (possibly lazy) message and its arguments into a string.
+
+        Callables (other than classes) are called without arguments and their
+        result is used as the message. If ``args`` are given, the message is
+        %-formatted with them, like the standard library's logging module.
 
         Args:
-            level: Log level of the message
-            filepath: File path where log was called
+            message: Message, format string or zero-argument callable
+            args: Arguments for %-style formatting
 
         Returns:
-            True if the message should be logged, False otherwise
+            The final message string
         """
-        # Check level filtering
-        if level < self.config.level:
-            return False
+        if callable(message) and not isinstance(message, type):
+            message = message()
+
+        if not args:
+            return message if isinstance(message, str) else str(message)
+
+        # A single mapping argument supports "%(key)s" style formatting
+        if len(args) == 1 and isinstance(args[0], Mapping) and args[0]:
+            args = args[0]  # type: ignore[assignment]
 
-        # Check if file is ignored
-        if self.config.should_ignore_file(filepath):
-            return False
+        try:
+            return str(message) % args
+        except (TypeError, ValueError, KeyError) as e:
+            # A bad format string must not crash the application
+            print(f"Message formatting error: {e}", file=sys.stderr)
+            return f"{message} {args!r}"
+
+    def _truncate(self, message: str) -> str:
+        """Shorten a message that exceeds ``max_message_size``.
 
-        return True
+        Args:
+            message: The message to check
 
-    def log(self, message: str | Any, level: LogLevel, **extra: str) -> None:
+        Returns:
+            The message, truncated with a suffix if it was too long
+        """
+        if len(message) > self.config.max_message_size:
+            truncated_suffix = f"... (truncated from {len(message)} bytes)"
+            max_content = self.config.max_message_size - len(truncated_suffix)
+            message = message[:max_content] + truncated_suffix
+        return message
+
+    def log(self, message: str | Any, level: LogLevel, *args: Any, **extra: str) -> None:
         """Log a message at the specified level.
 
         This is the core logging method. Most users will use the convenience
         methods (debug, info, warning, error, critical) instead.
 
+        The message is only built once the record is known to be recorded, so
+        ``logger.debug("loaded %d rows from %r", n, table)`` or
+        ``logger.debug(lambda: expensive_summary())`` cost nothing when DEBUG
+        is disabled.
+
         Args:
-            message: The message to log (will be converted to string if needed)
+            message: The message to log: a string, a %-style format string used
+                with ``args``, a zero-argument callable, or any object that
+                will be converted to string
             level: Severity level of the message
+            *args: Arguments for %-style formatting of ``message``
             **extra: Additional key-value pairs to include in the log
         """
-        # Convert message to string if needed
-        if not isinstance(message, str):
-            message = str(message)
-
-        # Truncate message if it exceeds max size
-        if len(message) > self.config.max_message_size:
-            truncated_suffix = f"... (truncated from {len(message)} bytes)"
-            max_content = self.config.max_message_size - len(truncated_suffix)
-            message = message[:max_content] + truncated_suffix
+        # Reject disabled levels before doing any other work
+        if level < self._min_level:
+            return
 
         # Get caller information
-        filename, function_name, line_number = self._get_caller_info()
+        filename, function_name, line_number, ignored = self._get_caller_info()
 
-        # Check if we should log this
-        if not self._should_log(level, filename):
+        # Check if the calling file is ignored
+        if ignored:
             return
 
+        # Build the message only now that we know it will be recorded
+        message = self._build_message(message, args)
+
+        # Truncate message if it exceeds max size
+        message = self._truncate(message)
+
         # Get current time
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+        created = time.time()
+        timestamp = self._clock.now(created)
 
         # Create log record
         record = LogRecord(
@@ -204,6 +373,7 @@ class Logger:
             function=function_name,
             line_number=line_number,
             extra=extra,
+            created=created,
         )
 
         # Early return if no handlers
@@ -211,7 +381,7 @@ class Logger:
             return
 
         # Format the message
-        formatted_message = record.format(self.config.format_string)
+        formatted_message = self.config.template.render(record)
 
         # Emit to all handlers
         for handler in self.handlers:
@@ -221,52 +391,137 @@ class Logger:
                 # Log handler errors to stderr, but don't crash
                 print(f"Handler error: {e}", file=sys.stderr)
 
+    def log_many(self, messages: Iterable[str | Any], level: LogLevel, **extra: str) -> None:
+        """Log many messages at one level, handing them to handlers in batches.
+
+        Meant for bulk ingestion such as replaying the output of a job: the
+        level check, caller lookup and timestamp are done once, and every
+        handler receives whole batches through ``emit_batch``.
+
+        Args:
+            messages: Messages to log; each may be anything ``log()`` accepts
+                without format arguments
+            level: Severity level of all messages
+            **extra: Additional key-value pairs to include in every record
+        """
+        # Reject disabled levels before doing any other work
+        if level < self._min_level:
+            return
+
+        filename, function_name, line_number, ignored = self._get_caller_info()
+        if ignored or not self.handlers:
+            return
+
+        created = time.time()
+        timestamp = self._clock.now(created)
+        template = self.config.template
+        records: list[LogRecord] = []
+        formatted_messages: list[str] = []
+
+        for message in messages:
+            record = LogRecord(
+                timestamp=timestamp,
+                level=level,
+                message=self._truncate(self._build_message(message, ())),
+                filename=filename,
+                function=function_name,
+                line_number=line_number,
+                extra=extra,
+                created=created,
+            )
+            records.append(record)
+            formatted_messages.append(template.render(record))
+
+            if len(records) >= _BATCH_SIZE:
+                self._emit_batch(records, formatted_messages)
+                records, formatted_messages = [], []
+
+        if records:
+            self._emit_batch(records, formatted_messages)
+
+    def _emit_batch(self, records: list[LogRecord], formatted_messages: list[str]) -> None:
+        """Hand a batch of records to every handler.
+
+        Args:
+            records: The log records
+            formatted_messages: Pre-formatted messages, one per record
+        """
+        for handler in self.handlers:
+            try:
+                handler.emit_batch(records, formatted_messages)
+            except HandlerError as e:
+                # Log handler errors to stderr, but don't crash
+                print(f"Handler error: {e}", file=sys.stderr)
+
     # Convenience methods for each log level
 
-    def debug(self, message: str | Any, **extra: str) -> None:
+    def debug(self, message: str | Any, *args: Any, **extra: str) -> None:
         """Log a DEBUG level message.
 
         Args:
             message: The message to log
+            *args: Arguments for lazy %-style formatting of the message
             **extra: Additional metadata
         """
-        self.log(message, LogLevel.DEBUG, **extra)
+        if self._min_level > _DEBUG:
+            return
+        self.log(message, LogLevel.DEBUG, *args, **extra)
 
-    def info(self, message: str | Any, **extra: str) -> None:
+    def info(self, message: str | Any, *args: Any, **extra: str) -> None:
         """Log an INFO level message.
 
         Args:
             message: The message to log
+            *args: Arguments for lazy %-style formatting of the message
             **extra: Additional metadata
         """
-        self.log(message, LogLevel.INFO, **extra)
+        if self._min_level > _INFO:
+            return
+        self.log(message, LogLevel.INFO, *args, **extra)
 
-    def warning(self, message: str | Any, **extra: str) -> None:
+    def warning(self, message: str | Any, *args: Any, **extra: str) -> None:
         """Log a WARNING level message.
 
         Args:
             message: The message to log
+            *args: Arguments for lazy %-style formatting of the message
             **extra: Additional metadata
         """
-        self.log(message, LogLevel.WARNING, **extra)
+        if self._min_level > _WARNING:
+            return
+        self.log(message, LogLevel.WARNING, *args, **extra)
 
-    def error(self, message: str | Any, **extra: str) -> None:
+    def error(self, message: str | Any, *args: Any, **extra: str) -> None:
         """Log an ERROR level message.
 
         Args:
             message: The message to log
+            *args: Arguments for lazy %-style formatting of the message
             **extra: Additional metadata
         """
-        self.log(message, LogLevel.ERROR, **extra)
+        if self._min_level > _ERROR:
+            return
+        self.log(message, LogLevel.ERROR, *args, **extra)
 
-    def critical(self, message: str | Any, **extra: str) -> None:
+    def critical(self, message: str | Any, *args: Any, **extra: str) -> None:
         """Log a CRITICAL level message.
 
         Args:
             message: The message to log
+            *args: Arguments for lazy %-style formatting of the message
             **extra: Additional metadata
         """
-        self.log(message, LogLevel.CRITICAL, **extra)
+        if self._min_level > _CRITICAL:
+            return
+        self.log(message, LogLevel.CRITICAL, *args, **extra)
+
+    def flush(self) -> None:
+        """Flush buffered output of all handlers."""
+        for handler in self.handlers:
+            try:
+                handler.flush()
+            except Exception as e:
+                print(f"Error flushing handler: {e}", file=sys.stderr)
 
     def close(self) -> None:
         """Close all handlers and release resources.
@@ -30,7 +30,8 @@ from shutil import copy2
 from typing import Dict, List, Union, Optional
 from zipfile import ZipFile
 
-from .utils import extract_logs
+from .matching import Matcher, MatchMode
+from .parser import iter_log_file
 from .utils import get_current_time_HM
 from .utils import get_daily_log_file_name
 from .utils import get_log_info
@@ -218,7 +219,7 @@ class Logges:
 
         # Update compat logger if it exists
         if _COMPAT_LOGGER:
-            _COMPAT_LOGGER.config.ignored_files = IGNORE_FILES_AND_DIRS
+            _COMPAT_LOGGER.set_ignored_files(IGNORE_FILES_AND_DIRS)
 
     @staticmethod
     def log(msg: Union[str, any], status: LogStatus = LogStatus.DEBUG) -> None:
@@ -270,48 +271,53 @@ class Logges:
         Logges._write_logs(msg=msg)
 
     @staticmethod
-    def in_log(keyword: Union[str, List[str]]) -> bool:
+    def in_log(
+        keyword: Union[str, List[str]],
+        match_all: bool = True,
+        ignore_case: bool = False,
+        regex: bool = False,
+    ) -> bool:
         """Check if keyword(s) is logged in log file or not.
 
         Be aware of that, if log file has too many log row, this operation may take some time.
 
         Parameters:
             keyword `str or List of str`: It defines your searching keyword(s).
+            match_all `bool`: A message must contain every keyword (False: any of them).
+            ignore_case `bool`: Ignore case while matching.
+            regex `bool`: Keywords are regular expressions.
 
         Return:
             condition `bool`: Contains all True / not contains all False.
+
+        Raises:
+            SearchError: If regex is True and a keyword is not a valid regular expression.
         """
         global FILENAME, SAVINGPATH
         filename = get_daily_log_file_name(filename=FILENAME)
         file_dir = SAVINGPATH
         full_logfile_path = os.path.join(file_dir, filename)
 
-        try:
-            with open(full_logfile_path, "r") as file:
-                (
-                    _,
-                    _,
-                    _,
-                    _,
-                    _log_message_list,
-                ) = extract_logs(logs=file)
-        except (IOError, OSError):
+        if isinstance(keyword, str):
+            keyword = [keyword]
+        if not keyword:
             return False
 
-        if isinstance(keyword, str):
-            for each_log in _log_message_list:
-                if keyword in each_log:
+        matcher = Matcher(
+            keyword,
+            mode=MatchMode.ALL if match_all else MatchMode.ANY,
+            ignore_case=ignore_case,
+            regex=regex,
+        )
+
+        # Stream the file; stop at the first matching message
+        try:
+            for entry in iter_log_file(full_logfile_path):
+                if matcher.matches(entry.message):
                     return True
+        except (IOError, OSError):
             return False
-        else:
-            for each_log in _log_message_list:
-                counter = 0
-                for each_keyword in keyword:
-                    if each_keyword in each_log:
-                        counter += 1
-                    if counter == len(keyword):
-                        return True
-            return False
+        return False
 
     @staticmethod
     def export(
@@ -0,0 +1,135 @@
+"""Compiled multi-pattern matching for log searches.
+
+Searching for several keywords with ``keyword in message`` costs one pass
+over the message per keyword. A Matcher compiles all keywords of a query
+into one regular expression once, so the (C-implemented) regex engine
+checks every keyword in a single call.
+"""
+
+import re
+from collections.abc import Iterable
+from enum import Enum
+from typing import Optional
+
+from .exceptions import SearchError
+
+
+class MatchMode(Enum):
+    """How the patterns of a query are combined.
+
+    ANY matches text containing at least one pattern, ALL matches text
+    containing every pattern.
+    """
+
+    ANY = "any"
+    ALL = "all"
+
+
+class Matcher:
+    """A set of search patterns compiled into one regular expression.
+
+    ANY mode compiles an alternation and needs one pass over the text. ALL
+    mode compiles one lookahead per pattern, anchored at the start of the
+    text, so the engine stops at the first missing pattern.
+
+    A matcher without patterns matches nothing.
+
+    Attributes:
+        patterns: The patterns, as given
+        mode: How the patterns are combined
+        ignore_case: Whether matching ignores case
+        regex: Whether patterns are regular expressions rather than plain text
+    """
+
+    def __init__(
+        self,
+        patterns: Iterable[str],
+        mode: MatchMode = MatchMode.ANY,
+        ignore_case: bool = False,
+        regex: bool = False,
+    ) -> None:
+        """Compile the patterns of a query.
+
+        Args:
+            patterns: Text (or regular expressions) to look for
+            mode: Whether any or all patterns must occur
+            ignore_case: Match case-insensitively
+            regex: Treat patterns as regular expressions
+
+        Raises:
+            SearchError: If a pattern is not a valid regular expression
+        """
+        self.patterns = tuple(patterns)
+        self.mode = mode
+        self.ignore_case = ignore_case
+        self.regex = regex
+
+        self._flags = re.DOTALL | (re.IGNORECASE if ignore_case else 0)
+        self._sources = [
+            pattern if regex else re.escape(pattern) for pattern in self.patterns
+        ]
+        self._singles: Optional[list[re.Pattern[str]]] = None
+
+        if not self.patterns:
+            self._combined = None
+        elif mode is MatchMode.ANY:
+            self._combined = self._compile("|".join(f"(?:{source})" for source in self._sources))
+        else:
+            self._combined = self._compile(
+                "".join(f"(?=.*?(?:{source}))" for source in self._sources)
+            )
+
+    def _compile(self, source: str) -> "re.Pattern[str]":
+        try:
+            return re.compile(source, self._flags)
+        except re.error as e:
+            raise SearchError(f"Invalid search pattern: {e}") from e
+
+    @property
+    def plain(self) -> bool:
+        """Whether the query is plain, case-sensitive text.
+
+        Only plain queries can be narrowed down with a sidecar index.
+        """
+        return not self.regex and not self.ignore_case
+
+    def matches(self, text: str) -> bool:
+        """Check text against the query.
+
+        Args:
+            text: Text to search, e.g. a log message
+
+        Returns:
+            True if the text contains any (ANY mode) or all (ALL mode) patterns
+        """
+        if self._combined is None:
+            return False
+        if self.mode is MatchMode.ANY:
+            return self._combined.search(text) is not None
+        return self._combined.match(text) is not None
+
+    def matching_patterns(self, text: str) -> list[str]:
+        """Return the patterns that occur in the text.
+
+        Each pattern is checked on its own, so call ``matches`` first to rule
+        out the (usually many) texts that match nothing.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Patterns found in the text, in query order
+        """
+        if self._singles is None:
+            self._singles = [self._compile(source) for source in self._sources]
+        return [
+            pattern
+            for pattern, single in zip(self.patterns, self._singles, strict=True)
+            if single.search(text) is not None
+        ]
+
+    def __repr__(self) -> str:
+        return (
+            f"Matcher({list(self.patterns)!r}, mode={self.mode}, "
+            f"ignore_case={self.ignore_case}, regex={self.regex})"
+        )
@@ -0,0 +1,379 @@
+"""Streaming parser for Logges log files.
+
+This module reads the bracketed text format written by Logges,
+``[time] [ LEVEL ] [file] [function:line]: message``, one record at a time,
+so callers never need to hold a whole log file in memory.
+
+Files written in the structured formats (JSON Lines, msgpack or the
+binary format, see ``serializers``) are read field by field instead,
+without any regex. Block-compressed files (see ``blocks``) are read one
+block at a time, skipping blocks whose index rules out the filters.
+``iter_log_file`` detects the format and yields the same LogEntry shape
+for all of them.
+"""
+
+import io
+import json
+import re
+from collections.abc import Collection, Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import Any, BinaryIO, NamedTuple, Optional, Union
+
+from .blocks import BLOCK_MAGIC, iter_blocks
+from .config import LogLevel, TimestampFormat
+from .exceptions import LogFileError
+from .serializers import (
+    BINARY_MAGIC,
+    BINARY_RECORD,
+    BINARY_RECORD_HEADER,
+    BINARY_STRING,
+    BINARY_STRING_HEADER,
+)
+from .timestamps import TimestampProvider
+
+# Bytes read at a time from binary logs
+BINARY_READ_SIZE = 1024 * 1024
+
+# Header of a record; the message group keeps the line's newline
+_HEADER = re.compile(r"\[([^\]]*)\] \[\s*([A-Za-z]+)\s*\] \[([^\]]*)\] \[([^\]]*)\]:(.*)", re.S)
+
+
+class LogEntry(NamedTuple):
+    """A single parsed log record.
+
+    Attributes:
+        time: Timestamp as written, without brackets (e.g. ``12:34:56``)
+        level: Level name (e.g. ``INFO``)
+        filename: Name of the file that issued the log call
+        function: Function name and line number (e.g. ``main:12``)
+        message: Message text as written, including the leading space, the
+            trailing newline and any continuation lines
+    """
+
+    time: str
+    level: str
+    filename: str
+    function: str
+    message: str
+
+
+def iter_logs(lines: Iterable[str]) -> Iterator[LogEntry]:
+    """Parse log lines into entries, one record at a time.
+
+    Lines that don't start a record are appended to the message of the
+    previous record (multi-line messages). Lines before the first record are
+    skipped.
+
+    Args:
+        lines: Log lines, e.g. an open text file
+
+    Yields:
+        One LogEntry per record
+    """
+    header = None
+    continuation: list[str] = []
+
+    for line in lines:
+        match = _HEADER.match(line) if line.startswith("[") else None
+        if match is None:
+            if header is not None:
+                continuation.append(line)
+            continue
+
+        if header is not None:
+            yield _make_entry(header, continuation)
+            continuation = []
+        header = match.groups()
+
+    if header is not None:
+        yield _make_entry(header, continuation)
+
+
+def _make_entry(header: tuple[str, ...], continuation: list[str]) -> LogEntry:
+    """Build a LogEntry from header groups and continuation lines."""
+    time, level, filename, function, message = header
+    if continuation:
+        message += "".join(continuation)
+    return LogEntry(time, level, filename, function, message)
+
+
+class IncrementalParser:
+    """Parse log lines as they arrive, e.g. while following a growing file.
+
+    A record is only known to be complete once the next header line is
+    seen, so the last record is held back until ``flush()`` is called.
+    """
+
+    def __init__(self) -> None:
+        self._header: Optional[tuple[str, ...]] = None
+        self._continuation: list[str] = []
+
+    def feed(self, lines: Iterable[str]) -> list[LogEntry]:
+        """Parse complete lines.
+
+        Args:
+            lines: Newly arrived lines, each ending with a newline
+
+        Returns:
+            Records completed by these lines
+        """
+        entries = []
+        for line in lines:
+            match = _HEADER.match(line) if line.startswith("[") else None
+            if match is None:
+                if self._header is not None:
+                    self._continuation.append(line)
+                continue
+
+            if self._header is not None:
+                entries.append(_make_entry(self._header, self._continuation))
+                self._continuation = []
+            self._header = match.groups()
+        return entries
+
+    def flush(self) -> Optional[LogEntry]:
+        """Return the held back record, if any, treating it as complete."""
+        if self._header is None:
+            return None
+        entry = _make_entry(self._header, self._continuation)
+        self._header = None
+        self._continuation = []
+        return entry
+
+
+def detect_format(path: Union[str, Path]) -> str:
+    """Tell the record format of a log file from its first bytes.
+
+    Args:
+        path: Path of the log file
+
+    Returns:
+        ``"compressed"``, ``"jsonl"``, ``"msgpack"``, ``"binary"`` or
+        ``"text"`` (also for empty files)
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    with open(path, "rb") as logs:
+        head = logs.read(len(BLOCK_MAGIC))
+    if head == BLOCK_MAGIC:
+        return "compressed"
+    return _sniff(head)
+
+
+def _sniff(head: bytes) -> str:
+    """Tell the record format of uncompressed data from its first bytes."""
+    first = head[:1]
+    if first == b"{":
+        return "jsonl"
+    # Binary data starts with the magic, or a definition in later blocks
+    if head.startswith(BINARY_MAGIC) or first and first[0] in (BINARY_STRING, BINARY_RECORD):
+        return "binary"
+    # msgpack fixmap, map16 or map32
+    if first and (0x80 <= first[0] <= 0x8F or first[0] in (0xDE, 0xDF)):
+        return "msgpack"
+    return "text"
+
+
+def _structured_entry(fields: Mapping[str, Any]) -> LogEntry:
+    """Build a LogEntry from the fields of a structured record.
+
+    The function and message are shaped like the text parser's, so both
+    kinds of entries can be printed and filtered the same way.
+    """
+    return LogEntry(
+        str(fields.get("time", "")),
+        str(fields.get("level", "")),
+        str(fields.get("filename", "")),
+        f"{fields.get('function', '')}:{fields.get('line', 0)}",
+        f" {fields.get('message', '')}\n",
+    )
+
+
+def iter_json_lines(lines: Iterable[Union[str, bytes]]) -> Iterator[LogEntry]:
+    """Parse JSON Lines records into entries.
+
+    Lines that aren't JSON objects, such as a record still being written,
+    are skipped.
+
+    Args:
+        lines: JSON Lines text, one record per line
+
+    Yields:
+        One LogEntry per record
+    """
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            fields = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(fields, dict):
+            yield _structured_entry(fields)
+
+
+def iter_msgpack(stream: BinaryIO) -> Iterator[LogEntry]:
+    """Parse a stream of msgpack records into entries.
+
+    Args:
+        stream: Binary stream of msgpack maps
+
+    Yields:
+        One LogEntry per record
+
+    Raises:
+        LogFileError: If msgpack is not installed
+    """
+    try:
+        import msgpack
+    except ImportError as e:
+        raise LogFileError(
+            "Reading msgpack logs needs the msgpack package (pip install Logges[msgpack])"
+        ) from e
+    for fields in msgpack.Unpacker(stream, raw=False):
+        if isinstance(fields, dict):
+            yield _structured_entry(fields)
+
+
+def iter_binary(stream: BinaryIO) -> Iterator[LogEntry]:
+    """Decode a binary log into entries.
+
+    The stream is read in blocks of ``BINARY_READ_SIZE``; a record cut off
+    at the end of the stream, such as one still being written, is skipped.
+
+    Args:
+        stream: Binary stream positioned at the start of the file
+
+    Yields:
+        One LogEntry per record, with an ISO time
+
+    Raises:
+        LogFileError: If the stream is not a binary log or is corrupt
+    """
+    if stream.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+        raise LogFileError("Not a Logges binary log")
+
+    strings: dict[int, str] = {}
+    clock = TimestampProvider(TimestampFormat.ISO)
+    level_names = {level.value: level.name for level in LogLevel}
+    string_size = BINARY_STRING_HEADER.size
+    record_size = BINARY_RECORD_HEADER.size
+    offset = len(BINARY_MAGIC)
+    buffer = b""
+    while True:
+        chunk = stream.read(BINARY_READ_SIZE)
+        if not chunk:
+            return
+        buffer += chunk
+        position = 0
+        end = len(buffer)
+        while position < end:
+            tag = buffer[position]
+            if tag == BINARY_STRING:
+                if position + string_size > end:
+                    break
+                _, string_id, length = BINARY_STRING_HEADER.unpack_from(buffer, position)
+                stop = position + string_size + length
+                if stop > end:
+                    break
+                text = buffer[position + string_size : stop]
+                strings[string_id] = text.decode("utf-8", "replace")
+            elif tag == BINARY_RECORD:
+                if position + record_size > end:
+                    break
+                _, created, level, filename_id, function_id, line, message_length, extra_length = (
+                    BINARY_RECORD_HEADER.unpack_from(buffer, position)
+                )
+                start = position + record_size
+                stop = start + message_length + extra_length
+                if stop > end:
+                    break
+                yield LogEntry(
+                    clock.now(created),
+                    level_names.get(level, str(level)),
+                    strings.get(filename_id, "?"),
+                    f"{strings.get(function_id, '?')}:{line}",
+                    f" {buffer[start : start + message_length].decode('utf-8', 'replace')}\n",
+                )
+            else:
+                raise LogFileError(f"Corrupt binary log: unknown entry at byte {offset + position}")
+            position = stop
+        offset += position
+        buffer = buffer[position:]
+
+
+def _iter_block(payload: bytes) -> Iterator[LogEntry]:
+    """Parse the records of one decompressed block."""
+    block_format = _sniff(payload[: len(BINARY_MAGIC)])
+    if block_format == "jsonl":
+        yield from iter_json_lines(payload.splitlines())
+    elif block_format == "msgpack":
+        yield from iter_msgpack(io.BytesIO(payload))
+    elif block_format == "binary":
+        if not payload.startswith(BINARY_MAGIC):
+            payload = BINARY_MAGIC + payload
+        yield from iter_binary(io.BytesIO(payload))
+    else:
+        yield from iter_logs(payload.decode("utf-8", "replace").splitlines(keepends=True))
+
+
+def iter_compressed(
+    path: Union[str, Path],
+    levels: Optional[Collection[str]] = None,
+    since: Optional[str] = None,
+    last_records: Optional[int] = None,
+) -> Iterator[LogEntry]:
+    """Parse a block-compressed log, decompressing only blocks that can match.
+
+    Args:
+        path: Path of the compressed log
+        levels: Level names to keep, or None for all
+        since: Skip records with an earlier time of day (``"HH:MM[:SS]"``,
+            compared as text), or None
+        last_records: Only read the last blocks, holding at least this many
+            records
+
+    Yields:
+        One LogEntry per record passing the filters
+
+    Raises:
+        LogFileError: If the file is not a compressed log or is corrupt
+    """
+    with open(path, "rb") as stream:
+        for _, payload in iter_blocks(stream, levels, since, last_records):
+            for entry in _iter_block(payload):
+                if levels is not None and entry.level not in levels:
+                    continue
+                if since and entry.time.split("T")[-1] < since:
+                    continue
+                yield entry
+
+
+def iter_log_file(path: Union[str, Path]) -> Iterator[LogEntry]:
+    """Open a log file and parse it one record at a time.
+
+    Text, JSON Lines, msgpack, binary and compressed files are told apart by
+    ``detect_format``.
+
+    Args:
+        path: Path of the log file
+
+    Yields:
+        One LogEntry per record
+    """
+    file_format = detect_format(path)
+    if file_format == "compressed":
+        yield from iter_compressed(path)
+    elif file_format == "jsonl":
+        with open(path, "r", encoding="utf-8") as logs:
+            yield from iter_json_lines(logs)
+    elif file_format == "msgpack":
+        with open(path, "rb") as logs:
+            yield from iter_msgpack(logs)
+    elif file_format == "binary":
+        with open(path, "rb") as logs:
+            yield from iter_binary(logs)
+    else:
+        with open(path, "r") as logs:
+            yield from iter_logs(logs)
@@ -0,0 +1,278 @@
+"""Memory-mapped reader for Logges log files.
+
+The streaming parser decodes every line of a file. For ``show`` and
+``search`` on large files this module maps the file into memory instead,
+finds record boundaries (``\\n[`` followed by a valid header) directly in the
+bytes, and only decodes the records a caller actually asks for. Field access
+on undecoded records goes through zero-copy ``memoryview`` slices.
+"""
+
+import mmap
+import re
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from types import TracebackType
+from typing import Optional, Union
+
+from .parser import LogEntry
+
+# Byte-level twin of parser._HEADER; groups are time, level, file, function
+_HEADER_SOURCE = rb"\[([^\]\n]*)\] \[\s*([A-Za-z]+)\s*\] \[([^\]\n]*)\] \[([^\]\n]*)\]:"
+_HEADER = re.compile(_HEADER_SOURCE)
+# Same header, anchored at line starts, for scanning whole mappings
+_LINE_HEADER = re.compile(rb"^" + _HEADER_SOURCE, re.M)
+
+
+class MappedRecord:
+    """One undecoded record inside a mapped log file.
+
+    Field properties return ``memoryview`` slices of the mapping, so nothing
+    is copied or decoded until ``decode()`` is called. Release the views (or
+    drop the record) before closing the reader.
+
+    Attributes:
+        start: Byte offset of the record's opening ``[``
+        end: Byte offset just past the record (start of the next one)
+    """
+
+    __slots__ = ("_view", "_match", "start", "end")
+
+    def __init__(self, view: memoryview, match: "re.Match[bytes]", end: int) -> None:
+        """Wrap a header match.
+
+        Args:
+            view: memoryview over the whole mapping
+            match: Header match at the record's start
+            end: Byte offset just past the record
+        """
+        self._view = view
+        self._match = match
+        self.start = match.start()
+        self.end = end
+
+    def _group(self, index: int) -> memoryview:
+        start, end = self._match.span(index)
+        return self._view[start:end]
+
+    @property
+    def raw(self) -> memoryview:
+        """The whole record, header and message."""
+        return self._view[self.start : self.end]
+
+    @property
+    def time(self) -> memoryview:
+        """Timestamp bytes, without brackets."""
+        return self._group(1)
+
+    @property
+    def level(self) -> memoryview:
+        """Level name bytes."""
+        return self._group(2)
+
+    @property
+    def filename(self) -> memoryview:
+        """File name bytes."""
+        return self._group(3)
+
+    @property
+    def function(self) -> memoryview:
+        """``function:line`` bytes."""
+        return self._group(4)
+
+    @property
+    def message(self) -> memoryview:
+        """Message bytes, including continuation lines and the final newline."""
+        return self._view[self._match.end() : self.end]
+
+    def decode(self) -> LogEntry:
+        """Decode the record into a LogEntry.
+
+        Returns:
+            The decoded record, shaped like the streaming parser's entries
+        """
+        time, level, filename, function = (
+            group.decode("utf-8", "replace") for group in self._match.groups()
+        )
+        message = bytes(self.message).decode("utf-8", "replace")
+        return LogEntry(time, level, filename, function, message)
+
+
+class MappedLogReader:
+    """Read a log file through ``mmap`` without decoding it as a whole.
+
+    Works for files larger than the available memory, since the operating
+    system pages the mapping in and out as it is scanned.
+
+    Example:
+        >>> with MappedLogReader("2026-01-30_app.log") as reader:
+        ...     for entry in reader.search([b"timeout"]):
+        ...         print(entry.message)
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Map a log file into memory.
+
+        Args:
+            path: Path of the log file
+
+        Raises:
+            OSError: If the file cannot be opened
+        """
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        size = self.path.stat().st_size
+        # Empty files cannot be mapped; use an empty buffer instead
+        self._map: Optional[mmap.mmap] = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        )
+        self._data: Union[mmap.mmap, bytes] = self._map if self._map is not None else b""
+        self._view = memoryview(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _header_at(self, position: int) -> Optional["re.Match[bytes]"]:
+        """Return the header match if a record starts at ``position``."""
+        return _HEADER.match(self._data, position)
+
+    def _next_record(self, position: int) -> int:
+        """Offset of the first record starting after ``position`` (or EOF)."""
+        match = _LINE_HEADER.search(self._data, position + 1)
+        return match.start() if match is not None else len(self._data)
+
+    def _record_start(self, position: int) -> Optional[int]:
+        """Offset of the record that contains byte ``position``, if any."""
+        data = self._data
+        line_start = data.rfind(b"\n", 0, position) + 1
+        while not self._header_at(line_start):
+            if line_start == 0:
+                return None
+            line_start = data.rfind(b"\n", 0, line_start - 1) + 1
+        return line_start
+
+    def tail_offset(self, count: int) -> int:
+        """Find where the last ``count`` records start, scanning backwards.
+
+        Only the end of the mapping is touched, however large the file.
+
+        Args:
+            count: Number of records wanted
+
+        Returns:
+            Byte offset of the first of those records (the first record's
+            offset, or EOF for ``count`` 0, if the file has fewer)
+        """
+        position = len(self._data)
+        for _ in range(count):
+            start = self._record_start(position - 1) if position > 0 else None
+            if start is None:
+                break
+            position = start
+        return position
+
+    def record_at(self, start: int, end: int) -> Optional[MappedRecord]:
+        """Return the record spanning ``start`` to ``end``, if one starts there.
+
+        Args:
+            start: Byte offset of the record's opening ``[``
+            end: Byte offset just past the record
+
+        Returns:
+            The record, or None if no header starts at ``start``
+        """
+        match = self._header_at(start)
+        if match is None:
+            return None
+        return MappedRecord(self._view, match, min(end, len(self._data)))
+
+    def records(
+        self, levels: Optional[Iterable[str]] = None, start: int = 0
+    ) -> Iterator[MappedRecord]:
+        """Iterate over all records without decoding them.
+
+        Args:
+            levels: Only yield records with one of these level names
+            start: Byte offset to start scanning at; should be a line start
+
+        Yields:
+            One MappedRecord per record, in file order
+        """
+        wanted = {level.encode() for level in levels} if levels is not None else None
+        previous = None
+        for match in _LINE_HEADER.finditer(self._data, start):
+            if previous is not None and (wanted is None or previous.group(2) in wanted):
+                yield MappedRecord(self._view, previous, match.start())
+            previous = match
+        if previous is not None and (wanted is None or previous.group(2) in wanted):
+            yield MappedRecord(self._view, previous, len(self._data))
+
+    def entries(self, levels: Optional[Iterable[str]] = None) -> Iterator[LogEntry]:
+        """Iterate over all records, decoded.
+
+        Args:
+            levels: Only yield records with one of these level names
+
+        Yields:
+            One LogEntry per record, in file order
+        """
+        for record in self.records(levels):
+            yield record.decode()
+
+    def search(self, needles: Iterable[bytes]) -> Iterator[LogEntry]:
+        """Decode only the records whose bytes contain any of ``needles``.
+
+        The mapping is scanned with one compiled pattern; after a hit the scan
+        resumes at the end of the matching record, so every record is yielded
+        at most once. Callers should still check where the needle matched, as
+        a hit may lie in the header or span two records.
+
+        Args:
+            needles: Byte strings to look for
+
+        Yields:
+            Decoded candidate records, in file order
+        """
+        needles = list(needles)
+        if not needles:
+            return
+        if not all(needles):
+            # An empty needle matches every record
+            yield from self.entries()
+            return
+        pattern = re.compile(b"|".join(re.escape(needle) for needle in needles))
+
+        position = 0
+        while True:
+            hit = pattern.search(self._data, position)
+            if hit is None:
+                return
+            start = self._record_start(hit.start())
+            if start is None:
+                # Text before the first record is not part of any record
+                position = self._next_record(hit.start())
+                continue
+            match = self._header_at(start)
+            assert match is not None
+            end = self._next_record(match.end())
+            yield MappedRecord(self._view, match, end).decode()
+            position = end
+
+    def close(self) -> None:
+        """Release the mapping and the file."""
+        self._view.release()
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "MappedLogReader":
+        """Support context manager protocol."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Ensure the mapping is released."""
+        self.close()
@@ -0,0 +1,299 @@
+"""Record serializers for file handlers.
+
+A file handler writes each record through a serializer. The default text
+serializer writes the formatted ``[time] [ LEVEL ] ...`` line. The JSON
+Lines serializer writes one JSON object per line, and the optional msgpack
+serializer writes a stream of msgpack maps. Both keep every field separate,
+including ``extra``, so consumers don't have to parse the text format.
+
+Structured records carry the full local date and time with milliseconds
+and UTC offset (``2026-01-30T12:34:56.789+03:00``), whatever
+``LogConfig.timestamp_format`` is.
+
+The binary serializer is the most compact. Filenames and function names
+are written once per file, in a string table, and records refer to them by
+id. Each record has a fixed-width header followed by its message:
+
+=========  ======  ==============================================
+Entry      Tag     Layout (little-endian)
+=========  ======  ==============================================
+file       -       ``BINARY_MAGIC``, once at the start of the file
+string     ``1``   id ``uint32``, length ``uint16``, UTF-8 bytes
+record     ``2``   epoch time ``float64``, level ``uint8``, filename
+                   id ``uint32``, function id ``uint32``, line
+                   ``uint32``, message length ``uint32``, extra
+                   length ``uint32``; then the UTF-8 message and the
+                   extra fields as JSON
+=========  ======  ==============================================
+
+A later definition of an id replaces the earlier one, so a process that
+appends to an existing file can start numbering from zero again. In
+multiprocess mode handlers reset the table before every write, so each
+write defines the strings it uses and writes of several processes can
+follow each other in any order.
+
+Files keep their ``.log`` names in every format; readers tell the formats
+apart by their first byte (see ``parser.detect_format``).
+"""
+
+import json
+import struct
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any, Optional
+
+from .config import FILE_FORMATS, LogRecord, TimestampFormat
+from .exceptions import HandlerError
+from .timestamps import TimestampProvider
+
+# Binary format: file signature, entry tags and fixed-width headers
+BINARY_MAGIC = b"LGB\x01"
+BINARY_STRING = 1
+BINARY_RECORD = 2
+BINARY_STRING_HEADER = struct.Struct("<BIH")
+BINARY_RECORD_HEADER = struct.Struct("<BdBIIIII")
+_MAX_STRING_BYTES = 0xFFFF
+
+
+class RecordSerializer(ABC):
+    """Turn log records into the bytes a file handler writes.
+
+    Attributes:
+        stateful: Whether records refer to earlier output in the same file.
+            Handlers then encode records under their lock, in write order,
+            and write ``preamble`` whenever they start on a file.
+        file_format: What ``parser.detect_format`` reports for a file of
+            these records, or None if unknown. Handlers don't append to a
+            file of another format.
+    """
+
+    stateful = False
+    file_format: Optional[str] = None
+
+    @abstractmethod
+    def serialize(self, record: LogRecord, formatted_message: str) -> bytes:
+        """Encode one record.
+
+        Args:
+            record: The log record
+            formatted_message: The record rendered with the logger's format
+
+        Returns:
+            Encoded record, self-delimiting
+        """
+
+    def serialize_batch(
+        self, records: Sequence[LogRecord], formatted_messages: Sequence[str]
+    ) -> bytes:
+        """Encode several records at once.
+
+        Args:
+            records: The log records
+            formatted_messages: Rendered records, one per record
+
+        Returns:
+            Encoded records, concatenated
+        """
+        return b"".join(map(self.serialize, records, formatted_messages))
+
+    def preamble(self, empty: bool) -> bytes:
+        """Return what a handler writes before its first records in a file.
+
+        Only called for stateful serializers.
+
+        Args:
+            empty: Whether the file is empty, i.e. new
+
+        Returns:
+            Bytes to write first, possibly none
+        """
+        return b""
+
+    def reset(self) -> None:
+        """Forget earlier output, so the next records don't refer to it.
+
+        Only called for stateful serializers, by handlers whose writes must
+        each be readable on their own (see ``FileHandler`` multiprocess mode).
+        """
+
+
+class TextSerializer(RecordSerializer):
+    """Write the formatted message, one line per record."""
+
+    file_format = "text"
+
+    def serialize(self, record: LogRecord, formatted_message: str) -> bytes:
+        return (formatted_message + "\n").encode("utf-8")
+
+    def serialize_batch(
+        self, records: Sequence[LogRecord], formatted_messages: Sequence[str]
+    ) -> bytes:
+        return ("\n".join(formatted_messages) + "\n").encode("utf-8")
+
+
+class _StructuredSerializer(RecordSerializer):
+    """Shared field mapping of the structured formats."""
+
+    def __init__(self) -> None:
+        self._clock = TimestampProvider(TimestampFormat.ISO)
+
+    def to_dict(self, record: LogRecord) -> dict[str, Any]:
+        """Return the fields of a record.
+
+        Args:
+            record: The log record
+
+        Returns:
+            ``time``, ``level``, ``filename``, ``function``, ``line``,
+            ``message`` and, if the record has any, ``extra``
+        """
+        fields: dict[str, Any] = {
+            "time": self._clock.now(record.created) if record.created else record.timestamp,
+            "level": record.level.name,
+            "filename": record.filename,
+            "function": record.function,
+            "line": record.line_number,
+            "message": record.message,
+        }
+        if record.extra:
+            fields["extra"] = record.extra
+        return fields
+
+
+class JsonLinesSerializer(_StructuredSerializer):
+    """Write one JSON object per line (JSON Lines)."""
+
+    file_format = "jsonl"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=str)
+
+    def serialize(self, record: LogRecord, formatted_message: str) -> bytes:
+        return (self._encoder.encode(self.to_dict(record)) + "\n").encode("utf-8")
+
+
+class MsgpackSerializer(_StructuredSerializer):
+    """Write one msgpack map per record. Needs the ``msgpack`` package."""
+
+    file_format = "msgpack"
+
+    def __init__(self) -> None:
+        """Create the serializer.
+
+        Raises:
+            HandlerError: If msgpack is not installed
+        """
+        super().__init__()
+        try:
+            import msgpack
+        except ImportError as e:
+            raise HandlerError(
+                "The msgpack format needs the msgpack package (pip install Logges[msgpack])"
+            ) from e
+        # packb rather than a shared Packer, which isn't thread-safe
+        self._packb = msgpack.packb
+
+    def serialize(self, record: LogRecord, formatted_message: str) -> bytes:
+        return self._packb(self.to_dict(record), default=str)
+
+
+class BinarySerializer(RecordSerializer):
+    """Write records in the compact binary format, interning strings.
+
+    The string table lives as long as the serializer. Its ``preamble``
+    repeats every definition, so records encoded before a file switch are
+    still readable in the new file. Records must be written in the order
+    they were encoded.
+    """
+
+    stateful = True
+    file_format = "binary"
+
+    def __init__(self) -> None:
+        self._ids: dict[str, int] = {}
+        self._definitions: list[bytes] = []
+
+    def _intern(self, text: str, out: list[bytes]) -> int:
+        """Return the id of ``text``, appending its definition to ``out`` if new."""
+        string_id = self._ids.get(text)
+        if string_id is None:
+            string_id = self._ids[text] = len(self._ids)
+            encoded = text.encode("utf-8")
+            if len(encoded) > _MAX_STRING_BYTES:
+                # Cut at a character boundary, so the string still decodes
+                encoded = encoded[:_MAX_STRING_BYTES].decode("utf-8", "ignore").encode("utf-8")
+            definition = BINARY_STRING_HEADER.pack(BINARY_STRING, string_id, len(encoded)) + encoded
+            self._definitions.append(definition)
+            out.append(definition)
+        return string_id
+
+    def serialize(self, record: LogRecord, formatted_message: str) -> bytes:
+        out: list[bytes] = []
+        self._encode(record, out)
+        return b"".join(out)
+
+    def serialize_batch(
+        self, records: Sequence[LogRecord], formatted_messages: Sequence[str]
+    ) -> bytes:
+        out: list[bytes] = []
+        for record in records:
+            self._encode(record, out)
+        return b"".join(out)
+
+    def _encode(self, record: LogRecord, out: list[bytes]) -> None:
+        """Append the record, preceded by any new string definitions, to ``out``."""
+        filename_id = self._intern(record.filename, out)
+        function_id = self._intern(record.function, out)
+        message = record.message.encode("utf-8")
+        extra = b""
+        if record.extra:
+            extra = json.dumps(record.extra, ensure_ascii=False, default=str).encode("utf-8")
+        out.append(
+            BINARY_RECORD_HEADER.pack(
+                BINARY_RECORD,
+                record.created or time.time(),
+                record.level.value,
+                filename_id,
+                function_id,
+                record.line_number,
+                len(message),
+                len(extra),
+            )
+        )
+        out.append(message)
+        if extra:
+            out.append(extra)
+
+    def preamble(self, empty: bool) -> bytes:
+        return (BINARY_MAGIC if empty else b"") + b"".join(self._definitions)
+
+    def reset(self) -> None:
+        self._ids.clear()
+        self._definitions.clear()
+
+
+def get_serializer(file_format: str) -> RecordSerializer:
+    """Create the serializer for a file format name.
+
+    Args:
+        file_format: One of ``FILE_FORMATS``
+
+    Returns:
+        A new serializer
+
+    Raises:
+        HandlerError: If the format is unknown or its dependency is missing
+    """
+    if file_format == "text":
+        return TextSerializer()
+    if file_format == "jsonl":
+        return JsonLinesSerializer()
+    if file_format == "msgpack":
+        return MsgpackSerializer()
+    if file_format == "binary":
+        return BinarySerializer()
+    raise HandlerError(
+        f"Unknown file format {file_format!r}, expected one of {', '.join(FILE_FORMATS)}"
+    )
@@ -0,0 +1,242 @@
+"""Follow a growing log file, like ``tail -f``.
+
+The last records are located by scanning backwards from the end of the
+file, then only newly appended bytes are read and parsed. Changes are
+waited for with inotify on Linux (through ``ctypes``, no extra dependency)
+and by polling elsewhere. When the file is rotated, either replaced in
+place or by the next day's dated file, following moves on to the new file.
+
+JSON Lines files are followed line by line in the same way; msgpack,
+binary and compressed files can only have their last records read.
+"""
+
+import ctypes
+import ctypes.util
+import datetime
+import mmap
+import os
+import select
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+
+from .catalog import parse_log_name
+from .exceptions import LogFileError
+from .parser import (
+    IncrementalParser,
+    LogEntry,
+    detect_format,
+    iter_compressed,
+    iter_json_lines,
+    iter_log_file,
+)
+from .reader import MappedLogReader
+
+# inotify(7) event masks
+_IN_MODIFY = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+
+
+class _Watcher:
+    """Wait for changes in a directory with inotify, or by sleeping."""
+
+    def __init__(self, directory: Path) -> None:
+        self._fd = -1
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                return
+            mask = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+            if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+                os.close(fd)
+                return
+            self._fd = fd
+        except (OSError, AttributeError, TypeError):
+            # No libc or no inotify (not Linux): fall back to polling
+            pass
+
+    @property
+    def uses_inotify(self) -> bool:
+        """Whether changes are reported by inotify rather than polled."""
+        return self._fd >= 0
+
+    def wait(self, timeout: float) -> None:
+        """Return after a change in the directory or after ``timeout`` seconds."""
+        if self._fd < 0:
+            time.sleep(timeout)
+            return
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if ready:
+            try:
+                os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                pass
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def last_records(path: Union[str, Path], count: int) -> list[LogEntry]:
+    """Return the last ``count`` records of a log file.
+
+    Args:
+        path: Path of the log file
+        count: Number of records
+
+    Returns:
+        Up to ``count`` records, oldest first
+    """
+    file_format = detect_format(path)
+    if file_format == "compressed":
+        # The block index tells which blocks hold the last records
+        return list(deque(iter_compressed(path, last_records=count), maxlen=count))
+    if file_format != "text":
+        # Structured records can't be found scanning backwards; keep the last ones
+        return list(deque(iter_log_file(path), maxlen=count))
+    with MappedLogReader(path) as reader:
+        start = reader.tail_offset(count)
+        return [record.decode() for record in reader.records(start=start)]
+
+
+def _line_tail_offset(path: Path, count: int) -> int:
+    """Return the offset of the last ``count`` lines of a JSON Lines file."""
+    with open(path, "rb") as stream:
+        size = os.fstat(stream.fileno()).st_size
+        if size == 0 or count <= 0:
+            return size
+        with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            end = size - 1 if data[size - 1] == 0x0A else size
+            for _ in range(count):
+                end = data.rfind(b"\n", 0, end)
+                if end < 0:
+                    return 0
+            return end + 1
+
+
+def _next_dated_file(path: Path) -> Optional[Path]:
+    """Return today's file of the same logger if ``path`` is an older dated file."""
+    parsed = parse_log_name(path.name)
+    if parsed is None or parsed[0] is None:
+        return None
+    date, logger = parsed
+    today = datetime.date.today().isoformat()
+    if today <= date:
+        return None
+    candidate = path.with_name(f"{today}_{logger}.log")
+    return candidate if candidate.exists() else None
+
+
+def _rotated(path: Path, stream: BinaryIO) -> Optional[Path]:
+    """Return the file to continue with if ``stream`` was rotated away.
+
+    Args:
+        path: Path being followed
+        stream: Open stream on it, read up to EOF
+
+    Returns:
+        ``path`` again if it was replaced or truncated, the next dated file
+        after midnight, or None to keep following ``stream``
+    """
+    try:
+        current = os.stat(path)
+    except FileNotFoundError:
+        current = None
+
+    if current is not None:
+        replaced = current.st_ino != os.fstat(stream.fileno()).st_ino
+        truncated = current.st_size < stream.tell()
+        if replaced or truncated:
+            return path
+    return _next_dated_file(path)
+
+
+def follow(
+    path: Union[str, Path],
+    count: int = 10,
+    poll_interval: float = 0.5,
+    stop: Optional[threading.Event] = None,
+) -> Iterator[LogEntry]:
+    """Yield the last records of a log file, then every record appended to it.
+
+    A record is yielded once the next record starts, or once the file has
+    stayed unchanged for a wait of ``poll_interval``, so multi-line messages
+    are not split. Incomplete lines are kept until their newline arrives.
+
+    Args:
+        path: Path of the log file
+        count: Number of existing records to yield first
+        poll_interval: Longest wait for changes before checking again
+        stop: Event that ends the generator when set; runs until closed or
+            interrupted otherwise
+
+    Yields:
+        Records, oldest first
+
+    Raises:
+        OSError: If the log file cannot be opened
+        LogFileError: If the log file is in the msgpack, binary or compressed
+            format
+    """
+    path = Path(path)
+    file_format = detect_format(path)
+    if file_format in ("msgpack", "binary", "compressed"):
+        raise LogFileError(f"Cannot follow {path.name}: {file_format} logs can't be followed")
+    if file_format == "jsonl":
+        position = _line_tail_offset(path, count)
+    else:
+        with MappedLogReader(path) as reader:
+            position = reader.tail_offset(count)
+
+    watcher = _Watcher(path.parent)
+    stream: BinaryIO = open(path, "rb")
+    stream.seek(position)
+    parser = IncrementalParser()
+    partial = b""
+    idle = False
+    try:
+        while stop is None or not stop.is_set():
+            data = stream.read()
+            if data:
+                idle = False
+                partial += data
+                cut = partial.rfind(b"\n") + 1
+                if cut:
+                    text = partial[: cut - 1].decode("utf-8", "replace")
+                    partial = partial[cut:]
+                    if file_format == "jsonl":
+                        yield from iter_json_lines(text.split("\n"))
+                    else:
+                        yield from parser.feed(line + "\n" for line in text.split("\n"))
+                continue
+
+            if idle:
+                # Nothing arrived during a whole wait: the last record is complete
+                entry = parser.flush()
+                if entry is not None:
+                    yield entry
+
+            next_path = _rotated(path, stream)
+            if next_path is not None:
+                # Finish the old file before moving on
+                entry = parser.flush()
+                if entry is not None:
+                    yield entry
+                stream.close()
+                path = next_path
+                stream = open(path, "rb")
+                partial = b""
+                continue
+
+            watcher.wait(poll_interval)
+            idle = True
+    finally:
+        stream.close()
+        watcher.close()
@@ -0,0 +1,134 @@
+"""Cached timestamp rendering for the Logges library.
+
+Formatting the current time with ``strftime`` for every record is a
+measurable share of the logging cost. The provider in this module renders a
+second (and a day) only once and reuses the string until the clock ticks over.
+"""
+
+import datetime
+import time
+from typing import Optional
+
+from .config import TimestampFormat
+
+
+class TimestampProvider:
+    """Render record timestamps and the current date, cached per second/day.
+
+    The formatted second is only re-rendered when the second changes; formats
+    with milliseconds append them to the cached prefix. The provider also
+    tracks the next local midnight, which daily rotation uses to detect a
+    day change with a single comparison.
+
+    Attributes:
+        timestamp_format: Format used by ``now()``
+    """
+
+    def __init__(self, timestamp_format: TimestampFormat = TimestampFormat.TIME) -> None:
+        """Initialize the provider.
+
+        Args:
+            timestamp_format: Format used by ``now()``
+        """
+        self.timestamp_format = timestamp_format
+        # (second, prefix, suffix) of the last rendered second
+        self._second: tuple[int, str, str] = (-1, "", "")
+        # (day start, next midnight, "YYYY-MM-DD") of the current day
+        self._day: tuple[float, float, str] = self._roll_day(time.time())
+
+    @property
+    def next_midnight(self) -> float:
+        """Unix time of the next local midnight."""
+        return self._day[1]
+
+    def now(self, current: Optional[float] = None) -> str:
+        """Return the formatted timestamp for the current time.
+
+        Args:
+            current: Unix time to format instead of the current time
+
+        Returns:
+            Formatted timestamp
+        """
+        if current is None:
+            current = time.time()
+        if self.timestamp_format is TimestampFormat.EPOCH:
+            return f"{current:.3f}"
+
+        second = int(current)
+        cached = self._second
+        if cached[0] != second:
+            cached = self._render_second(second)
+
+        if self.timestamp_format is TimestampFormat.TIME:
+            return cached[1]
+        millis = int((current - second) * 1000)
+        return f"{cached[1]}.{millis:03d}{cached[2]}"
+
+    def _render_second(self, second: int) -> tuple[int, str, str]:
+        """Render and cache the prefix/suffix strings for one second.
+
+        Args:
+            second: Unix time in whole seconds
+
+        Returns:
+            Tuple of (second, prefix, suffix)
+        """
+        moment = datetime.datetime.fromtimestamp(second).astimezone()
+        if self.timestamp_format is TimestampFormat.ISO:
+            iso = moment.isoformat(timespec="seconds")
+            # Split "YYYY-MM-DDTHH:MM:SS+HH:MM" so milliseconds go before the offset
+            cached = (second, iso[:19], iso[19:])
+        else:
+            cached = (second, moment.strftime("%H:%M:%S"), "")
+        self._second = cached
+        return cached
+
+    def date(self, current: Optional[float] = None) -> str:
+        """Return the current local date as ``YYYY-MM-DD``.
+
+        Args:
+            current: Unix time to use instead of the current time
+
+        Returns:
+            Date string, rendered once per day
+        """
+        if current is None:
+            current = time.time()
+        day = self._day
+        if not day[0] <= current < day[1]:
+            day = self._day = self._roll_day(current)
+        return day[2]
+
+    def day_changed(self, current: Optional[float] = None) -> bool:
+        """Check whether the local date changed since the last ``date()`` call.
+
+        Args:
+            current: Unix time to use instead of the current time
+
+        Returns:
+            True if ``current`` is outside the day ``date()`` last returned
+        """
+        if current is None:
+            current = time.time()
+        day = self._day
+        return not day[0] <= current < day[1]
+
+    @staticmethod
+    def _roll_day(current: float) -> tuple[float, float, str]:
+        """Compute the day boundaries and date string for ``current``.
+
+        Args:
+            current: Unix time inside the day
+
+        Returns:
+            Tuple of (day start, next midnight, "YYYY-MM-DD")
+        """
+        day = datetime.datetime.fromtimestamp(current).date()
+        start = datetime.datetime.combine(day, datetime.time())
+        next_midnight = start + datetime.timedelta(days=1)
+        return (start.timestamp(), next_midnight.timestamp(), day.strftime("%Y-%m-%d"))
+
+
+# Shared provider for the module-level helpers in utils
+default_provider = TimestampProvider()
@@ -8,28 +8,83 @@
 import datetime
 import os
 import platform
+import random
 import sys
+from functools import lru_cache
+from itertools import islice
 from io import TextIOWrapper
+from typing import TYPE_CHECKING
 from typing import Dict
+from typing import Iterator
 from typing import List
+from typing import Optional
 from typing import Tuple
-
-import matplotlib.pyplot as plt
-from reportlab.lib.colors import Color
-from reportlab.lib.enums import TA_CENTER
-from reportlab.lib.enums import TA_LEFT
-from reportlab.lib.pagesizes import inch
-from reportlab.lib.pagesizes import LETTER
-from reportlab.lib.styles import ParagraphStyle
-from reportlab.platypus import Image
-from reportlab.platypus import PageBreak
-from reportlab.platypus import Paragraph
-from reportlab.platypus import SimpleDocTemplate
-from reportlab.platypus import Spacer
-from reportlab.platypus import Table as reportlabTable
-from reportlab.platypus import TableStyle
-from rich.console import Console
-from rich.table import Table
+from typing import Union
+from xml.sax.saxutils import escape
+
+from .charts import CHART_KINDS
+from .charts import bar_chart_drawing
+from .charts import bar_chart_svg
+from .charts import write_pie_chart
+from .config import LogLevel
+from .exceptions import ExportError
+from .parser import LogEntry
+from .parser import detect_format
+from .parser import iter_compressed
+from .parser import iter_log_file
+from .parser import iter_logs
+from .reader import MappedLogReader
+from .timestamps import default_provider
+
+# matplotlib, reportlab and rich are imported by the functions using them, so
+# that importing Logges for logging alone doesn't load them.
+if TYPE_CHECKING:
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.platypus import Paragraph
+    from reportlab.platypus import Table as reportlabTable
+    from rich.table import Table
+
+# Chart image written next to an export, per chart kind ("none" has no chart)
+CHART_FILES = {"pie": "pie_chart.png", "bars": "level_chart.svg"}
+
+# Rows per rich table in the console view; each is printed once it is read
+CONSOLE_CHUNK_ROWS = 200
+# Rows joined per write and buffer size of the Markdown export
+MARKDOWN_BATCH_ROWS = 1000
+MARKDOWN_BUFFER_SIZE = 1024 * 1024
+# Records joined per write by the text conversion
+TEXT_BATCH_ROWS = 1000
+
+# PDF export table: rows per chunk (about a LETTER page) and cell layout
+PDF_CHUNK_ROWS = 40
+PDF_COLUMNS = ["TIME", "STATUS", "FILE", "FUNCTION", "MESSAGE"]
+PDF_COLUMN_WIDTHS = [70, 70, 100, 100, 200]
+PDF_FONT = "Helvetica-Bold"
+PDF_FONT_SIZE = 8
+PDF_CELL_PADDING = 6
+PDF_LEVEL_COLORS = {
+    "DEBUG": "gray",
+    "INFO": "blue",
+    "WARNING": "orange",
+    "ERROR": "red",
+    "CRITICAL": "darkred",
+}
+# Table style commands; reportlab parses the color strings
+PDF_TABLE_STYLE = [
+    ("FONT", (0, 0), (-1, -1), PDF_FONT, PDF_FONT_SIZE),
+    ("FONT", (1, 1), (1, -1), "Helvetica", PDF_FONT_SIZE),
+    ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ("LINEABOVE", (0, 0), (-1, -1), 1, "#334c66"),
+    ("BACKGROUND", (0, 0), (-1, 0), "#66bfbf"),
+]
+PDF_SUMMARY_STYLE = [
+    ("FONT", (0, 0), (-1, -1), "Helvetica", 10),
+    ("FONT", (0, 0), (-1, 1), PDF_FONT, 10),
+    ("SPAN", (0, 0), (-1, 0)),
+    ("LINEABOVE", (0, 1), (-1, -1), 1, "#334c66"),
+    ("BACKGROUND", (0, 1), (-1, 1), "#66bfbf"),
+]
 
 
 def get_current_platform_name() -> str:
@@ -61,35 +116,17 @@ def get_saving_path(log_dir: bool = False) -> str:
 def create_pie_chart(saving_path: str, status_dict: Dict[str, int]) -> None:
     """We are creating and saving a plot that show us the rate of log types.
 
+    The chart is rendered off-screen and cached by the counts, so exporting
+    the same logs again reuses the image.
+
     Parameters:
-        saving_path `str`: pic_chart.png saved on that parameter as path.
-        info_size `int`: Info logs length.
-        warning_size `int`: Warning logs length.
-        error_size `int`: Error logs lenght.
+        saving_path `str`: pie_chart.png saved on that parameter as path.
+        status_dict `Dict`: Number of logs per status.
 
     Return:
         None
     """
-    chart_labels = list(status_dict.keys())
-    chart_explode = [0, 0.01, 0.01, 0.01, 0.01]
-    chart_colors = ["gray", "blue", "yellow", "red", "darkred"]
-
-    logs_size = list(status_dict.values())
-
-    plt.pie(
-        logs_size,
-        labels=chart_labels,
-        explode=chart_explode,
-        colors=chart_colors,
-        autopct="%1.1f%%",
-    )
-
-    png_path = os.path.join(saving_path, "pie_chart.png")
-
-    if os.path.exists("pie_chart.png"):
-        os.remove(png_path)
-
-    plt.savefig(f"{png_path}")
+    write_pie_chart(os.path.join(saving_path, CHART_FILES["pie"]), status_dict)
 
 
 def get_daily_log_file_name(filename: str,
@@ -108,12 +145,13 @@ def get_daily_log_file_name(filename: str,
     Return:
         filename `str`: Full name of file name with specific extension.
     """
+    date_str = default_provider.date()
     if pdf:
-        filename = f"{datetime.datetime.today().strftime('%Y-%m-%d')}_{filename}.pdf"
+        filename = f"{date_str}_{filename}.pdf"
     elif markdown:
-        filename = f"{datetime.datetime.today().strftime('%Y-%m-%d')}_{filename}.md"
+        filename = f"{date_str}_{filename}.md"
     else:
-        filename = f"{datetime.datetime.today().strftime('%Y-%m-%d')}_{filename}.log"
+        filename = f"{date_str}_{filename}.log"
     return filename
 
 
@@ -123,7 +161,7 @@ def get_current_time_HM() -> str:
     Return:
         hour_min_sec `str`: Current hour:minute:second.
     """
-    hour_min_sec = datetime.datetime.today().strftime("%H:%M:%S")
+    hour_min_sec = default_provider.now()
     return f"{hour_min_sec}"
 
 
@@ -132,31 +170,172 @@ def console_data(
     status_dict: Dict[str, int],
     statuc_icon_dict: Dict[str, str],
     local_file: bool,
+    limit: Optional[int] = None,
+    since: Optional[str] = None,
+    min_level: Optional[str] = None,
 ) -> None:
     """We are printing our logs on console with beauty of rich.
 
+    Rows are printed in chunks as the file is read, so output starts at once
+    even for very large files.
+
     Params:
         script_name (str): That contains the script name which is running on console.
         stats_dict `Dict`:  Define status counter.
+        limit `int`: Show at most this many records.
+        since `str`: Skip records with an earlier timestamp (compared as text).
+        min_level `str`: Skip records below this level name.
 
     Return:
         None
     """
+    from rich.console import Console
+
+    rich_console = Console()
+    for renderable in iter_console_data(
+            script_name,
+            status_dict,
+            statuc_icon_dict,
+            local_file,
+            limit=limit,
+            since=since,
+            min_level=min_level,
+    ):
+        rich_console.print(renderable)
+
+
+def iter_console_data(
+    script_name: str,
+    status_dict: Dict[str, int],
+    statuc_icon_dict: Dict[str, str],
+    local_file: bool,
+    limit: Optional[int] = None,
+    since: Optional[str] = None,
+    min_level: Optional[str] = None,
+    chunk_rows: int = CONSOLE_CHUNK_ROWS,
+) -> Iterator[Union["Table", str]]:
+    """Yield the console view of a log file piece by piece.
+
+    Text records are read through the memory-mapped reader: the level and
+    ``since`` filters are checked on the raw bytes, so skipped records are
+    never decoded, and reading stops once ``limit`` rows were produced.
+    JSON Lines, msgpack and binary logs are parsed and filtered record by
+    record; compressed logs only decompress blocks that can match.
+    Rows are yielded as rich tables of ``chunk_rows`` rows; the first one
+    carries the title and header, and all chunks share the column widths of
+    the first. The level footer comes last, from counts kept while reading.
+
+    Params:
+        script_name (str): Log file name, or path if local_file is True.
+        status_dict `Dict`: Status counter, updated while reading.
+        statuc_icon_dict `Dict`: Icon of each status.
+        local_file `bool`: script_name is a path rather than a name in the package directory.
+        limit `int`: Show at most this many records.
+        since `str`: Skip records with an earlier timestamp (compared as text).
+        min_level `str`: Skip records below this level name.
+        chunk_rows `int`: Rows per table.
+
+    Yields:
+        Rich tables, then the footer lines.
+    """
     if local_file:
         log_dir = script_name
     else:
         dir_path = get_saving_path()
         log_dir = os.path.join(dir_path, script_name)
 
-    file = open(log_dir, "r")
+    levels = None
+    if min_level is not None:
+        threshold = LogLevel[min_level.upper()]
+        levels = [level.name for level in LogLevel if level >= threshold]
+
+    title = f"{log_dir.split('/')[-1]} :see_no_evil: :hear_no_evil: :speak_no_evil:"
+    widths = None
+    rows: List[LogEntry] = []
+    for entry in islice(_console_entries(log_dir, levels, since), limit):
+        status_dict[entry.level] += 1
+        rows.append(entry)
+
+        if len(rows) >= chunk_rows:
+            widths = widths or _console_widths(rows)
+            yield _console_table(rows, statuc_icon_dict, widths, title)
+            title = None
+            rows = []
+
+    if rows or title is not None:
+        widths = widths or _console_widths(rows)
+        yield _console_table(rows, statuc_icon_dict, widths, title)
+
+    total_length = sum(list(status_dict.values()))
+    yield ("[bright_black]████████████████[blue]████████████████\
+[bright_yellow]████████████████[red]█████████████████[dark_red]██████████████████"
+           )
+    yield (
+        f"DEBUG: %{round(status_dict['DEBUG']/total_length*100 if total_length > 0 else 0, 2)}"
+        +
+        f"\tINFO: %{round(status_dict['INFO']/total_length*100 if total_length > 0 else 0, 2)}"
+        +
+        f"\tWARNING: %{round(status_dict['WARNING']/total_length*100 if total_length > 0 else 0, 2)}"
+        +
+        f"\tERROR: %{round(status_dict['ERROR']/total_length*100 if total_length > 0 else 0, 2)}"
+        +
+        f"\tCRITICAL: %{round(status_dict['CRITICAL']/total_length*100 if total_length > 0 else 0, 2)}"
+    )
+
 
-    (
-        _date_list,
-        _status_list,
-        _filename_list,
-        _functname_list,
-        _log_message_list,
-    ) = extract_logs(logs=file)
+def _console_entries(path: str, levels: Optional[List[str]],
+                     since: Optional[str]) -> Iterator[LogEntry]:
+    """Entries of a log file passing the level and ``since`` filters.
+
+    Text logs are filtered on the raw bytes of the memory-mapped reader;
+    structured logs are parsed first. Both compare ``since`` with the time
+    of day, i.e. the part after the ``T`` of ISO timestamps. Compressed logs
+    skip whole blocks by their index first.
+    """
+    file_format = detect_format(path)
+    if file_format == "compressed":
+        # Blocks whose index rules out the filters aren't decompressed
+        yield from iter_compressed(path, levels=levels, since=since)
+        return
+    if file_format != "text":
+        for entry in iter_log_file(path):
+            if levels is not None and entry.level not in levels:
+                continue
+            if since and entry.time.split("T")[-1] < since:
+                continue
+            yield entry
+        return
+
+    since_bytes = since.encode() if since else None
+    with MappedLogReader(path) as reader:
+        for record in reader.records(levels=levels):
+            if since_bytes is not None:
+                stamp = bytes(record.time)
+                if stamp[stamp.rfind(b"T") + 1:] < since_bytes:
+                    continue
+            yield record.decode()
+
+
+def _console_widths(rows: List[LogEntry]) -> Tuple[int, int, int, int]:
+    """Column widths (date, status, file, function) fitting the given rows."""
+    # Status cells look like "[LEVEL 🆘]"; the icons are emoji taking two cells
+    status = max(len(level.name) + 5 for level in LogLevel)
+    widths = [len("DATE"), status, len("FILE"), len("FUNCTION")]
+    for entry in rows:
+        widths[0] = max(widths[0], len(entry.time) + 2)
+        widths[2] = max(widths[2], len(entry.filename))
+        widths[3] = max(widths[3], len(entry.function))
+    return tuple(widths)
+
+
+def _console_table(
+    rows: List[LogEntry],
+    statuc_icon_dict: Dict[str, str],
+    widths: Tuple[int, int, int, int],
+    title: Optional[str],
+) -> "Table":
+    """Build one chunk of the console view."""
+    from rich.table import Table
 
     type_colors = {
         "DEBUG": "[bright_black]",
@@ -166,49 +345,26 @@ def console_data(
         "CRITICAL": "[bold red]",
     }
 
-    rich_table = Table(
-        title=
-        f"{log_dir.split('/')[-1]} :see_no_evil: :hear_no_evil: :speak_no_evil:"
-    )
+    rich_table = Table(title=title, show_header=title is not None)
 
-    rich_table.add_column("DATE", justify="center")
-    rich_table.add_column("STATUS", justify="center", no_wrap=True)
-    rich_table.add_column("FILE", justify="center")
-    rich_table.add_column("FUNCTION", justify="center")
+    rich_table.add_column("DATE", justify="center", min_width=widths[0])
+    rich_table.add_column("STATUS", justify="center", no_wrap=True, min_width=widths[1])
+    rich_table.add_column("FILE", justify="center", min_width=widths[2])
+    rich_table.add_column("FUNCTION", justify="center", min_width=widths[3])
     rich_table.add_column("MESSAGE",
                           justify="left",
                           no_wrap=False,
                           max_width=250)
 
-    for index, _ in enumerate(_log_message_list):
-        log_status_clear = _status_list[index].replace("[",
-                                                       "").replace("]", "")
-        status_dict[log_status_clear] += 1
+    for entry in rows:
         rich_table.add_row(
-            f"[bold]{_date_list[index]}",
-            f"{type_colors[log_status_clear]}[{log_status_clear} {statuc_icon_dict[log_status_clear]}][white]",
-            f"[bold]{_filename_list[index].replace('[', '').replace(']', '')}",
-            f"[italic]{_functname_list[index].replace('[', '').replace(']', '')}",
-            f"{_log_message_list[index]}",
+            f"[bold][{entry.time}]",
+            f"{type_colors[entry.level]}[{entry.level} {statuc_icon_dict[entry.level]}][white]",
+            f"[bold]{entry.filename}",
+            f"[italic]{entry.function}",
+            f"{entry.message}",
         )
-
-    rich_console = Console()
-    rich_console.print(rich_table)
-    total_length = sum(list(status_dict.values()))
-    rich_console.print("[bright_black]████████████████[blue]████████████████\
-[bright_yellow]████████████████[red]█████████████████[dark_red]██████████████████"
-                       )
-    rich_console.print(
-        f"DEBUG: %{round(status_dict['DEBUG']/total_length*100 if total_length > 0 else 0, 2)}"
-        +
-        f"\tINFO: %{round(status_dict['INFO']/total_length*100 if total_length > 0 else 0, 2)}"
-        +
-        f"\tWARNING: %{round(status_dict['WARNING']/total_length*100 if total_length > 0 else 0, 2)}"
-        +
-        f"\tERROR: %{round(status_dict['ERROR']/total_length*100 if total_length > 0 else 0, 2)}"
-        +
-        f"\tCRITICAL: %{round(status_dict['CRITICAL']/total_length*100 if total_length > 0 else 0, 2)}"
-    )
+    return rich_table
 
 
 def to_markdown(
@@ -217,6 +373,7 @@ def to_markdown(
     status_dict: Dict[str, int],
     status_icons: Dict[str, str],
     local_file: bool = False,
+    chart: str = "pie",
 ) -> None:
     """Export the logs to a file with `.pdf` format.
 
@@ -225,22 +382,22 @@ def to_markdown(
         saving_path `str`:  Save the pdf file to the that path.
         stats_dict `Dict`:  Define status counter.
         local_file: `bool`: Check load from root directory or local file. Default is False.
+        chart `str`: "pie" (matplotlib PNG), "bars" (SVG, no matplotlib) or "none", default is "pie".
 
     Return:
         None
     """
+    if chart not in CHART_KINDS:
+        raise ExportError(f"Unknown chart {chart!r}, expected one of {', '.join(CHART_KINDS)}")
+
     if local_file:
         md_file = os.path.join(saving_path, script_name.replace(".log", ".md"))
-
-        markdown_file = open(md_file, "w")
         filename = script_name
 
     else:
         md_file = os.path.join(
             saving_path,
             get_daily_log_file_name(filename=script_name, markdown=True))
-
-        markdown_file = open(md_file, "w")
         filename = get_daily_log_file_name(filename=script_name)
 
     file_dir = saving_path
@@ -254,55 +411,54 @@ def to_markdown(
     if get_current_platform_name() == "Windows":
         only_filename = os.path.split(only_filename)[1]
 
-    markdown_file.writelines(
-        f"# {only_filename} {file_date} Logs :see_no_evil: :hear_no_evil: :speak_no_evil:\n"
-    )
-    markdown_file.writelines("![](pie_chart.png)\n")
-    markdown_file.writelines(
-        "|TIME|STATUS|FILENAME|FUNCTION|MESSAGE|\n| :--: | :--: | :--: | :--: | :--: |\n"
-    )
+    # Single pass over the parser: rows are joined into batches and written
+    # through a large buffer, counts are kept on the fly, so memory stays
+    # constant whatever the size of the log.
+    with open(md_file, "w", buffering=MARKDOWN_BUFFER_SIZE) as markdown_file:
+        markdown_file.write(
+            f"# {only_filename} {file_date} Logs :see_no_evil: :hear_no_evil: :speak_no_evil:\n"
+        )
+        if chart in CHART_FILES:
+            markdown_file.write(f"![]({CHART_FILES[chart]})\n")
+        markdown_file.write(
+            "|TIME|STATUS|FILENAME|FUNCTION|MESSAGE|\n| :--: | :--: | :--: | :--: | :--: |\n"
+        )
 
-    # Split Strings.
-    file = open(full_logfile_path, "r")
-    (
-        _date_list,
-        _status_list,
-        _filename_list,
-        _functname_list,
-        _log_message_list,
-    ) = extract_logs(logs=file)
-
-    # Write logs in markdown file.
-    for index, _ in enumerate(_log_message_list):
-        log_status_clear = _status_list[index].replace("[",
-                                                       "").replace("]", "")
-        status_dict[log_status_clear] += 1
-
-        try:
-            markdown_file.writelines("|{}|{}|{}|{}|{}|".format(
-                _date_list[index],
-                status_icons[log_status_clear],
-                _filename_list[index],
-                _functname_list[index],
-                _log_message_list[index].replace("\n", " "),
+        rows = []
+        for entry in iter_log_file(full_logfile_path):
+            status_dict[entry.level] += 1
+            try:
+                icon = status_icons[entry.level]
+            except KeyError:
+                raise KeyError("Please check your icon.")
+
+            rows.append("|[{}]|{}|[{}]|[{}]|{}|\n".format(
+                entry.time,
+                icon,
+                entry.filename,
+                entry.function,
+                entry.message.replace("\n", " "),
             ))
-            markdown_file.write("\n")
-        except KeyError:
-            raise ("Please check your icon.")
-
-    # Write signature
-    markdown_file.writelines(
-        "All right reserved 2022 &copy;&nbsp; [Logges](https://github.com/uysalserkan/Logges) - \
+            if len(rows) >= MARKDOWN_BATCH_ROWS:
+                markdown_file.write("".join(rows))
+                rows.clear()
+        markdown_file.write("".join(rows))
+
+        # Write signature
+        markdown_file.write(
+            "All right reserved 2022 &copy;&nbsp; [Logges](https://github.com/uysalserkan/Logges) - \
 *[uysalserkan](https://github.com/uysalserkan/) & [Ozkan](https://github.com/ozkanuysal)*\n"
-    )
-
-    # Create chart
-    create_pie_chart(
-        saving_path=saving_path,
-        status_dict=status_dict,
-    )
+        )
 
-    markdown_file.close()
+    # Create chart from the counts of the pass
+    if chart == "pie":
+        create_pie_chart(
+            saving_path=saving_path,
+            status_dict=status_dict,
+        )
+    elif chart == "bars":
+        with open(os.path.join(saving_path, CHART_FILES["bars"]), "w") as svg_file:
+            svg_file.write(bar_chart_svg(status_dict))
 
 
 def to_pdf(
@@ -310,18 +466,36 @@ def to_pdf(
     saving_path: str,
     status_dict: Dict[str, int],
     local_file: bool = False,
+    max_rows: Optional[int] = None,
+    sample: bool = False,
+    chart: str = "pie",
 ) -> None:
     """Export the logs to a file with `.pdf` format.
 
+    Records are streamed from the parser into page-sized tables of plain
+    strings; only cells too wide for their column become a wrapped Paragraph.
+    When `max_rows` leaves records out, a summary page with the level counts
+    of the whole log is added.
+
     Parameters:
         script_name `str`: Save the pdf file as that string.
         saving_path `str`:  Save the pdf file to the that path.
         stats_dict `Dict`:  Define status counter.
         local_file: `bool`: Check load from root directory or local file. Default is False.
+        max_rows `int`: Most records written to the table, default is all of them.
+        sample `bool`: Pick `max_rows` records at random instead of the first ones, default is False.
+        chart `str`: "pie" (matplotlib PNG), "bars" (drawn by reportlab, no matplotlib) or "none", default is "pie".
 
     Return:
         None
     """
+    from reportlab.lib.enums import TA_CENTER, TA_LEFT
+    from reportlab.lib.pagesizes import LETTER, inch
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.platypus import Image, PageBreak, Paragraph, SimpleDocTemplate, Spacer
+
+    if chart not in CHART_KINDS:
+        raise ExportError(f"Unknown chart {chart!r}, expected one of {', '.join(CHART_KINDS)}")
 
     def copyright_text() -> Paragraph:
         """We are add a text on the page."""
@@ -335,14 +509,6 @@ def to_pdf(
         uysaltext_p = Paragraph(uysaltext, copyright_style)
         return uysaltext_p
 
-    type_colors = {
-        "DEBUG": "gray",
-        "INFO": "blue",
-        "WARNING": "orange",
-        "ERROR": "red",
-        "CRITICAL": "darkred",
-    }
-
     if local_file:
         log_dir = script_name
     else:
@@ -353,17 +519,6 @@ def to_pdf(
     # Burada eklemeler yapılıyor..
     page_elements = []
 
-    # Reading data başlıyor..
-    file = open(log_dir, "r")
-
-    (
-        _date_list,
-        _status_list,
-        _filename_list,
-        _functname_list,
-        _log_message_list,
-    ) = extract_logs(logs=file)
-
     # Header Başlığı Ekleniyor.
     header_text = (
         f"{script_name}.py {datetime.datetime.today().strftime('%Y-%m-%d')} Logs"
@@ -373,82 +528,181 @@ def to_pdf(
     page_elements.append(header)
     page_elements.append(Spacer(10, 20))
 
-    if not os.path.exists(os.path.join(saving_path, "pie_chart.png")):
-        for index, _ in enumerate(_status_list):
-            log_status_clear = _status_list[index].replace("[", "").replace(
-                "]", "")
-            status_dict[log_status_clear] += 1
-
+    # Reading data: one pass, keeping at most max_rows rows (in file order).
+    counts = dict.fromkeys(PDF_LEVEL_COLORS, 0)
+    total = 0
+    rows = []
+    for entry in iter_log_file(log_dir):
+        counts[entry.level] += 1
+        row = (
+            f"[{entry.time}]",
+            entry.level,
+            f"[{entry.filename}]",
+            f"[{entry.function}]",
+            " ".join(entry.message.split()),
+        )
+        if max_rows is None or len(rows) < max_rows:
+            rows.append((total, row))
+        elif sample:
+            # Reservoir sampling, every record is kept with equal chance
+            slot = random.randrange(total + 1)
+            if slot < max_rows:
+                rows[slot] = (total, row)
+        total += 1
+    rows.sort()
+
+    for level, count in counts.items():
+        status_dict[level] += count
+
+    if chart == "pie":
         create_pie_chart(
             saving_path=saving_path,
             status_dict=status_dict,
         )
 
-    # Append image to PDF file.
-    png_path = os.path.join(saving_path, "pie_chart.png")
-    img = Image(f"{png_path}")
-    img.drawHeight = 3.5 * inch
-    img.drawWidth = 5.5 * inch
-    page_elements.append(img)
-
-    table_data = []
-
-    column_styled_list = []
-    centered = ParagraphStyle(name="centered", alignment=TA_CENTER)
-    columns = ["TIME", "STATUS", "FILE", "FUNCTION", "MESSAGE"]
-
-    for each in columns:
-        column_text = f"<font size='8'><b>{each}</b></font>"
-        styled_column = Paragraph(column_text, centered)
-        column_styled_list.append(styled_column)
-    table_data.append(column_styled_list)
-
-    alignStyle = ParagraphStyle(name="data", alignment=TA_CENTER)
-
-    # Reading data bitiyor..
-
-    # Write logs into pdf.
-    for index, _ in enumerate(_log_message_list):
-        # Log message color
-        log_status_clear = _status_list[index].replace("[",
-                                                       "").replace("]", "")
-        color = type_colors[log_status_clear]
-
-        # Extract values of log data.
-        _date = _date_list[index]
-        _log_status = log_status_clear
-        _filename = _filename_list[index]
-        _functname = _functname_list[index]
-        _log_msg = _log_message_list[index]
-
-        row_data = []
-        for index, item in enumerate(
-            [_date, _log_status, _filename, _functname, _log_msg]):
-            if index == 1:
-                table_text = f"<font color='{color}'>{item}</font>"
-            else:
-                table_text = f"<b>{item}</b>"
-            ptext = Paragraph(table_text, alignStyle)
-            row_data.append(ptext)
-        table_data.append(row_data)
-
-    table = reportlabTable(table_data, colWidths=[70, 100, 100, 100, 200])
-    tStyle = TableStyle([
-        ("ALIGN", (0, -1), (-1, -1), "LEFT"),
-        ("ALIGN", (1, 0), (1, -1), "RIGHT"),
-        ("LINEABOVE", (0, 0), (-1, -1), 1, Color(0.2, 0.3, 0.4)),
-        ("BACKGROUND", (0, 0), (-1, 0), Color(102 / 255, 191 / 255,
-                                              191 / 255)),
-    ])
-    table.setStyle(tStyle)
-    page_elements.append(table)
+        # Append image to PDF file.
+        png_path = os.path.join(saving_path, CHART_FILES["pie"])
+        img = Image(f"{png_path}")
+        img.drawHeight = 3.5 * inch
+        img.drawWidth = 5.5 * inch
+        page_elements.append(img)
+    elif chart == "bars":
+        page_elements.append(bar_chart_drawing(status_dict))
+        page_elements.append(Spacer(10, 20))
+
+    # Write logs into pdf, one table per page of rows.
+    for start in range(0, max(len(rows), 1), PDF_CHUNK_ROWS):
+        chunk = [row for _, row in rows[start:start + PDF_CHUNK_ROWS]]
+        page_elements.append(_pdf_table(chunk))
+
+    if len(rows) < total:
+        page_elements.append(PageBreak())
+        page_elements.append(_pdf_summary(counts, len(rows), total, sample))
 
     page_elements.append(copyright_text())
     page_elements.append(PageBreak())
     to_pdf_path = os.path.join(
         saving_path, get_daily_log_file_name(filename=script_name, pdf=True))
     pdf_doc = SimpleDocTemplate(to_pdf_path, pagesize=LETTER)
-    pdf_doc.multiBuild(page_elements)
+    pdf_doc.build(page_elements)
+
+
+@lru_cache(maxsize=None)
+def _pdf_wrapped_cell_style() -> "ParagraphStyle":
+    """Paragraph style of the PDF table cells that need wrapping."""
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.lib.styles import ParagraphStyle
+
+    return ParagraphStyle(
+        "pdf_cell",
+        fontName=PDF_FONT,
+        fontSize=PDF_FONT_SIZE,
+        leading=PDF_FONT_SIZE + 2,
+        alignment=TA_CENTER,
+    )
+
+
+def _pdf_cell(text: str, width: float) -> Union[str, "Paragraph"]:
+    """Return a table cell, wrapped in a Paragraph only if it is too wide.
+
+    Parameters:
+        text `str`: Cell text.
+        width `float`: Column width in points.
+
+    Return:
+        cell `str` or `Paragraph`: The plain text, or a wrapping Paragraph.
+    """
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+    from reportlab.platypus import Paragraph
+
+    if stringWidth(text, PDF_FONT, PDF_FONT_SIZE) <= width - 2 * PDF_CELL_PADDING:
+        return text
+    return Paragraph(escape(text), _pdf_wrapped_cell_style())
+
+
+def _pdf_table(rows: List[Tuple[str, str, str, str, str]]) -> "reportlabTable":
+    """Build one chunk of the PDF log table.
+
+    Parameters:
+        rows `List`: (time, level, file, function, message) rows of the chunk.
+
+    Return:
+        table `Table`: Table with the column header and the rows.
+    """
+    from reportlab.platypus import Table as reportlabTable
+
+    table_data = [PDF_COLUMNS]
+    level_colors = []
+    for row_index, row in enumerate(rows, start=1):
+        table_data.append([
+            _pdf_cell(text, width)
+            for text, width in zip(row, PDF_COLUMN_WIDTHS)
+        ])
+        level_colors.append(("TEXTCOLOR", (1, row_index), (1, row_index),
+                             PDF_LEVEL_COLORS[row[1]]))
+
+    table = reportlabTable(table_data,
+                           colWidths=PDF_COLUMN_WIDTHS,
+                           repeatRows=1)
+    table.setStyle(PDF_TABLE_STYLE + level_colors)
+    return table
+
+
+def _pdf_summary(counts: Dict[str, int], shown: int, total: int,
+                 sample: bool) -> "reportlabTable":
+    """Build the summary of a PDF export that left records out.
+
+    Parameters:
+        counts `Dict`: Records per level in the whole log.
+        shown `int`: Number of records in the table.
+        total `int`: Number of records in the log.
+        sample `bool`: Whether the shown records were sampled.
+
+    Return:
+        table `Table`: Summary with the level counts.
+    """
+    from reportlab.platypus import Table as reportlabTable
+
+    picked = "a random sample" if sample else "the first records"
+    table_data = [
+        [f"Showing {shown} of {total} records ({picked})", ""],
+        ["STATUS", "RECORDS"],
+    ]
+    table_data.extend([level, str(count)] for level, count in counts.items())
+    table_data.append(["TOTAL", str(total)])
+
+    table = reportlabTable(table_data, colWidths=[200, 100])
+    table.setStyle(PDF_SUMMARY_STYLE)
+    return table
+
+
+def to_text(source: str, target: str) -> int:
+    """Convert a log file of any format to the text format.
+
+    JSON Lines, msgpack, binary and compressed logs become the default
+    `[time] [  LEVEL   ] [file] [function:line]: message` lines, readable
+    without Logges. Records are streamed, never held all at once.
+
+    Params:
+        source `str`: Path of the log file to convert.
+        target `str`: Path of the text file to write.
+
+    Return:
+        Number of records written.
+    """
+    count = 0
+    with open(target, "w", buffering=MARKDOWN_BUFFER_SIZE) as text_file:
+        lines = []
+        for entry in iter_log_file(source):
+            lines.append(f"[{entry.time}] [{entry.level:^10}] [{entry.filename}] "
+                         f"[{entry.function}]:{entry.message}")
+            if len(lines) >= TEXT_BATCH_ROWS:
+                text_file.write("".join(lines))
+                count += len(lines)
+                lines = []
+        text_file.write("".join(lines))
+        count += len(lines)
+    return count
 
 
 def get_log_info() -> Tuple[str, str]:
@@ -465,6 +719,9 @@ def extract_logs(
 ) -> Tuple[List[str], List[str], List[str], List[str], List[str]]:
     """Extract logs meta-data and messages.
 
+    This builds five lists holding the whole file; prefer
+    `parser.iter_logs`, which yields one entry at a time.
+
     Parameters:
         logs `TextIOWrapper`: An object that comes with open method.
 
@@ -478,25 +735,14 @@ def extract_logs(
     filename_list = []
     function_and_lineno_list = []
     msg_list = []
-    for each_line in logs.readlines():
-        if not each_line.startswith("[") and len(msg_list) <= 0:
-            continue
-        elif each_line.startswith("["):
-            # Get Meta-Data
-            info_str = ":".join(each_line.split(":")[:4]).strip()
-            msg_str = ":".join(each_line.split(":")[4:])
-
-            # Append Log message
-            msg_list.append(msg_str)
-
-            # Extract Infos
-            date_list.append(info_str[0:10])
-            status_list.append(info_str[11:21].replace(" ", ""))
-            filename_list.append(f"[{info_str[22:].split('[')[1][:-2]}]")
-            function_and_lineno_list.append(
-                f"[{info_str[22:].split('[')[2][:-1]}]")
-        else:
-            msg_list[len(msg_list) - 1] += each_line
+    # Thin wrapper around the streaming parser, keeping the legacy shapes:
+    # "[time]", "[LEVEL", "[file]", "[function:line]" and the raw message.
+    for entry in iter_logs(logs):
+        date_list.append(f"[{entry.time}]")
+        status_list.append(f"[{entry.level}")
+        filename_list.append(f"[{entry.filename}]")
+        function_and_lineno_list.append(f"[{entry.function}]")
+        msg_list.append(entry.message)
 
     return (date_list, status_list, filename_list, function_and_lineno_list,
             msg_list)
@@ -2,10 +2,39 @@
 import os
 import tempfile
 from pathlib import Path
-from typing import Generator
+from typing import Any, Generator
 
 import pytest
 
+from Logges import LogLevel, LogRecord
+
+# Default creation time of make_record's records: 2026-01-30, with milliseconds
+RECORD_CREATED = 1769776496.789
+
+
+def make_record(
+    message: str = "msg",
+    level: LogLevel = LogLevel.INFO,
+    *,
+    timestamp: str = "12:00:00",
+    filename: str = "app.py",
+    function: str = "main",
+    line_number: int = 1,
+    created: float = RECORD_CREATED,
+    **extra: Any,
+) -> LogRecord:
+    """Build a log record for tests; remaining keyword arguments become ``extra``."""
+    return LogRecord(
+        timestamp=timestamp,
+        level=level,
+        message=message,
+        filename=filename,
+        function=function,
+        line_number=line_number,
+        extra=extra,
+        created=created,
+    )
+
 
 @pytest.fixture
 def temp_dir() -> Generator[Path, None, None]:
@@ -64,3 +93,11 @@ def reset_logges_state():
     
     if "print_status" in os.environ:
         del os.environ["print_status"]
+
+
+@pytest.fixture(autouse=True)
+def restore_cwd():
+    """Return to the starting directory after tests that chdir into temp dirs."""
+    cwd = os.getcwd()
+    yield
+    os.chdir(cwd)
@@ -0,0 +1,212 @@
+"""Tests for block-compressed log files."""
+import datetime
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import Logges
+from Logges import FileHandler, LogConfig, Logger, LogLevel, LogRecord, RotatingFileHandler, blocks
+from Logges.blocks import BlockInfo, block_matches, get_codec, iter_blocks, read_codec, read_index
+from Logges.exceptions import ConfigurationError, HandlerError, LogFormatError
+from Logges.parser import _iter_block, detect_format, iter_compressed, iter_log_file
+from Logges.serializers import BinarySerializer
+from Logges.tail import last_records
+
+from .conftest import make_record
+
+CREATED = 1769776496.0
+
+
+def indexed_record(index: int, level: LogLevel = LogLevel.INFO) -> LogRecord:
+    """Build a record created ``index`` seconds after a fixed time."""
+    return make_record(
+        f"message {index}",
+        level,
+        timestamp=f"12:00:{index % 60:02d}",
+        function=f"handle{index % 3}",
+        line_number=index,
+        created=CREATED + index,
+    )
+
+
+def write_log(path: Path, count: int, compression: str = "gzip", errors=(), **kwargs) -> None:
+    """Write ``count`` records in blocks of about four records."""
+    handler = FileHandler(path, compression=compression, block_size=4 * 50, **kwargs)
+    for index in range(count):
+        level = LogLevel.ERROR if index in errors else LogLevel.INFO
+        record = indexed_record(index, level)
+        handler.emit(record, f"[{record.timestamp}] [{level.name:^10}] [app.py] [f:{index}]: {record.message}")
+    handler.close()
+
+
+def index_of(path: Path) -> list:
+    """Return the block index of a compressed log."""
+    with open(path, "rb") as stream:
+        read_codec(stream)
+        return read_index(stream)
+
+
+class TestCodecs:
+    """Test codec selection."""
+
+    @pytest.mark.parametrize("name", ["gzip", "lzma", "auto"])
+    def test_round_trip(self, name: str):
+        """Test that every codec decompresses what it compressed."""
+        codec = get_codec(name)
+        data = b"[12:00:00] [   INFO   ] repeated line\n" * 100
+        assert codec.decompress(codec.compress(data)) == data
+        assert len(codec.compress(data)) < len(data)
+
+    def test_zstd_fallback(self, monkeypatch):
+        """Test that auto falls back to gzip and zstd fails without a zstd module."""
+        monkeypatch.setattr(blocks, "_zstd_codec", lambda: None)
+        assert get_codec("auto").name == "gzip"
+        with pytest.raises(HandlerError):
+            get_codec("zstd")
+        with pytest.raises(HandlerError):
+            get_codec("bz2")
+
+    def test_config_validation(self):
+        """Test that LogConfig rejects unknown compressions and block sizes."""
+        with pytest.raises(ConfigurationError):
+            LogConfig(name="app", compression="bz2")
+        with pytest.raises(ConfigurationError):
+            LogConfig(name="app", compression="gzip", compression_block_size=0)
+
+
+class TestCompressedFiles:
+    """Test writing and reading compressed logs."""
+
+    @pytest.mark.parametrize("compression", ["gzip", "lzma"])
+    def test_round_trip(self, temp_dir: Path, compression: str):
+        """Test that records are split into indexed blocks and read back in order."""
+        path = temp_dir / "app.log"
+        write_log(path, 20, compression, errors={5})
+
+        assert detect_format(path) == "compressed"
+        index = index_of(path)
+        assert len(index) > 2
+        assert sum(block.records for block in index) == 20
+        assert index[0].first == CREATED and index[-1].last == CREATED + 19
+        entries = list(iter_log_file(path))
+        assert [entry.message for entry in entries] == [f" message {index}\n" for index in range(20)]
+
+    def test_level_filter_skips_blocks(self, temp_dir: Path):
+        """Test that only blocks holding a wanted level are decompressed."""
+        path = temp_dir / "app.log"
+        write_log(path, 40, errors={7, 30}, flush_level=LogLevel.CRITICAL)
+
+        with open(path, "rb") as stream:
+            read = [block for block, _ in iter_blocks(stream, levels=["ERROR"])]
+        assert len(read) == 2 < len(index_of(path))
+        entries = list(iter_compressed(path, levels=["ERROR"]))
+        assert [entry.function for entry in entries] == ["f:7", "f:30"]
+
+    def test_block_matches_since(self):
+        """Test that blocks ending before ``since`` are ruled out."""
+        block = BlockInfo(0, 10, 10, 0, 2, CREATED, CREATED + 60, 0b10)
+        last = datetime.datetime.fromtimestamp(CREATED + 60).strftime("%H:%M:%S")
+        assert block_matches(block, since=last)
+        assert not block_matches(block, since=last + ".5")
+        assert not block_matches(block, levels=["ERROR"])
+        assert block_matches(block, levels=["ERROR", "INFO"])
+
+    def test_last_records_reads_last_blocks(self, temp_dir: Path):
+        """Test that tail only decompresses the blocks it needs."""
+        path = temp_dir / "app.log"
+        write_log(path, 20)
+
+        with open(path, "rb") as stream:
+            read = [block for block, _ in iter_blocks(stream, last_records=3)]
+        assert read and sum(block.records for block in read) >= 3
+        assert len(read) < len(index_of(path))
+        assert [entry.function for entry in last_records(path, 3)] == ["f:17", "f:18", "f:19"]
+
+    def test_torn_block_is_repaired(self, temp_dir: Path):
+        """Test that a crash loses only the torn block and appending continues."""
+        path = temp_dir / "app.log"
+        write_log(path, 12)
+        blocks_before = index_of(path)
+        with open(path, "r+b") as stream:
+            stream.truncate(path.stat().st_size - 3)
+
+        torn = blocks_before[-1].records
+        assert len(list(iter_log_file(path))) == 12 - torn
+
+        write_log(path, 2)
+        assert len(index_of(path)) == len(blocks_before)
+        assert len(list(iter_log_file(path))) == 12 - torn + 2
+
+    def test_never_appends_to_uncompressed_file(self, temp_dir: Path, capsys):
+        """Test that blocks are not written into a text log."""
+        path = temp_dir / "app.log"
+        path.write_text("plain\n")
+        with pytest.raises(LogFormatError, match="holds text records"):
+            FileHandler(path, compression="gzip")
+
+        # Replaced by a text log after the handler was created
+        other = temp_dir / "other.log"
+        handler = FileHandler(other, compression="gzip")
+        other.write_text("plain\n")
+        handler.emit(indexed_record(0), "[12:00:00] [   INFO   ] [app.py] [f:0]: message 0")
+        handler.close()
+        assert other.read_text() == "plain\n"
+        assert "holds text records" in capsys.readouterr().err
+
+    def test_rotating_moves_uncompressed_file_aside(self, temp_dir: Path):
+        """Test that a rotating handler starts a fresh compressed file."""
+        (temp_dir / "app.log").write_text("plain\n")
+        handler = RotatingFileHandler(temp_dir, "app", daily=False, compression="gzip")
+        handler.emit(indexed_record(0), "[12:00:00] [   INFO   ] [app.py] [f:0]: message 0")
+        handler.close()
+
+        assert (temp_dir / "app.1.log").read_text() == "plain\n"
+        assert detect_format(temp_dir / "app.log") == "compressed"
+        assert [entry.message for entry in iter_log_file(temp_dir / "app.log")] == [" message 0\n"]
+
+    def test_binary_blocks_are_self_contained(self, temp_dir: Path):
+        """Test that each binary block carries the strings its records use."""
+        path = temp_dir / "app.log"
+        write_log(path, 12, serializer=BinarySerializer())
+
+        with open(path, "rb") as stream:
+            payloads = [payload for _, payload in iter_blocks(stream)]
+        assert len(payloads) > 1
+        last = list(_iter_block(payloads[-1]))
+        assert last and all(entry.function.startswith("handle") for entry in last)
+        assert [entry.message for entry in iter_log_file(path)] == [f" message {i}\n" for i in range(12)]
+
+    def test_pending_block_written_at_exit(self, temp_dir: Path):
+        """Test that a block still collecting records is written when the program exits."""
+        script = (
+            "import sys\n"
+            "from Logges import LogConfig, Logger\n"
+            "config = LogConfig(\n"
+            "    name='app', log_dir=sys.argv[1], compression='gzip', print_to_console=False\n"
+            ")\n"
+            "logger = Logger(config)\n"
+            "for index in range(5):\n"
+            "    logger.info(f'record {index}')\n"
+        )
+        package_dir = os.path.dirname(os.path.dirname(Logges.__file__))
+        path_list = [package_dir, os.environ.get("PYTHONPATH", "")]
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(path_list))
+        subprocess.run([sys.executable, "-c", script, str(temp_dir)], env=env, check=True)
+
+        (path,) = temp_dir.glob("*.log")
+        assert [entry.message.strip() for entry in iter_log_file(path)] == [f"record {i}" for i in range(5)]
+
+    def test_logger_end_to_end(self, temp_dir: Path):
+        """Test a compressed logger through the file reader."""
+        config = LogConfig(name="app", log_dir=temp_dir, compression="gzip", print_to_console=False)
+        with Logger(config) as logger:
+            logger.info("started")
+            logger.warning("slow")
+
+        (path,) = temp_dir.glob("*.log")
+        assert detect_format(path) == "compressed"
+        assert [entry.level for entry in iter_log_file(path)] == ["INFO", "WARNING"]
+
@@ -0,0 +1,97 @@
+"""Tests for the log file catalog."""
+import os
+from pathlib import Path
+
+import pytest
+
+from Logges import catalog
+from Logges.catalog import CATALOG_FILE, LogCatalog
+
+
+@pytest.fixture
+def log_dir(tmp_path: Path) -> Path:
+    """Create a directory with dated, rotated, undated and unrelated files."""
+    for name in (
+        "2026-01-02_app.log",
+        "2026-01-01_app.log",
+        "2026-01-01_app.1.log",
+        "2026-01-03_worker.log",
+        "app.log",
+        "notes.txt",
+        ".2026-01-01_app.idx",
+    ):
+        (tmp_path / name).write_text("x")
+    os.utime(tmp_path / "app.log", (1767830400, 1767830400))  # 2026-01-08
+    catalog._catalogs.clear()
+    return tmp_path
+
+
+class TestLogCatalog:
+    """Test LogCatalog."""
+
+    def test_scan(self, log_dir: Path):
+        """Test that only log files are listed, ordered by date and name."""
+        logs = LogCatalog.open(log_dir)
+
+        assert [info.name for info in logs] == [
+            "2026-01-01_app.1.log",
+            "2026-01-01_app.log",
+            "2026-01-02_app.log",
+            "2026-01-03_worker.log",
+            "app.log",
+        ]
+        info = logs.find("2026-01-03_worker.log")
+        assert (info.date, info.logger, info.dated, info.size) == ("2026-01-03", "worker", True, 1)
+        assert logs.find("app.log").dated is False
+        assert "notes.txt" not in logs
+
+    def test_between(self, log_dir: Path):
+        """Test inclusive date range queries."""
+        logs = LogCatalog.open(log_dir)
+
+        assert [info.name for info in logs.between("2026-01-02", "2026-01-03")] == [
+            "2026-01-02_app.log",
+            "2026-01-03_worker.log",
+        ]
+        assert len(logs.between(max_date="2026-01-01")) == 2
+        assert len(logs.between(min_date="2026-01-04")) == 1
+        assert len(logs.between()) == 5
+
+    def test_cache_reused_until_directory_changes(self, log_dir: Path, monkeypatch):
+        """Test that the on-disk cache avoids rescans of unchanged directories."""
+        LogCatalog.open(log_dir)
+        assert (log_dir / CATALOG_FILE).exists()
+        catalog._catalogs.clear()
+
+        scans = []
+        refresh = LogCatalog.refresh
+        monkeypatch.setattr(LogCatalog, "refresh", lambda self: scans.append(1) or refresh(self))
+
+        assert len(LogCatalog.open(log_dir)) == 5
+        assert scans == []
+
+        (log_dir / "2026-01-04_app.log").write_text("x")
+        assert len(LogCatalog.open(log_dir)) == 6
+        assert scans == [1]
+
+    @pytest.mark.parametrize("in_memory", [True, False])
+    def test_undated_file_follows_appends(self, log_dir: Path, in_memory: bool):
+        """Test that appending to an undated file moves it to its new date."""
+        assert LogCatalog.open(log_dir).find("app.log").date == "2026-01-08"
+        if not in_memory:
+            catalog._catalogs.clear()
+
+        with open(log_dir / "app.log", "a") as f:
+            f.write("y")
+        os.utime(log_dir / "app.log", (1768089600, 1768089600))  # 2026-01-11
+
+        info = LogCatalog.open(log_dir).find("app.log")
+        assert (info.date, info.size) == ("2026-01-11", 2)
+        catalog._catalogs.clear()
+        recent = LogCatalog.open(log_dir).between(min_date="2026-01-10")
+        assert [info.name for info in recent] == ["app.log"]
+
+    def test_without_cache(self, log_dir: Path):
+        """Test that use_cache=False neither reads nor writes the cache."""
+        assert len(LogCatalog.open(log_dir, use_cache=False)) == 5
+        assert not (log_dir / CATALOG_FILE).exists()
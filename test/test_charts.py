@@ -0,0 +1,49 @@
+"""Tests for the export charts."""
+import xml.etree.ElementTree as ET
+
+import matplotlib.pyplot as plt
+
+from Logges.charts import bar_chart_drawing, bar_chart_svg, pie_chart_png, write_pie_chart
+
+COUNTS = {"DEBUG": 1, "INFO": 4, "WARNING": 2, "ERROR": 0, "CRITICAL": 1}
+
+
+class TestPieChart:
+    """Test the matplotlib pie chart."""
+
+    def test_png_is_cached_by_counts(self):
+        """Test that equal counts reuse the rendered image."""
+        png = pie_chart_png(COUNTS)
+        assert png.startswith(b"\x89PNG")
+        assert pie_chart_png(dict(COUNTS)) is png
+        assert pie_chart_png({**COUNTS, "ERROR": 3}) != png
+
+    def test_no_pyplot_figures(self):
+        """Test that rendering leaves no pyplot figure open."""
+        before = plt.get_fignums()
+        pie_chart_png({**COUNTS, "DEBUG": 7})
+        assert plt.get_fignums() == before
+
+    def test_no_records(self, tmp_path):
+        """Test that a log without records still gets an image."""
+        path = tmp_path / "pie_chart.png"
+        write_pie_chart(path, dict.fromkeys(COUNTS, 0))
+        assert path.read_bytes().startswith(b"\x89PNG")
+
+
+class TestBarCharts:
+    """Test the bar charts drawn without matplotlib."""
+
+    def test_svg(self):
+        """Test that bars are scaled to the largest count."""
+        svg = ET.fromstring(bar_chart_svg(COUNTS, width=400))
+        widths = [int(rect.get("width")) for rect in svg.iter("{http://www.w3.org/2000/svg}rect")]
+        assert len(widths) == 5
+        assert widths[1] == 400 - 80 - 60
+        assert widths[0] * 4 == widths[1] and widths[3] == 0
+
+    def test_drawing(self):
+        """Test that the PDF drawing has a label, bar and count per level."""
+        drawing = bar_chart_drawing(COUNTS, width=300)
+        assert drawing.width == 300
+        assert len(drawing.contents) == 3 * len(COUNTS)
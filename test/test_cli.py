@@ -0,0 +1,123 @@
+"""Tests for the CLI search helpers."""
+import json
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from Logges import FileHandler, LogLevel, LogRecord
+from Logges.cli import Logges_cli, search_log_file
+from Logges.matching import Matcher, MatchMode
+
+LINES = (
+    "[12:00:00] [   INFO   ] [a.py] [<module>:1]: hello world\n"
+    "[12:00:01] [  ERROR   ] [b.py] [connect:2]: hello timeout\n"
+    "[12:00:02] [  DEBUG   ] [a.py] [connect:3]: unrelated\n"
+)
+
+
+class TestSearchLogFile:
+    """Test search_log_file."""
+
+    def test_filters(self, tmp_path: Path):
+        """Test sentence, status, function and file filters."""
+        path = tmp_path / "2026-01-30_app.log"
+        path.write_text(LINES)
+
+        functions = [entry.function for entry in search_log_file(str(path), Matcher(["hello"]))]
+        assert functions == ["<module>:1", "connect:2"]
+        assert len(search_log_file(str(path), Matcher(["hello", "timeout"]))) == 3
+        assert search_log_file(str(path), Matcher(["hello"]), status_list=["ERROR"])[0].level == "ERROR"
+        assert search_log_file(str(path), Matcher(["hello"]), functions_list=["module"])[0].filename == "a.py"
+        assert search_log_file(str(path), Matcher(["hello"]), files_list=["c.py"]) == []
+
+    def test_json_lines(self, tmp_path: Path):
+        """Test that JSON Lines files are searched without the text index."""
+        path = tmp_path / "2026-01-30_app.log"
+        records = [
+            {"time": "12:00:00", "level": "INFO", "filename": "a.py", "function": "<module>", "line": 1,
+             "message": "hello world"},
+            {"time": "12:00:01", "level": "ERROR", "filename": "b.py", "function": "connect", "line": 2,
+             "message": "hello timeout"},
+        ]
+        path.write_text("".join(json.dumps(record) + "\n" for record in records))
+
+        entries = search_log_file(str(path), Matcher(["hello"]), status_list=["ERROR"])
+        assert [(entry.function, entry.message) for entry in entries] == [("connect:2", " hello timeout\n")]
+        assert not (tmp_path / ".2026-01-30_app.idx").exists()
+
+    def test_compressed(self, tmp_path: Path):
+        """Test that compressed files are searched block by block."""
+        path = tmp_path / "2026-01-30_app.log"
+        handler = FileHandler(path, compression="gzip", block_size=64)
+        for line in LINES.splitlines():
+            level = line[12:22].strip()
+            record = LogRecord("12:00:00", LogLevel[level], "", "a.py", "f", 1)
+            handler.emit(record, line)
+        handler.close()
+
+        entries = search_log_file(str(path), Matcher(["hello"]), status_list=["ERROR"])
+        assert [entry.function for entry in entries] == ["connect:2"]
+        assert len(search_log_file(str(path), Matcher(["hello"]))) == 2
+
+    def test_match_modes(self, tmp_path: Path):
+        """Test ALL mode and case-insensitive regex sentences."""
+        path = tmp_path / "2026-01-30_app.log"
+        path.write_text(LINES)
+
+        both = Matcher(["hello", "timeout"], mode=MatchMode.ALL)
+        assert [entry.function for entry in search_log_file(str(path), both)] == ["connect:2"]
+        pattern = Matcher([r"HELLO \w+"], ignore_case=True, regex=True)
+        assert len(search_log_file(str(path), pattern)) == 2
+
+    def test_parallel_matches_sequential(self, tmp_path: Path):
+        """Test that results from worker processes keep the file order."""
+        paths = []
+        for day in range(1, 5):
+            path = tmp_path / f"2026-01-0{day}_app.log"
+            path.write_text(LINES.replace("hello", f"hello day{day}"))
+            paths.append(str(path))
+
+        sequential = list(map(search_log_file, paths, repeat(Matcher(["hello"]))))
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            parallel = list(executor.map(search_log_file, paths, repeat(Matcher(["hello"]))))
+
+        assert parallel == sequential
+        assert [entries[0].message for entries in parallel] == [
+            f" hello day{day} world\n" for day in range(1, 5)
+        ]
+
+
+class TestSearchCommand:
+    """Test the search command."""
+
+    def test_search_in_log_dir_keeps_logs(self, tmp_path: Path, monkeypatch):
+        """Test that searching the current directory leaves its logs alone."""
+        path = tmp_path / "2026-01-30_app.log"
+        path.write_text(LINES)
+        monkeypatch.chdir(tmp_path)
+
+        result = CliRunner().invoke(Logges_cli, ["search", "-sen", "hello", "--log_dir", "."])
+
+        assert result.exit_code == 0, result.output
+        assert "2026-01-30_app.log" in result.output
+        assert path.read_text() == LINES
+        assert not [name for name in map(str, tmp_path.iterdir()) if "Export" in name]
+
+    def test_export_is_not_searched(self, tmp_path: Path, monkeypatch):
+        """Test that the export file written into the log directory isn't searched."""
+        (tmp_path / "2026-01-30_app.log").write_text(LINES)
+        (tmp_path / "found.log").write_text(LINES)
+        monkeypatch.chdir(tmp_path)
+
+        result = CliRunner().invoke(
+            Logges_cli,
+            ["search", "-sen", "hello", "--log_dir", ".", "--export", "log", "--export_name", "found"],
+        )
+
+        assert result.exit_code == 0, result.output
+        exported = (tmp_path / "found.log").read_text()
+        assert exported.count("hello") == 2
+        assert "(found.log)" not in exported
+        assert not list(tmp_path.glob(".found*"))
@@ -0,0 +1,117 @@
+"""Tests for precompiled format templates."""
+from pathlib import Path
+
+import pytest
+
+from Logges import LogConfig, Logger, LogLevel, LogRecord
+from Logges.exceptions import ConfigurationError, FormatterError
+from Logges.formatter import CompiledFormat, compile_format
+
+from .conftest import make_record
+
+TEMPLATES = [
+    "[{time}] [{level:^10}] [{filename}] [{function}]: {message}",
+    "{time} {level} {message}",
+    "{level!r:>12} {function:<20}|{message!s}",
+    "{{literal braces}} {message} {{}}",
+    "no fields at all",
+    "{message} (request={request_id})",
+]
+
+
+# Quotes and braces the compiled f-string must pass through unchanged
+MESSAGE = 'say "hi" {not a field}'
+
+
+def reference_format(format_string: str, record: LogRecord) -> str:
+    """Render a record the way str.format does."""
+    return format_string.format(
+        time=record.timestamp,
+        level=record.level.name,
+        filename=record.filename,
+        function=f"{record.function}:{record.line_number}",
+        message=record.message,
+        **record.extra,
+    )
+
+
+class TestCompiledFormat:
+    """Test CompiledFormat against str.format."""
+
+    @pytest.mark.parametrize("format_string", TEMPLATES)
+    def test_matches_str_format(self, format_string: str):
+        """Test that compiled output equals str.format output."""
+        record = make_record(MESSAGE, request_id="abc-123")
+        template = CompiledFormat(format_string)
+
+        assert template.compiled
+        assert template.render(record) == reference_format(format_string, record)
+
+    def test_fallback_for_complex_fields(self):
+        """Test that a nested format spec falls back to str.format."""
+        template = CompiledFormat("{message} {level:{width}}")
+        record = make_record(MESSAGE, LogLevel.WARNING, width="8")
+
+        assert not template.compiled
+        assert template.render(record) == "say \"hi\" {not a field} WARNING "
+
+    @pytest.mark.parametrize("format_string", ["{message} [{user}]", "{message} [{user:{width}}]"])
+    def test_missing_extra_field(self, format_string: str):
+        """Test that an extra field the record lacks renders empty, compiled or not."""
+        template = CompiledFormat(format_string)
+
+        assert template.render(make_record(MESSAGE)) == 'say "hi" {not a field} []'
+
+    def test_missing_extra_field_with_numeric_spec(self):
+        """Test that a missing field that can't take its format spec raises FormatterError."""
+        with pytest.raises(FormatterError):
+            CompiledFormat("{count:d}").render(make_record())
+
+    def test_invalid_format_string(self):
+        """Test that unbalanced braces are rejected."""
+        with pytest.raises(FormatterError):
+            CompiledFormat("{message")
+
+    @pytest.mark.parametrize("format_string", ["{message!z}", "{user.name!x}"])
+    def test_unknown_conversion(self, format_string: str):
+        """Test that conversions other than !s, !r and !a are rejected."""
+        with pytest.raises(FormatterError, match="conversion"):
+            CompiledFormat(format_string)
+
+    def test_compile_format_is_cached(self):
+        """Test that the same string compiles only once."""
+        assert compile_format("{message}") is compile_format("{message}")
+
+
+class TestLogConfigTemplate:
+    """Test the template cached on LogConfig."""
+
+    def test_invalid_format_rejected(self):
+        """Test that LogConfig validates the format string."""
+        with pytest.raises(ConfigurationError, match="Invalid format string"):
+            LogConfig(name="test", format_string="{message")
+        with pytest.raises(ConfigurationError, match="conversion"):
+            LogConfig(name="test", format_string="{x!z}")
+
+    def test_template_follows_format_string(self):
+        """Test that changing format_string recompiles the template."""
+        config = LogConfig(name="test", format_string="{message}")
+        assert config.template.render(make_record(MESSAGE)) == MESSAGE
+
+        config.format_string = "{level}"
+        assert config.template.render(make_record(level=LogLevel.WARNING)) == "WARNING"
+
+    def test_logger_without_extra_field(self, temp_dir: Path):
+        """Test that logging without a field the template uses doesn't raise."""
+        config = LogConfig(
+            name="app",
+            log_dir=temp_dir,
+            format_string="{message} req={request_id}",
+            print_to_console=False,
+        )
+        with Logger(config) as logger:
+            logger.info("started")
+            logger.info("handled", request_id="abc")
+
+        (path,) = temp_dir.glob("*.log")
+        assert path.read_text() == "started req=\nhandled req=abc\n"
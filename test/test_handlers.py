@@ -0,0 +1,394 @@
+"""Tests for Logges handlers."""
+import gzip
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from Logges import (
+    ConsoleHandler,
+    FileHandler,
+    LogConfig,
+    Logger,
+    LogHandler,
+    LogLevel,
+    LogRecord,
+    OverflowPolicy,
+    QueueHandler,
+    RotatingFileHandler,
+)
+from Logges.exceptions import HandlerError
+from Logges.timestamps import TimestampProvider
+
+from .conftest import make_record
+
+
+class RecordingHandler(LogHandler):
+    """Handler that remembers emitted messages, optionally waiting on a gate."""
+
+    def __init__(self, gate: threading.Event = None):
+        self.messages: list[str] = []
+        self.closed = False
+        self.gate = gate
+
+    def emit(self, record: LogRecord, formatted_message: str) -> None:
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+        self.messages.append(formatted_message)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class TestFileHandler:
+    """Test FileHandler in unbuffered and buffered mode."""
+
+    def test_unbuffered_writes_immediately(self, temp_log_file: Path):
+        """Test that the default mode writes every record straight to disk."""
+        handler = FileHandler(temp_log_file)
+        handler.emit(make_record(), "first")
+
+        assert temp_log_file.read_text() == "first\n"
+        handler.close()
+
+    def test_buffered_keeps_records_until_flush(self, temp_log_file: Path):
+        """Test that buffered mode holds INFO records in memory."""
+        handler = FileHandler(temp_log_file, buffered=True, flush_interval=3600)
+        handler.emit(make_record(), "buffered line")
+
+        assert temp_log_file.read_text() == ""
+
+        handler.flush()
+        assert temp_log_file.read_text() == "buffered line\n"
+        handler.close()
+
+    def test_buffered_flushes_on_level(self, temp_log_file: Path):
+        """Test that records at flush_level are written immediately."""
+        handler = FileHandler(temp_log_file, buffered=True, flush_interval=3600)
+        handler.emit(make_record("info"), "info line")
+        handler.emit(make_record("error", LogLevel.ERROR), "error line")
+
+        assert temp_log_file.read_text() == "info line\nerror line\n"
+        handler.close()
+
+    def test_buffered_flushes_when_full(self, temp_log_file: Path):
+        """Test that a full buffer is written out."""
+        handler = FileHandler(
+            temp_log_file, buffered=True, buffer_size=64, flush_interval=3600
+        )
+        for index in range(20):
+            handler.emit(make_record(), f"line {index:04d}")
+
+        assert temp_log_file.stat().st_size > 0
+        handler.close()
+        assert temp_log_file.read_text().count("\n") == 20
+
+    def test_buffered_flushes_when_idle(self, temp_log_file: Path):
+        """Test that flush_interval holds even if no further record arrives."""
+        handler = FileHandler(temp_log_file, buffered=True, flush_interval=0.2)
+        handler.emit(make_record(), "first")
+        handler.emit(make_record(), "second")
+
+        deadline = time.monotonic() + 5
+        while temp_log_file.stat().st_size == 0 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert temp_log_file.read_text() == "first\nsecond\n"
+        handler.close()
+
+    def test_close_releases_descriptor(self, temp_log_file: Path):
+        """Test that close() flushes and releases the open file."""
+        handler = FileHandler(temp_log_file, buffered=True, flush_interval=3600)
+        handler.emit(make_record(), "last words")
+        handler.close()
+
+        assert handler._stream is None
+        assert temp_log_file.read_text() == "last words\n"
+
+    def test_reopen_switches_file(self, temp_dir: Path):
+        """Test that reopen() moves writing to a new file."""
+        first = temp_dir / "2026-01-30_app.log"
+        second = temp_dir / "2026-01-31_app.log"
+        handler = FileHandler(first, buffered=True, flush_interval=3600)
+        handler.emit(make_record(), "day one")
+        handler.reopen(second)
+        handler.emit(make_record(), "day two")
+        handler.close()
+
+        assert first.read_text() == "day one\n"
+        assert second.read_text() == "day two\n"
+
+    def test_invalid_buffer_size(self, temp_log_file: Path):
+        """Test that a non-positive buffer size is rejected."""
+        with pytest.raises(HandlerError, match="buffer_size"):
+            FileHandler(temp_log_file, buffered=True, buffer_size=0)
+
+
+class TestBufferedLogger:
+    """Test the buffered file option through LogConfig."""
+
+    def test_logger_buffered_file(self, temp_dir: Path):
+        """Test that a buffered logger writes everything by close()."""
+        config = LogConfig(
+            name="buffered",
+            log_dir=temp_dir,
+            print_to_console=False,
+            buffered_file=True,
+            flush_interval=3600,
+        )
+        logger = Logger(config)
+        for index in range(100):
+            logger.info(f"message {index}")
+        logger.close()
+
+        content = list(temp_dir.glob("*.log"))[0].read_text()
+        assert content.count("\n") == 100
+        assert "message 99" in content
+
+
+class TestEmitBatch:
+    """Test batched emit on the built-in handlers."""
+
+    def test_default_emit_batch_loops(self):
+        """Test that the base implementation emits each record."""
+        target = RecordingHandler()
+        target.emit_batch([make_record(), make_record()], ["one", "two"])
+
+        assert target.messages == ["one", "two"]
+
+    @pytest.mark.parametrize("buffered", [False, True])
+    def test_file_handler_single_write(self, temp_log_file: Path, buffered: bool, monkeypatch):
+        """Test that FileHandler writes a batch with one write call."""
+        handler = FileHandler(temp_log_file, buffered=buffered)
+        writes = []
+        original_write = handler._write
+
+        def counting_write(data: bytes, level: LogLevel) -> None:
+            writes.append(data)
+            original_write(data, level)
+
+        monkeypatch.setattr(handler, "_write", counting_write)
+
+        handler.emit_batch([make_record(), make_record(level=LogLevel.ERROR)], ["one", "two"])
+        handler.close()
+
+        assert len(writes) == 1
+        assert temp_log_file.read_text() == "one\ntwo\n"
+
+    def test_console_handler_groups_streams(self, capsys):
+        """Test that ConsoleHandler writes one block per stream."""
+        handler = ConsoleHandler()
+        handler.emit_batch(
+            [make_record(), make_record(level=LogLevel.ERROR), make_record()],
+            ["info one", "error", "info two"],
+        )
+
+        captured = capsys.readouterr()
+        assert captured.out == "info one\ninfo two\n"
+        assert captured.err == "error\n"
+
+
+class FakeClock(TimestampProvider):
+    """Timestamp provider whose date is set by the test."""
+
+    def __init__(self, current_date: str):
+        super().__init__()
+        self.current_date = current_date
+
+    def date(self, current=None) -> str:
+        return self.current_date
+
+
+class TestRotatingFileHandler:
+    """Test daily and size-based rotation."""
+
+    def test_daily_file_name(self, temp_dir: Path):
+        """Test that records go to the dated file."""
+        handler = RotatingFileHandler(temp_dir, "app", clock=FakeClock("2026-01-30"))
+        handler.emit(make_record(), "first day")
+        handler.close()
+
+        assert (temp_dir / "2026-01-30_app.log").read_text() == "first day\n"
+
+    @pytest.mark.parametrize("buffered", [False, True])
+    def test_switches_file_at_midnight(self, temp_dir: Path, buffered: bool):
+        """Test that passing the midnight deadline moves to the next file."""
+        clock = FakeClock("2026-01-30")
+        handler = RotatingFileHandler(temp_dir, "app", clock=clock, buffered=buffered)
+        handler.emit(make_record(), "day one")
+
+        clock.current_date = "2026-01-31"
+        handler._rollover_at = 0  # the deadline has passed
+        handler.emit(make_record(), "day two")
+        handler.close()
+
+        assert (temp_dir / "2026-01-30_app.log").read_text() == "day one\n"
+        assert (temp_dir / "2026-01-31_app.log").read_text() == "day two\n"
+        assert handler._rollover_at == clock.next_midnight
+
+    def test_size_rotation(self, temp_dir: Path):
+        """Test that a full file is renamed to numbered backups."""
+        handler = RotatingFileHandler(temp_dir, "app", daily=False, max_bytes=25)
+        for index in range(5):
+            handler.emit(make_record(), f"record number {index}")
+        handler.close()
+
+        assert (temp_dir / "app.1.log").read_text() == "record number 0\n"
+        assert (temp_dir / "app.4.log").read_text() == "record number 3\n"
+        assert (temp_dir / "app.log").read_text() == "record number 4\n"
+
+    def test_backup_count_limits_files(self, temp_dir: Path):
+        """Test that old backups beyond backup_count are deleted."""
+        handler = RotatingFileHandler(
+            temp_dir, "app", daily=False, max_bytes=25, backup_count=2
+        )
+        for index in range(6):
+            handler.emit(make_record(), f"record number {index}")
+        handler.close()
+
+        names = sorted(path.name for path in temp_dir.iterdir())
+        assert names == ["app.4.log", "app.5.log", "app.log"]
+
+    def test_retention_across_days(self, temp_dir: Path):
+        """Test that old dated files count toward backup_count."""
+        for day in ("2026-01-27", "2026-01-28"):
+            (temp_dir / f"{day}_app.log").write_text("old\n")
+        (temp_dir / "2026-01-28_other.log").write_text("other logger\n")
+
+        clock = FakeClock("2026-01-29")
+        handler = RotatingFileHandler(temp_dir, "app", clock=clock, backup_count=2)
+        handler.emit(make_record(), "day three")
+        clock.current_date = "2026-01-30"
+        handler._rollover_at = 0
+        handler.emit(make_record(), "day four")
+        handler.close()
+
+        names = sorted(path.name for path in temp_dir.iterdir())
+        assert names == [
+            "2026-01-28_app.log",
+            "2026-01-28_other.log",
+            "2026-01-29_app.log",
+            "2026-01-30_app.log",
+        ]
+
+    def test_compress_rotated(self, temp_dir: Path):
+        """Test that finished files are gzipped in the background."""
+        handler = RotatingFileHandler(
+            temp_dir, "app", daily=False, max_bytes=25, compress=True
+        )
+        for index in range(3):
+            handler.emit(make_record(), f"record number {index}")
+        handler.close()
+
+        assert not (temp_dir / "app.1.log").exists()
+        with gzip.open(temp_dir / "app.1.log.gz", "rt") as f:
+            assert f.read() == "record number 0\n"
+        assert (temp_dir / "app.log").read_text() == "record number 2\n"
+
+    def test_rename_failure_raises_rotation_error(self, temp_dir: Path, monkeypatch):
+        """Test that a failed rename surfaces as RotationError from rotate()."""
+        from Logges import RotationError
+        import Logges.handlers as handlers_module
+
+        handler = RotatingFileHandler(temp_dir, "app", daily=False)
+        handler.emit(make_record(), "content")
+
+        def fail(*args):
+            raise OSError("read-only file system")
+
+        monkeypatch.setattr(handlers_module.os, "replace", fail)
+        with pytest.raises(RotationError, match="Cannot rename"):
+            handler.rotate()
+
+        # Writing keeps working after the failed rotation
+        handler.emit(make_record(), "more content")
+        handler.close()
+        assert (temp_dir / "app.log").read_text() == "content\nmore content\n"
+
+
+class TestQueueHandler:
+    """Test the background writer thread."""
+
+    def test_close_drains_queue(self):
+        """Test that every queued record is written before close() returns."""
+        target = RecordingHandler()
+        handler = QueueHandler([target])
+        for index in range(1000):
+            handler.emit(make_record(), f"message {index}")
+        handler.close()
+
+        assert target.messages == [f"message {index}" for index in range(1000)]
+        assert target.closed
+
+    def test_flush_waits_for_writer(self):
+        """Test that flush() returns only after queued records were written."""
+        target = RecordingHandler()
+        handler = QueueHandler([target])
+        handler.emit(make_record(), "one")
+        handler.emit(make_record(), "two")
+        handler.flush()
+
+        assert target.messages == ["one", "two"]
+        handler.close()
+
+    def test_drop_new_counts_dropped(self):
+        """Test that DROP_NEW discards incoming records when full."""
+        gate = threading.Event()
+        target = RecordingHandler(gate)
+        handler = QueueHandler([target], maxsize=2, overflow_policy=OverflowPolicy.DROP_NEW, batch_size=1)
+        handler.emit(make_record(), "in flight")
+        # Wait for the writer thread to pick up the first record
+        while handler._queue:
+            pass
+        for index in range(5):
+            handler.emit(make_record(), f"queued {index}")
+        gate.set()
+        handler.close()
+
+        assert handler.dropped == 3
+        assert target.messages == ["in flight", "queued 0", "queued 1"]
+
+    def test_drop_oldest_keeps_newest(self):
+        """Test that DROP_OLDEST discards the oldest queued records."""
+        gate = threading.Event()
+        target = RecordingHandler(gate)
+        handler = QueueHandler(
+            [target], maxsize=2, overflow_policy=OverflowPolicy.DROP_OLDEST, batch_size=1
+        )
+        handler.emit(make_record(), "in flight")
+        while handler._queue:
+            pass
+        for index in range(5):
+            handler.emit(make_record(), f"queued {index}")
+        gate.set()
+        handler.close()
+
+        assert handler.dropped == 3
+        assert target.messages == ["in flight", "queued 3", "queued 4"]
+
+    def test_emit_after_close_is_synchronous(self):
+        """Test that records logged after close() are not lost."""
+        target = RecordingHandler()
+        handler = QueueHandler([target])
+        handler.close()
+        handler.emit(make_record(), "late")
+
+        assert target.messages == ["late"]
+
+    def test_async_logger(self, temp_dir: Path):
+        """Test that an async logger writes all records by close()."""
+        config = LogConfig(
+            name="async",
+            log_dir=temp_dir,
+            print_to_console=False,
+            async_dispatch=True,
+        )
+        logger = Logger(config)
+        assert isinstance(logger.handlers[0], QueueHandler)
+
+        for index in range(500):
+            logger.info(f"message {index}")
+        logger.close()
+
+        content = list(temp_dir.glob("*.log"))[0].read_text()
+        assert content.count("\n") == 500
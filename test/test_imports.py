@@ -0,0 +1,42 @@
+"""Import-time regression tests."""
+import os
+import subprocess
+import sys
+
+import pytest
+
+import Logges
+
+# Only needed to export or display logs
+HEAVY_MODULES = ("matplotlib", "reportlab", "rich")
+
+
+def imported_modules(statement: str) -> list:
+    """Run ``statement`` in a fresh interpreter and return every module it imported."""
+    package_dir = os.path.dirname(os.path.dirname(Logges.__file__))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([package_dir, os.environ.get("PYTHONPATH", "")]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # "import time: self [us] | cumulative | imported package" lines
+    return [
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    ]
+
+
+class TestLazyImports:
+    """Test that heavy dependencies are only imported when used."""
+
+    @pytest.mark.parametrize("statement", ["import Logges", "from Logges import get_logger", "import Logges.cli"])
+    def test_no_heavy_modules(self, statement: str):
+        """Test that importing the package or the CLI doesn't load export dependencies."""
+        modules = imported_modules(statement)
+        assert "Logges" in modules
+        heavy = [name for name in modules if name.split(".")[0] in HEAVY_MODULES]
+        assert heavy == []
@@ -0,0 +1,87 @@
+"""Tests for the sidecar log index."""
+from pathlib import Path
+
+from Logges.index import LogIndex, index_path
+
+LINES = (
+    "[12:00:00] [   INFO   ] [a.py] [<module>:1]: hello world-42\n"
+    "[12:00:01] [  ERROR   ] [b.py] [connect:2]: boom: connection timeout\n"
+)
+
+
+class TestLogIndex:
+    """Test LogIndex."""
+
+    def write(self, tmp_path: Path, text: str = LINES) -> Path:
+        """Write ``text`` to a dated log file."""
+        path = tmp_path / "2026-01-30_app.log"
+        path.write_text(text)
+        return path
+
+    def test_builds_and_saves_sidecar(self, tmp_path: Path):
+        """Test that opening an index writes a hidden sidecar."""
+        path = self.write(tmp_path)
+        index = LogIndex.open(path)
+
+        assert index_path(path) == tmp_path / ".2026-01-30_app.idx"
+        assert index_path(path).exists()
+        assert index.offsets == [0, 60]
+        assert index.levels == {"INFO": [0], "ERROR": [1]}
+        assert index.functions == {"module": [0], "connect": [1]}
+        assert LogIndex.open(path).tokens == index.tokens
+
+    def test_candidates(self, tmp_path: Path):
+        """Test token, prefix/suffix and posting list lookups."""
+        index = LogIndex.open(self.write(tmp_path))
+
+        assert index.candidates(["timeout"]) == [1]
+        assert index.candidates(["ello wor"]) == [0]
+        assert index.candidates(["orld-4"]) == [0]
+        assert index.candidates(["missing"]) == []
+        assert index.candidates(["missing", "boom"]) == [1]
+        assert index.candidates([": "]) == [0, 1]
+        assert index.candidates(levels=["INFO"]) == [0]
+        assert index.candidates(["hello"], levels=["ERROR"]) == []
+        assert index.candidates(files=["b.py"], functions=["<connect>"]) == [1]
+
+    def test_search_reads_only_candidates(self, tmp_path: Path):
+        """Test that search decodes the candidate records."""
+        index = LogIndex.open(self.write(tmp_path))
+        entries = list(index.search(["timeout"]))
+
+        assert [entry.function for entry in entries] == ["connect:2"]
+        assert entries[0].message == " boom: connection timeout\n"
+
+    def test_incremental_update_on_growth(self, tmp_path: Path):
+        """Test that appended records and continuation lines are indexed."""
+        path = self.write(tmp_path)
+        LogIndex.open(path)
+        with open(path, "a") as log:
+            log.write("continuation line\n[12:00:02] [  DEBUG   ] [a.py] [f:3]: new\n")
+
+        index = LogIndex.open(path)
+        rebuilt = LogIndex(path)
+        rebuilt.update()
+
+        assert index.offsets == rebuilt.offsets == [0, 60, 147]
+        assert index.tokens == rebuilt.tokens
+        assert index.candidates(["continuation"]) == [1]
+        assert index.candidates(["new"]) == [2]
+
+    def test_rebuilds_when_rewritten(self, tmp_path: Path):
+        """Test that a file rewritten with other content is reindexed."""
+        path = self.write(tmp_path)
+        LogIndex.open(path)
+        path.write_text("[12:00:00] [   INFO   ] [a.py] [f:1]: rewritten\n")
+
+        index = LogIndex.open(path)
+        assert index.offsets == [0]
+        assert sorted(index.tokens) == ["rewritten"]
+
+    def test_unsaveable_sidecar(self, tmp_path: Path):
+        """Test that the index still works when the sidecar can't be saved."""
+        path = self.write(tmp_path)
+        index_path(path).mkdir()
+
+        assert LogIndex.open(path).candidates(["boom"]) == [1]
+        assert sorted(tmp_path.iterdir()) == sorted([index_path(path), path])
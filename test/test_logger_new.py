@@ -4,6 +4,7 @@ from pathlib import Path
 import pytest
 
 from Logges import Logger, LogConfig, LogLevel, get_logger
+from Logges.exceptions import ConfigurationError
 
 
 class TestLogConfig:
@@ -196,6 +197,191 @@ class TestLogger:
         assert "[1, 2, 3]" in content
 
 
+class TestLevelFiltering:
+    """Test the cached effective level and fast rejection path."""
+
+    def test_is_enabled_for(self, temp_dir: Path):
+        """Test is_enabled_for against the configured level."""
+        config = LogConfig(name="test", log_dir=temp_dir, level=LogLevel.WARNING)
+        logger = Logger(config, handlers=[])
+
+        assert not logger.is_enabled_for(LogLevel.DEBUG)
+        assert not logger.is_enabled_for(LogLevel.INFO)
+        assert logger.is_enabled_for(LogLevel.WARNING)
+        assert logger.is_enabled_for(LogLevel.CRITICAL)
+
+    def test_set_level_updates_filter(self, temp_dir: Path):
+        """Test that set_level changes what gets recorded."""
+        config = LogConfig(name="test", log_dir=temp_dir, print_to_console=False)
+        logger = Logger(config)
+
+        logger.debug("Hidden debug")
+        logger.set_level(LogLevel.DEBUG)
+        logger.debug("Visible debug")
+        logger.close()
+
+        assert config.level == LogLevel.DEBUG
+        content = list(temp_dir.glob("*.log"))[0].read_text()
+        assert "Hidden debug" not in content
+        assert "Visible debug" in content
+
+    def test_set_level_rejects_invalid(self, temp_dir: Path):
+        """Test that set_level only accepts LogLevel values."""
+        logger = Logger(LogConfig(name="test", log_dir=temp_dir), handlers=[])
+
+        with pytest.raises(ConfigurationError, match="Invalid log level"):
+            logger.set_level("DEBUG")  # type: ignore
+
+    def test_disabled_level_skips_caller_lookup(self, temp_dir: Path, monkeypatch):
+        """Test that suppressed calls return before frame introspection."""
+        logger = Logger(LogConfig(name="test", log_dir=temp_dir), handlers=[])
+
+        def fail(*args, **kwargs):
+            raise AssertionError("caller info must not be resolved")
+
+        monkeypatch.setattr(logger, "_get_caller_info", fail)
+        logger.debug("suppressed")
+        logger.log("suppressed", LogLevel.DEBUG)
+
+
+class TestLazyMessages:
+    """Test deferred message construction."""
+
+    def test_percent_args_formatted(self, temp_dir: Path):
+        """Test %-style arguments are applied to the message."""
+        config = LogConfig(name="test", log_dir=temp_dir, print_to_console=False)
+        with Logger(config) as logger:
+            logger.info("user %s loaded %d rows", "alice", 42)
+            logger.info("%(key)s=%(value)s", {"key": "mode", "value": "fast"})
+
+        content = list(temp_dir.glob("*.log"))[0].read_text()
+        assert "user alice loaded 42 rows" in content
+        assert "mode=fast" in content
+
+    def test_disabled_level_skips_repr(self, temp_dir: Path):
+        """Test that arguments are not converted when the level is disabled."""
+
+        class Expensive:
+            def __repr__(self):
+                raise AssertionError("repr must not be called")
+
+            __str__ = __repr__
+
+        logger = Logger(LogConfig(name="test", log_dir=temp_dir), handlers=[])
+        logger.debug("value: %r", Expensive())
+        logger.debug(lambda: repr(Expensive()))
+
+    def test_callable_evaluated_once(self, temp_dir: Path):
+        """Test that a thunk is called once even with several handlers."""
+        calls = []
+
+        def build() -> str:
+            calls.append(1)
+            return "built message"
+
+        config = LogConfig(name="test", log_dir=temp_dir, print_to_console=True)
+        with Logger(config) as logger:
+            assert len(logger.handlers) == 2
+            logger.info(build)
+
+        assert calls == [1]
+        content = list(temp_dir.glob("*.log"))[0].read_text()
+        assert "built message" in content
+
+    def test_bad_format_does_not_raise(self, temp_dir: Path):
+        """Test that a mismatched format string is logged instead of raising."""
+        config = LogConfig(name="test", log_dir=temp_dir, print_to_console=False)
+        with Logger(config) as logger:
+            logger.info("only %d", "not a number")
+
+        content = list(temp_dir.glob("*.log"))[0].read_text()
+        assert "only %d" in content
+
+
+class TestCallerInfo:
+    """Test caller-location resolution and its per-call-site cache."""
+
+    def test_records_calling_site(self, temp_dir: Path):
+        """Test that file and function of the caller are recorded."""
+        config = LogConfig(name="test", log_dir=temp_dir, print_to_console=False)
+        with Logger(config) as logger:
+            logger.info("via info")
+            logger.log("via log", LogLevel.INFO)
+
+        lines = list(temp_dir.glob("*.log"))[0].read_text().splitlines()
+        assert len(lines) == 2
+        for line in lines:
+            assert "[test_logger_new.py]" in line
+            assert "[test_records_calling_site:" in line
+
+    def test_cache_reused_per_call_site(self, temp_dir: Path):
+        """Test that repeated calls from one site share a cache entry."""
+        config = LogConfig(name="test", log_dir=temp_dir)
+        logger = Logger(config, handlers=[])
+
+        for _ in range(10):
+            logger.info("repeated")
+
+        own_code = [code for code in logger._caller_cache if code.co_name == "test_cache_reused_per_call_site"]
+        assert len(own_code) == 1
+
+    def test_capture_caller_disabled(self, temp_dir: Path):
+        """Test that caller capture can be switched off."""
+        config = LogConfig(
+            name="test", log_dir=temp_dir, print_to_console=False, capture_caller=False
+        )
+        with Logger(config) as logger:
+            logger.info("no caller")
+
+        content = list(temp_dir.glob("*.log"))[0].read_text()
+        assert "[unknown] [unknown:0]: no caller" in content
+
+    def test_set_ignored_files_invalidates_cache(self, temp_dir: Path):
+        """Test that changing ignored files takes effect for cached sites."""
+        config = LogConfig(name="test", log_dir=temp_dir, print_to_console=False)
+        logger = Logger(config)
+
+        def emit(message: str) -> None:
+            logger.info(message)
+
+        emit("before ignore")
+        logger.set_ignored_files(["TEST_LOGGER_NEW.py"])
+        emit("while ignored")
+        logger.set_ignored_files([])
+        emit("after ignore")
+        logger.close()
+
+        content = list(temp_dir.glob("*.log"))[0].read_text()
+        assert "before ignore" in content
+        assert "while ignored" not in content
+        assert "after ignore" in content
+
+
+class TestLogMany:
+    """Test bulk logging through log_many()."""
+
+    def test_log_many_writes_all(self, temp_dir: Path):
+        """Test that every message is written with the caller's location."""
+        config = LogConfig(name="test", log_dir=temp_dir, print_to_console=False)
+        with Logger(config) as logger:
+            logger.log_many((f"line {index}" for index in range(3000)), LogLevel.INFO)
+
+        lines = list(temp_dir.glob("*.log"))[0].read_text().splitlines()
+        assert len(lines) == 3000
+        assert lines[-1].endswith("line 2999")
+        assert "[test_log_many_writes_all:" in lines[0]
+
+    def test_log_many_respects_level(self, temp_dir: Path):
+        """Test that a disabled level does not consume the iterable."""
+        logger = Logger(LogConfig(name="test", log_dir=temp_dir), handlers=[])
+
+        def messages():
+            raise AssertionError("messages must not be consumed")
+            yield  # pragma: no cover
+
+        logger.log_many(messages(), LogLevel.DEBUG)
+
+
 class TestGetLogger:
     """Test the get_logger convenience function."""
     
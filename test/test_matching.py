@@ -0,0 +1,53 @@
+"""Tests for compiled multi-pattern matching."""
+import pytest
+
+from Logges import Matcher, MatchMode, SearchError
+
+
+class TestMatcher:
+    """Test Matcher."""
+
+    def test_any_mode(self):
+        """Test that any single pattern is enough."""
+        matcher = Matcher(["timeout", "refused"])
+
+        assert matcher.matches("connection refused")
+        assert matcher.matches("read timeout")
+        assert not matcher.matches("all good")
+
+    def test_all_mode(self):
+        """Test that every pattern must occur, in any order and across lines."""
+        matcher = Matcher(["b", "ab", "c"], mode=MatchMode.ALL)
+
+        assert matcher.matches("c\nxab")
+        assert not matcher.matches("ab only")
+
+    def test_plain_text_is_escaped(self):
+        """Test that plain patterns are not interpreted as regular expressions."""
+        matcher = Matcher(["a.c", "(x"])
+
+        assert matcher.matches("1 (x 2")
+        assert not matcher.matches("abc")
+        assert matcher.plain
+
+    def test_ignore_case_and_regex(self):
+        """Test case-insensitive and regex modes."""
+        assert Matcher(["ERROR"], ignore_case=True).matches("an error")
+        assert Matcher([r"user \d+"], regex=True).matches("user 42 logged in")
+        assert not Matcher([r"user \d+"]).matches("user 42 logged in")
+
+    def test_matching_patterns(self):
+        """Test that the patterns found are reported in query order."""
+        matcher = Matcher(["c", "a", "z"])
+        assert matcher.matching_patterns("abc") == ["c", "a"]
+
+    def test_empty(self):
+        """Test empty queries and empty patterns."""
+        assert not Matcher([]).matches("anything")
+        assert not Matcher([], mode=MatchMode.ALL).matches("anything")
+        assert Matcher([""]).matches("anything")
+
+    def test_invalid_regex(self):
+        """Test that invalid regular expressions raise SearchError."""
+        with pytest.raises(SearchError):
+            Matcher(["(unclosed"], regex=True)
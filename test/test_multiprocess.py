@@ -0,0 +1,217 @@
+"""Tests for several processes logging to one file, and for handlers across fork()."""
+import gzip
+import os
+import signal
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import Logges
+from Logges import (
+    FileHandler,
+    LogConfig,
+    Logger,
+    LogLevel,
+    QueueHandler,
+    RotatingFileHandler,
+)
+from Logges.blocks import BLOCK_MAGIC
+from Logges.parser import iter_log_file
+from Logges.serializers import BINARY_MAGIC, BinarySerializer
+
+from .conftest import make_record
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+
+WORKERS = 4
+
+
+def run_workers(target, count: int = WORKERS) -> None:
+    """Run ``target(index)`` in ``count`` forked children and check they succeeded."""
+    pids = []
+    for index in range(count):
+        pid = os.fork()
+        if pid == 0:
+            status = 1
+            try:
+                signal.alarm(30)
+                target(index)
+                status = 0
+            finally:
+                os._exit(status)
+        pids.append(pid)
+    for pid in pids:
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+
+
+def line(worker: int, index: int, size: int) -> str:
+    """A recognisable line of ``size`` characters."""
+    head = f"worker {worker} record {index} "
+    return head + "x" * (size - len(head))
+
+
+def formatted(message: str) -> str:
+    """A text line that the log parser reads back as ``message``."""
+    return f"[12:00:00] [   INFO   ] [app.py] [main:1]: {message}"
+
+
+class TestSharedFile:
+    """Test several processes appending to the same file."""
+
+    @pytest.mark.parametrize("buffered", [False, True])
+    def test_large_records_do_not_interleave(self, temp_dir: Path, buffered: bool):
+        """Test that records larger than the buffer and PIPE_BUF stay whole."""
+        path = temp_dir / "app.log"
+
+        def work(worker: int) -> None:
+            handler = FileHandler(path, multiprocess=True, buffered=buffered, buffer_size=16 * 1024)
+            for index in range(100):
+                size = 100 if index % 2 else 20_000
+                handler.emit(make_record(""), line(worker, index, size))
+            handler.close()
+
+        run_workers(work)
+        lines = path.read_text().splitlines()
+        assert len(lines) == WORKERS * 100
+        expected = {line(w, i, 100 if i % 2 else 20_000) for w in range(WORKERS) for i in range(100)}
+        assert set(lines) == expected
+
+    def test_binary_writes_are_self_contained(self, temp_dir: Path):
+        """Test that interned strings of different processes don't get mixed up."""
+        path = temp_dir / "app.log"
+
+        def work(worker: int) -> None:
+            handler = FileHandler(path, multiprocess=True, serializer=BinarySerializer())
+            for index in range(50):
+                handler.emit(make_record(f"{worker}", function=f"worker{worker}_{index % 5}"), "")
+            handler.emit_batch([make_record(f"{worker}", function=f"worker{worker}_batch")] * 2, ["", ""])
+            handler.close()
+
+        run_workers(work)
+        data = path.read_bytes()
+        assert data.startswith(BINARY_MAGIC) and data.count(BINARY_MAGIC) == 1
+        entries = list(iter_log_file(path))
+        assert len(entries) == WORKERS * 52
+        assert all(entry.function.startswith(f"worker{entry.message.strip()}_") for entry in entries)
+
+    def test_compressed_blocks(self, temp_dir: Path):
+        """Test that the file header is written once and every block is kept."""
+        path = temp_dir / "app.log"
+
+        def work(worker: int) -> None:
+            handler = FileHandler(path, multiprocess=True, compression="gzip", block_size=2000)
+            for index in range(100):
+                handler.emit(make_record(""), formatted(line(worker, index, 80)))
+            handler.close()
+
+        run_workers(work)
+        assert path.read_bytes().count(BLOCK_MAGIC) == 1
+        messages = [entry.message.strip() for entry in iter_log_file(path)]
+        assert sorted(messages) == sorted(line(w, i, 80) for w in range(WORKERS) for i in range(100))
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_size_rotation(self, temp_dir: Path, compress: bool):
+        """Test that workers rotating together lose and duplicate no record."""
+
+        def work(worker: int) -> None:
+            handler = RotatingFileHandler(
+                temp_dir, "app", daily=False, max_bytes=10_000, compress=compress, multiprocess=True
+            )
+            for index in range(300):
+                handler.emit(make_record(""), line(worker, index, 99))
+            handler.close()
+
+        run_workers(work)
+        lines = []
+        for path in temp_dir.glob("app*"):
+            opener = gzip.open if path.suffix == ".gz" else open
+            with opener(path, "rt") as f:
+                file_lines = f.read().splitlines()
+            assert len(file_lines) <= 10_000 // 100 + WORKERS
+            lines += file_lines
+        assert sorted(lines) == sorted(line(w, i, 99) for w in range(WORKERS) for i in range(300))
+        assert len(list(temp_dir.glob("app*"))) >= WORKERS * 300 // 100
+        assert not list(temp_dir.glob("*.tmp"))
+
+    def test_foreign_file_moved_aside_once(self, temp_dir: Path):
+        """Test that workers starting on a file of another format move it aside once."""
+        (temp_dir / "app.log").write_text(formatted("old") + "\n")
+
+        def work(worker: int) -> None:
+            handler = RotatingFileHandler(
+                temp_dir, "app", daily=False, serializer=BinarySerializer(), multiprocess=True
+            )
+            handler.emit(make_record(f"worker {worker}"), "")
+            handler.close()
+
+        run_workers(work)
+        assert sorted(path.name for path in temp_dir.iterdir()) == ["app.1.log", "app.log"]
+        assert [entry.message.strip() for entry in iter_log_file(temp_dir / "app.1.log")] == ["old"]
+        messages = [entry.message.strip() for entry in iter_log_file(temp_dir / "app.log")]
+        assert sorted(messages) == [f"worker {w}" for w in range(WORKERS)]
+
+    def test_pending_records_written_at_exit(self, temp_dir: Path):
+        """Test that buffered records of a handler never closed reach the file at exit."""
+        path = temp_dir / "app.log"
+        script = (
+            "import sys\n"
+            "from pathlib import Path\n"
+            "from Logges import FileHandler, LogLevel, LogRecord\n"
+            "path = Path(sys.argv[1])\n"
+            "handler = FileHandler(path, multiprocess=True, buffered=True, flush_interval=60)\n"
+            "for index in range(5):\n"
+            "    message = f'record {index}'\n"
+            "    record = LogRecord('12:00:00', LogLevel.INFO, message, 'app.py', 'main', 1)\n"
+            "    handler.emit(record, message)\n"
+        )
+        package_dir = os.path.dirname(os.path.dirname(Logges.__file__))
+        path_list = [package_dir, os.environ.get("PYTHONPATH", "")]
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(path_list))
+        subprocess.run([sys.executable, "-c", script, str(path)], env=env, check=True)
+
+        assert path.read_text().splitlines() == [f"record {i}" for i in range(5)]
+
+    def test_logger_option(self, temp_dir: Path):
+        """Test that LogConfig.multiprocess reaches the file handler."""
+        config = LogConfig(name="app", log_dir=temp_dir, multiprocess=True, print_to_console=False)
+        with Logger(config) as logger:
+            assert logger.handlers[0].multiprocess
+            logger.info("started")
+        (path,) = temp_dir.glob("*.log")
+        assert "started" in path.read_text()
+
+
+class TestFork:
+    """Test handlers used on both sides of a fork()."""
+
+    @pytest.mark.parametrize("options", [{"buffered": True}, {"compression": "gzip"}, {"multiprocess": True, "buffered": True}])
+    def test_child_does_not_repeat_parent_records(self, temp_dir: Path, options: dict):
+        """Test that records buffered before the fork are written once."""
+        path = temp_dir / "app.log"
+        handler = FileHandler(path, flush_level=LogLevel.CRITICAL, flush_interval=60, **options)
+        handler.emit(make_record("parent"), formatted("parent"))
+
+        def work(_: int) -> None:
+            handler.emit(make_record("child"), formatted("child"))
+            handler.close()
+
+        run_workers(work, count=2)
+        handler.close()
+        assert sorted(entry.message.strip() for entry in iter_log_file(path)) == ["child", "child", "parent"]
+
+    def test_queue_handler_in_child(self, temp_dir: Path):
+        """Test that a child gets a working writer thread of its own."""
+        path = temp_dir / "app.log"
+        handler = QueueHandler([FileHandler(path)])
+        handler.emit(make_record("parent"), "parent")
+
+        def work(_: int) -> None:
+            handler.emit(make_record("child"), "child")
+            handler.close()
+
+        run_workers(work, count=2)
+        handler.close()
+        assert sorted(path.read_text().splitlines()) == ["child", "child", "parent"]
@@ -0,0 +1,97 @@
+"""Tests for the streaming log parser."""
+from pathlib import Path
+
+from Logges.parser import LogEntry, detect_format, iter_json_lines, iter_log_file, iter_logs
+
+
+class TestIterLogs:
+    """Test iter_logs and iter_log_file."""
+
+    def test_parses_fields(self, sample_log_file: Path):
+        """Test that every header field is extracted."""
+        entries = list(iter_log_file(sample_log_file))
+
+        assert len(entries) == 5
+        assert entries[0] == LogEntry(
+            "12:34:56", "DEBUG", "test.py", "test_func:10", " Debug message\n"
+        )
+        assert [entry.level for entry in entries] == [
+            "DEBUG",
+            "INFO",
+            "WARNING",
+            "ERROR",
+            "CRITICAL",
+        ]
+
+    def test_multiline_messages(self):
+        """Test that continuation lines belong to the previous record."""
+        lines = [
+            "[12:00:00] [   INFO   ] [a.py] [f:1]: first line\n",
+            "second line\n",
+            "  [not a header]\n",
+            "[12:00:01] [  ERROR   ] [a.py] [f:2]: next\n",
+        ]
+        entries = list(iter_logs(lines))
+
+        assert len(entries) == 2
+        assert entries[0].message == " first line\nsecond line\n  [not a header]\n"
+        assert entries[1].message == " next\n"
+
+    def test_message_with_colons(self):
+        """Test that colons in the message don't confuse the parser."""
+        line = "[12:00:00] [   INFO   ] [a.py] [f:1]: url=http://x:80/y\n"
+        entry = next(iter_logs([line]))
+
+        assert entry.function == "f:1"
+        assert entry.message == " url=http://x:80/y\n"
+
+    def test_other_timestamp_formats(self):
+        """Test that longer timestamps (milliseconds, ISO) are understood."""
+        line = "[2026-01-30T12:00:00.123+00:00] [ WARNING  ] [a.py] [f:1]: hi\n"
+        entry = next(iter_logs([line]))
+
+        assert entry.time == "2026-01-30T12:00:00.123+00:00"
+        assert entry.level == "WARNING"
+
+    def test_skips_leading_garbage(self):
+        """Test that text before the first record is ignored."""
+        lines = ["garbage\n", "[12:00:00] [   INFO   ] [a.py] [f:1]: ok\n"]
+        assert [entry.message for entry in iter_logs(lines)] == [" ok\n"]
+
+    def test_is_lazy(self):
+        """Test that records are yielded before the input is exhausted."""
+        def lines():
+            yield "[12:00:00] [   INFO   ] [a.py] [f:1]: one\n"
+            yield "[12:00:01] [   INFO   ] [a.py] [f:1]: two\n"
+            raise AssertionError("parser read too far")
+
+        assert next(iter_logs(lines())).message == " one\n"
+
+
+class TestStructuredFormats:
+    """Test detect_format and iter_json_lines."""
+
+    def test_detect_format(self, tmp_path: Path):
+        """Test that the format is told from the first byte."""
+        path = tmp_path / "app.log"
+        for data, expected in (
+            (b"", "text"),
+            (b"[12:00:00] [   INFO   ] [a.py] [f:1]: ok\n", "text"),
+            (b'{"level":"INFO"}\n', "jsonl"),
+            (b"\x86\xa4time", "msgpack"),
+            (b"LGB\x01", "binary"),
+        ):
+            path.write_bytes(data)
+            assert detect_format(path) == expected
+
+    def test_iter_json_lines(self):
+        """Test field mapping and that malformed lines are skipped."""
+        lines = [
+            '{"time":"2026-01-30T12:00:00","level":"ERROR","filename":"a.py","function":"f","line":3,"message":"x"}\n',
+            "\n",
+            '{"time":"2026-01-30T12:00:01","level":"INFO","message":"cut',
+            "[1, 2]\n",
+        ]
+        assert list(iter_json_lines(lines)) == [
+            LogEntry("2026-01-30T12:00:00", "ERROR", "a.py", "f:3", " x\n"),
+        ]
@@ -0,0 +1,66 @@
+"""Tests for the memory-mapped log reader."""
+from pathlib import Path
+
+from Logges.parser import iter_log_file
+from Logges.reader import MappedLogReader
+
+LINES = (
+    "leading garbage\n"
+    "[12:00:00] [   INFO   ] [a.py] [f:1]: first line\n"
+    "[not a header] with timeout inside\n"
+    "[12:00:01] [  ERROR   ] [b.py] [g:2]: timeout: url=http://x:80/y\n"
+    "[12:00:02] [  DEBUG   ] [a.py] [f:3]: last\n"
+)
+
+
+class TestMappedLogReader:
+    """Test MappedLogReader."""
+
+    def write(self, tmp_path: Path, text: str = LINES) -> Path:
+        """Write ``text`` to a dated log file."""
+        path = tmp_path / "2026-01-30_app.log"
+        path.write_bytes(text.encode())
+        return path
+
+    def test_matches_streaming_parser(self, tmp_path: Path, sample_log_file: Path):
+        """Test that decoded entries equal the streaming parser's."""
+        for path in (self.write(tmp_path), sample_log_file):
+            with MappedLogReader(path) as reader:
+                assert list(reader.entries()) == list(iter_log_file(path))
+
+    def test_search_decodes_matching_records_once(self, tmp_path: Path):
+        """Test that search yields each candidate record once, in order."""
+        with MappedLogReader(self.write(tmp_path)) as reader:
+            entries = list(reader.search([b"timeout", b"first"]))
+
+        assert [entry.function for entry in entries] == ["f:1", "g:2"]
+        assert entries[0].message == " first line\n[not a header] with timeout inside\n"
+
+    def test_search_ignores_leading_text(self, tmp_path: Path):
+        """Test that hits before the first record are not reported."""
+        with MappedLogReader(self.write(tmp_path)) as reader:
+            assert list(reader.search([b"garbage"])) == []
+            assert list(reader.search([])) == []
+
+    def test_search_empty_needle_matches_everything(self, tmp_path: Path):
+        """Test that an empty needle behaves like ``"" in message``."""
+        with MappedLogReader(self.write(tmp_path)) as reader:
+            assert len(list(reader.search([b"nothing", b""]))) == 3
+
+    def test_records_are_zero_copy(self, tmp_path: Path):
+        """Test that undecoded records expose memoryview fields."""
+        with MappedLogReader(self.write(tmp_path)) as reader:
+            records = list(reader.records(levels=["ERROR"]))
+            assert len(records) == 1
+            record = records[0]
+            assert isinstance(record.message, memoryview)
+            assert bytes(record.level) == b"ERROR"
+            assert bytes(record.filename) == b"b.py"
+            assert record.decode().time == "12:00:01"
+            del record, records
+
+    def test_empty_file(self, tmp_path: Path):
+        """Test that empty files can be opened and yield nothing."""
+        with MappedLogReader(self.write(tmp_path, "")) as reader:
+            assert len(reader) == 0
+            assert list(reader.entries()) == []
@@ -0,0 +1,267 @@
+"""Tests for the record serializers and structured log files."""
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from Logges import (
+    BinarySerializer,
+    FileHandler,
+    JsonLinesSerializer,
+    LogConfig,
+    Logger,
+    LogLevel,
+    RotatingFileHandler,
+    TextSerializer,
+)
+from Logges.exceptions import ConfigurationError, HandlerError, LogFileError, LogFormatError
+from Logges.parser import iter_binary, iter_log_file, iter_msgpack
+from Logges.serializers import BINARY_MAGIC, get_serializer
+
+from .conftest import make_record
+
+
+class TestJsonLinesSerializer:
+    """Test the JSON Lines serializer."""
+
+    def test_fields(self):
+        """Test that every field is kept separate, with a full ISO time."""
+        line = JsonLinesSerializer().serialize(make_record("say \"hi\"\nbye", user="ü"), "ignored")
+        assert line.endswith(b"\n") and line.count(b"\n") == 1
+
+        fields = json.loads(line)
+        assert fields["level"] == "INFO"
+        assert fields["message"] == "say \"hi\"\nbye"
+        assert (fields["filename"], fields["function"], fields["line"]) == ("app.py", "main", 1)
+        assert fields["extra"] == {"user": "ü"}
+        assert fields["time"].startswith("2026-01-30T") and fields["time"][19:23] == ".789"
+
+    def test_no_extra_and_unserializable_values(self):
+        """Test that empty extra is left out and other values are written as text."""
+        assert "extra" not in json.loads(JsonLinesSerializer().serialize(make_record(), ""))
+        fields = json.loads(JsonLinesSerializer().serialize(make_record(path=Path("a")), ""))
+        assert fields["extra"] == {"path": "a"}
+
+    def test_batch(self):
+        """Test that a batch is the concatenation of single records."""
+        serializer = JsonLinesSerializer()
+        records = [make_record("one"), make_record("two")]
+        assert serializer.serialize_batch(records, ["", ""]) == b"".join(
+            serializer.serialize(record, "") for record in records
+        )
+
+
+class TestFileFormats:
+    """Test writing and reading structured log files."""
+
+    def test_unknown_format(self):
+        """Test that unknown formats are rejected."""
+        with pytest.raises(ConfigurationError):
+            LogConfig(name="app", file_format="xml")
+        with pytest.raises(HandlerError):
+            get_serializer("xml")
+
+    def test_text_is_default(self, temp_dir: Path):
+        """Test that the default serializer writes the formatted line."""
+        path = temp_dir / "app.log"
+        handler = FileHandler(path)
+        assert isinstance(handler.serializer, TextSerializer)
+        handler.emit(make_record(), "[12:34:56] formatted")
+        handler.close()
+        assert path.read_text() == "[12:34:56] formatted\n"
+
+    def test_jsonl_round_trip(self, temp_dir: Path):
+        """Test that a jsonl logger's file reads back through iter_log_file."""
+        config = LogConfig(
+            name="app", log_dir=temp_dir, file_format="jsonl", print_to_console=False, level=LogLevel.DEBUG
+        )
+        with Logger(config) as logger:
+            logger.info("started", port=8080)
+            logger.error("multi\nline")
+
+        (path,) = temp_dir.glob("*.log")
+        assert [json.loads(line)["level"] for line in path.read_text().splitlines()] == ["INFO", "ERROR"]
+        entries = list(iter_log_file(path))
+        assert [entry.level for entry in entries] == ["INFO", "ERROR"]
+        assert entries[1].message == " multi\nline\n"
+        assert entries[0].function.startswith("test_jsonl_round_trip:")
+
+    def test_msgpack_round_trip(self, temp_dir: Path):
+        """Test that msgpack records read back through iter_log_file."""
+        pytest.importorskip("msgpack")
+        path = temp_dir / "app.log"
+        handler = FileHandler(path, serializer=get_serializer("msgpack"))
+        handler.emit_batch([make_record("one"), make_record("two", n=1)], ["", ""])
+        handler.close()
+
+        entries = list(iter_log_file(path))
+        assert [entry.message for entry in entries] == [" one\n", " two\n"]
+        assert entries[0].function == "main:1"
+
+    def test_refuses_other_format(self, temp_dir: Path):
+        """Test that a handler doesn't append records to a file of another format."""
+        text = temp_dir / "text.log"
+        text.write_text("[12:34:56] formatted\n")
+        with pytest.raises(LogFormatError, match="holds text records"):
+            FileHandler(text, serializer=BinarySerializer())
+
+        binary = temp_dir / "binary.log"
+        handler = FileHandler(binary, serializer=BinarySerializer())
+        handler.emit(make_record(), "")
+        handler.close()
+        with pytest.raises(LogFormatError, match="holds binary records"):
+            FileHandler(binary)
+
+        handler = FileHandler(temp_dir / "app.log", serializer=BinarySerializer())
+        with pytest.raises(LogFormatError):
+            handler.reopen(text)
+        handler.close()
+        assert text.read_text() == "[12:34:56] formatted\n"
+
+    def test_text_and_jsonl_are_not_told_apart(self, temp_dir: Path):
+        """Test that a text log starting with a brace is appended to, not refused."""
+        config = LogConfig(
+            name="svc",
+            log_dir=temp_dir,
+            format_string="{message}",
+            daily_rotation=False,
+            print_to_console=False,
+        )
+        with Logger(config) as logger:
+            logger.info('{"a": 1}')
+        with Logger(config) as logger:
+            logger.info("restarted")
+
+        assert [path.name for path in temp_dir.iterdir()] == ["svc.log"]
+        assert (temp_dir / "svc.log").read_text() == '{"a": 1}\nrestarted\n'
+
+    def test_logger_fails_on_other_format(self, temp_dir: Path):
+        """Test that a logger refused its file raises instead of dropping file output."""
+        config = LogConfig(name="svc", log_dir=temp_dir, daily_rotation=False, print_to_console=False)
+        with Logger(config) as logger:
+            logger.info("as text")
+
+        config = LogConfig(
+            name="svc",
+            log_dir=temp_dir,
+            daily_rotation=False,
+            file_format="binary",
+            print_to_console=False,
+        )
+        with pytest.raises(LogFormatError):
+            Logger(config)
+
+    def test_format_switch_mid_day(self, temp_dir: Path):
+        """Test that switching file_format moves the day's file aside."""
+        with Logger(LogConfig(name="app", log_dir=temp_dir, print_to_console=False)) as logger:
+            logger.info("as text")
+        config = LogConfig(
+            name="app", log_dir=temp_dir, file_format="binary", print_to_console=False
+        )
+        with Logger(config) as logger:
+            logger.info("as binary")
+
+        (current,) = temp_dir.glob("*_app.log")
+        (backup,) = temp_dir.glob("*_app.1.log")
+        assert [entry.message.strip() for entry in iter_log_file(current)] == ["as binary"]
+        assert [entry.message.strip() for entry in iter_log_file(backup)] == ["as text"]
+
+    def test_msgpack_missing(self, monkeypatch):
+        """Test the errors when msgpack is not installed."""
+        monkeypatch.setitem(sys.modules, "msgpack", None)
+        with pytest.raises(HandlerError):
+            get_serializer("msgpack")
+        with pytest.raises(LogFileError):
+            list(iter_msgpack(io.BytesIO(b"\x80")))
+
+
+class TestBinaryFormat:
+    """Test the binary serializer and decoder."""
+
+    def test_strings_are_interned(self):
+        """Test that filenames and functions are written once."""
+        serializer = BinarySerializer()
+        first = serializer.serialize(make_record("one"), "")
+        second = serializer.serialize(make_record("two"), "")
+        assert first.count(b"app.py") == first.count(b"main") == 1
+        assert b"app.py" not in second and b"main" not in second
+        assert len(second) < len(first)
+
+        entries = list(iter_binary(io.BytesIO(BINARY_MAGIC + first + second)))
+        assert [entry.message for entry in entries] == [" one\n", " two\n"]
+        assert entries[0].level == "INFO" and entries[0].filename == "app.py"
+        assert entries[0].function == "main:1"
+        assert entries[0].time.startswith("2026-01-30T") and entries[0].time[19:23] == ".789"
+
+    def test_long_strings_cut_between_characters(self):
+        """Test that a string over the length limit is cut without splitting a character."""
+        function = "é" * 40_000  # two bytes each: the limit of 65_535 falls inside one
+        data = BinarySerializer().serialize(make_record(function=function), "")
+
+        (entry,) = iter_binary(io.BytesIO(BINARY_MAGIC + data))
+        assert entry.function == "é" * 32_767 + ":1"
+
+    def test_truncated_and_corrupt(self):
+        """Test that a half-written record is skipped and garbage is reported."""
+        serializer = BinarySerializer()
+        data = BINARY_MAGIC + serializer.serialize(make_record("kept"), "") + serializer.serialize(make_record("cut"), "")
+        assert [entry.message for entry in iter_binary(io.BytesIO(data[:-2]))] == [" kept\n"]
+        with pytest.raises(LogFileError):
+            list(iter_binary(io.BytesIO(data + b"\xff")))
+        with pytest.raises(LogFileError):
+            list(iter_binary(io.BytesIO(b"[12:00:00]")))
+
+    def test_small_read_blocks(self, monkeypatch):
+        """Test that entries spanning read blocks are decoded."""
+        monkeypatch.setattr("Logges.parser.BINARY_READ_SIZE", 7)
+        serializer = BinarySerializer()
+        data = BINARY_MAGIC + serializer.serialize_batch(
+            [make_record("x" * 20, function=f"f{index}", n=index) for index in range(5)], [""] * 5
+        )
+        assert [entry.function for entry in iter_binary(io.BytesIO(data))] == [f"f{i}:1" for i in range(5)]
+
+    @pytest.mark.parametrize("buffered", [False, True])
+    def test_files_are_self_contained(self, temp_dir: Path, buffered: bool):
+        """Test that every file a handler starts carries the strings it needs."""
+        handler = RotatingFileHandler(
+            temp_dir, "app", daily=False, max_bytes=150, serializer=BinarySerializer(), buffered=buffered
+        )
+        for index in range(6):
+            handler.emit(make_record(f"record {index}"), "")
+        handler.close()
+
+        files = sorted(temp_dir.glob("app*.log"))
+        assert len(files) > 1
+        messages = []
+        for path in files:
+            assert path.read_bytes().startswith(BINARY_MAGIC)
+            entries = list(iter_log_file(path))
+            assert {entry.function for entry in entries} == {"main:1"}
+            messages += [entry.message for entry in entries]
+        assert sorted(messages) == [f" record {index}\n" for index in range(6)]
+
+    def test_append_from_new_process(self, temp_dir: Path):
+        """Test that a new serializer appending to an existing file redefines its ids."""
+        path = temp_dir / "app.log"
+        for function in ("first", "second"):
+            handler = FileHandler(path, serializer=BinarySerializer())
+            handler.emit(make_record(function=function), "")
+            handler.close()
+
+        assert path.read_bytes().count(BINARY_MAGIC) == 1
+        assert [entry.function for entry in iter_log_file(path)] == ["first:1", "second:1"]
+
+    def test_logger_end_to_end(self, temp_dir: Path):
+        """Test a binary logger's file through iter_log_file."""
+        config = LogConfig(name="app", log_dir=temp_dir, file_format="binary", print_to_console=False)
+        with Logger(config) as logger:
+            logger.info("started", port=8080)
+            logger.error("stopped")
+
+        (path,) = temp_dir.glob("*.log")
+        assert [(entry.level, entry.message) for entry in iter_log_file(path)] == [
+            ("INFO", " started\n"),
+            ("ERROR", " stopped\n"),
+        ]
@@ -0,0 +1,157 @@
+"""Tests for tailing and following log files."""
+import datetime
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from Logges.exceptions import LogFileError
+from Logges.parser import IncrementalParser
+from Logges.tail import _next_dated_file, follow, last_records
+
+
+def line(index: int, level: str = "INFO") -> str:
+    """Return one log line."""
+    return f"[12:00:{index:02d}] [{level:^10s}] [a.py] [f:{index}]: message {index}\n"
+
+
+def json_line(index: int, level: str = "INFO") -> str:
+    """Return one JSON Lines record."""
+    fields = {"time": f"12:00:{index:02d}", "level": level, "function": "f", "line": index, "message": "m"}
+    return json.dumps(fields) + "\n"
+
+
+class TestLastRecords:
+    """Test last_records and the reverse scan."""
+
+    def test_last_records(self, tmp_path: Path):
+        """Test that only the last records are returned, continuation included."""
+        path = tmp_path / "2026-01-30_app.log"
+        path.write_text("".join(line(i) for i in range(20)) + "trace\n[not a header]\n")
+
+        entries = last_records(path, 2)
+        assert [entry.function for entry in entries] == ["f:18", "f:19"]
+        assert entries[1].message == " message 19\ntrace\n[not a header]\n"
+        assert len(last_records(path, 100)) == 20
+        assert last_records(path, 0) == []
+
+    def test_structured_last_records(self, tmp_path: Path):
+        """Test the last records of JSON Lines and msgpack files."""
+        path = tmp_path / "2026-01-30_app.log"
+        path.write_text("".join(json_line(i) for i in range(5)))
+        assert [entry.function for entry in last_records(path, 2)] == ["f:3", "f:4"]
+
+        msgpack = pytest.importorskip("msgpack")
+        path.write_bytes(b"".join(msgpack.packb(json.loads(json_line(i))) for i in range(5)))
+        assert [entry.function for entry in last_records(path, 1)] == ["f:4"]
+
+    def test_incremental_parser(self):
+        """Test that the last record is held back until flushed."""
+        parser = IncrementalParser()
+
+        assert parser.feed([line(0), "more\n"]) == []
+        assert [entry.message for entry in parser.feed([line(1)])] == [" message 0\nmore\n"]
+        assert parser.flush().function == "f:1"
+        assert parser.flush() is None
+
+
+class TestFollow:
+    """Test follow."""
+
+    def collect(self, path: Path, count: int, stop: threading.Event) -> tuple[list, threading.Thread]:
+        """Follow ``path`` in a thread, collecting the records."""
+        entries: list = []
+
+        def run():
+            entries.extend(follow(path, count=count, poll_interval=0.05, stop=stop))
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        return entries, thread
+
+    def wait_for(self, entries: list, count: int) -> None:
+        """Wait until ``count`` records were collected."""
+        deadline = time.monotonic() + 5
+        while len(entries) < count and time.monotonic() < deadline:
+            time.sleep(0.02)
+
+    def test_follows_appends_and_partial_lines(self, tmp_path: Path):
+        """Test that appended records are parsed, even when written in pieces."""
+        path = tmp_path / "2026-01-30_app.log"
+        path.write_text(line(0) + line(1))
+        stop = threading.Event()
+        entries, thread = self.collect(path, 1, stop)
+        try:
+            self.wait_for(entries, 1)
+            with open(path, "a") as log:
+                text = line(2)
+                log.write(text[:10])
+                log.flush()
+                time.sleep(0.2)
+                log.write(text[10:] + "continued\n")
+            self.wait_for(entries, 2)
+        finally:
+            stop.set()
+            thread.join()
+
+        assert [entry.function for entry in entries] == ["f:1", "f:2"]
+        assert entries[1].message == " message 2\ncontinued\n"
+
+    def test_follows_replaced_file(self, tmp_path: Path):
+        """Test that following continues when the file is rotated away."""
+        path = tmp_path / "app.log"
+        path.write_text(line(0))
+        stop = threading.Event()
+        entries, thread = self.collect(path, 1, stop)
+        try:
+            self.wait_for(entries, 1)
+            path.rename(tmp_path / "app.1.log")
+            path.write_text(line(1))
+            self.wait_for(entries, 2)
+        finally:
+            stop.set()
+            thread.join()
+
+        assert [entry.function for entry in entries] == ["f:0", "f:1"]
+
+    def test_follows_json_lines(self, tmp_path: Path):
+        """Test that JSON Lines records are yielded as soon as their line is complete."""
+        path = tmp_path / "2026-01-30_app.log"
+        path.write_text(json_line(0) + json_line(1) + json_line(2))
+        stop = threading.Event()
+        entries, thread = self.collect(path, 2, stop)
+        try:
+            self.wait_for(entries, 2)
+            with open(path, "a") as log:
+                text = json_line(3)
+                log.write(text[:10])
+                log.flush()
+                time.sleep(0.2)
+                log.write(text[10:])
+            self.wait_for(entries, 3)
+        finally:
+            stop.set()
+            thread.join()
+
+        assert [entry.function for entry in entries] == ["f:1", "f:2", "f:3"]
+
+    def test_msgpack_cannot_be_followed(self, tmp_path: Path):
+        """Test that following a msgpack file fails clearly."""
+        path = tmp_path / "2026-01-30_app.log"
+        path.write_bytes(b"\x81\xa5level\xa4INFO")
+        with pytest.raises(LogFileError):
+            next(follow(path))
+
+    def test_next_dated_file(self, tmp_path: Path):
+        """Test that an older dated file leads to today's file of the logger."""
+        today = datetime.date.today().isoformat()
+        old = tmp_path / "2000-01-01_app.log"
+        old.write_text(line(0))
+
+        assert _next_dated_file(old) is None
+        (tmp_path / f"{today}_app.log").write_text(line(1))
+        assert _next_dated_file(old) == tmp_path / f"{today}_app.log"
+        assert _next_dated_file(tmp_path / f"{today}_app.log") is None
+        assert _next_dated_file(tmp_path / "app.log") is None
@@ -0,0 +1,55 @@
+"""Tests for cached timestamp rendering."""
+import datetime
+import re
+
+from Logges.config import TimestampFormat
+from Logges.timestamps import TimestampProvider
+
+# A fixed point in time: 2026-01-30 12:34:56.789 local time
+MOMENT = datetime.datetime(2026, 1, 30, 12, 34, 56, 789000).timestamp()
+
+
+class TestTimestampProvider:
+    """Test TimestampProvider formats and caching."""
+
+    def test_time_format(self):
+        """Test the default HH:MM:SS format."""
+        provider = TimestampProvider()
+        assert provider.now(MOMENT) == "12:34:56"
+
+    def test_time_ms_format(self):
+        """Test the millisecond format."""
+        provider = TimestampProvider(TimestampFormat.TIME_MS)
+        assert provider.now(MOMENT) == "12:34:56.789"
+
+    def test_iso_format(self):
+        """Test the ISO-8601 format with milliseconds and offset."""
+        provider = TimestampProvider(TimestampFormat.ISO)
+        result = provider.now(MOMENT)
+
+        assert re.fullmatch(r"2026-01-30T12:34:56\.789[+-]\d{2}:\d{2}", result)
+        assert datetime.datetime.fromisoformat(result).timestamp() == MOMENT
+
+    def test_epoch_format(self):
+        """Test the Unix time format."""
+        provider = TimestampProvider(TimestampFormat.EPOCH)
+        assert float(provider.now(MOMENT)) == round(MOMENT, 3)
+
+    def test_second_is_cached(self):
+        """Test that the same second is rendered only once."""
+        provider = TimestampProvider()
+        first = provider.now(MOMENT)
+        assert provider.now(MOMENT + 0.1) is first
+        assert provider.now(MOMENT + 1) == "12:34:57"
+
+    def test_date_and_day_change(self):
+        """Test date rendering and midnight detection."""
+        provider = TimestampProvider()
+        assert provider.date(MOMENT) == "2026-01-30"
+
+        midnight = datetime.datetime(2026, 1, 31).timestamp()
+        assert provider.next_midnight == midnight
+        assert not provider.day_changed(midnight - 1)
+        assert provider.day_changed(midnight)
+        assert provider.date(midnight) == "2026-01-31"
+        assert not provider.day_changed(midnight)
@@ -1,13 +1,23 @@
 """Tests for Logges utility functions."""
+import io
 from pathlib import Path
 
 import pytest
+from rich.table import Table
 
+from Logges import Logges, LogLevel, LogRecord, utils
+from Logges.exceptions import ExportError
+from Logges.parser import iter_logs
+from Logges.serializers import BINARY_MAGIC, BinarySerializer
 from Logges.utils import (
     extract_logs,
     get_current_platform_name,
     get_current_time_HM,
     get_daily_log_file_name,
+    iter_console_data,
+    to_markdown,
+    to_pdf,
+    to_text,
 )
 
 
@@ -164,3 +174,192 @@ class TestExtractLogs:
         assert len(filename_list) == 0
         assert len(function_list) == 0
         assert len(msg_list) == 0
+
+
+class TestIterConsoleData:
+    """Test iter_console_data function."""
+
+    def render(self, path: Path, **kwargs):
+        """Return the tables, footer and status counts for a log file."""
+        status_dict = Logges.LogStatus.get_blank_dict()
+        parts = list(
+            iter_console_data(
+                str(path), status_dict, Logges.LogStatus.get_icon_dict(), True, **kwargs
+            )
+        )
+        return parts[:-2], parts[-2:], status_dict
+
+    def test_chunks(self, sample_log_file: Path):
+        """Test that rows come in chunks, only the first with title and header."""
+        tables, footer, status_dict = self.render(sample_log_file, chunk_rows=2)
+
+        assert [table.row_count for table in tables] == [2, 2, 1]
+        assert all(isinstance(table, Table) for table in tables)
+        assert tables[0].title is not None and tables[0].show_header
+        assert tables[1].title is None and not tables[1].show_header
+        assert sum(status_dict.values()) == 5
+        assert "INFO: %20.0" in footer[1]
+
+    def test_pushdown_filters(self, sample_log_file: Path):
+        """Test the limit, since and minimum level filters."""
+        tables, _, status_dict = self.render(sample_log_file, min_level="warning")
+        assert tables[0].row_count == 3
+        assert status_dict["DEBUG"] == status_dict["INFO"] == 0
+
+        tables, _, _ = self.render(sample_log_file, since="12:34:59")
+        assert tables[0].row_count == 2
+
+        tables, _, status_dict = self.render(sample_log_file, limit=1)
+        assert tables[0].row_count == 1
+        assert status_dict["DEBUG"] == 1
+
+    def test_since_with_iso_timestamps(self, temp_dir: Path):
+        """Test that since compares the time of day of ISO timestamps."""
+        log_file = temp_dir / "iso.log"
+        log_file.write_text(
+            "[2026-01-30T00:49:00.000+03:00] [   INFO   ] [a.py] [f:1]: early\n"
+            "[2026-01-30T01:30:00.000+03:00] [   INFO   ] [a.py] [f:2]: late\n"
+        )
+        tables, _, status_dict = self.render(log_file, since="01:00")
+
+        assert tables[0].row_count == 1
+        assert status_dict["INFO"] == 1
+
+    def test_empty_file(self, temp_dir: Path):
+        """Test that an empty file still shows an empty table and footer."""
+        log_file = temp_dir / "empty.log"
+        log_file.write_text("")
+        tables, footer, _ = self.render(log_file)
+
+        assert len(tables) == 1 and tables[0].row_count == 0
+        assert "DEBUG: %0" in footer[1]
+
+
+class TestToMarkdown:
+    """Test to_markdown function."""
+
+    def test_streams_rows_and_counts(self, sample_log_file: Path, monkeypatch):
+        """Test that rows are written in batches and counts reach the chart."""
+        charts = []
+        monkeypatch.setattr(utils, "MARKDOWN_BATCH_ROWS", 2)
+        monkeypatch.setattr(
+            utils, "create_pie_chart", lambda saving_path, status_dict: charts.append(dict(status_dict))
+        )
+        status_dict = Logges.LogStatus.get_blank_dict()
+
+        to_markdown(
+            sample_log_file.name,
+            str(sample_log_file.parent),
+            status_dict,
+            Logges.LogStatus.get_icon_dict(),
+            local_file=True,
+        )
+
+        lines = sample_log_file.with_suffix(".md").read_text().splitlines()
+        rows = [line for line in lines if line.startswith("|[")]
+        assert len(rows) == 5
+        assert rows[0] == "|[12:34:56]|:bulb:|[test.py]|[test_func:10]| Debug message |"
+        assert lines[-1].startswith("All right reserved")
+        assert charts == [{"DEBUG": 1, "INFO": 1, "WARNING": 1, "ERROR": 1, "CRITICAL": 1}]
+
+
+    def test_chart_kinds(self, sample_log_file: Path):
+        """Test the SVG bar chart, no chart and unknown chart kinds."""
+        arguments = (
+            sample_log_file.name,
+            str(sample_log_file.parent),
+            Logges.LogStatus.get_blank_dict(),
+            Logges.LogStatus.get_icon_dict(),
+            True,
+        )
+        markdown = sample_log_file.with_suffix(".md")
+
+        to_markdown(*arguments, chart="bars")
+        assert "![](level_chart.svg)" in markdown.read_text()
+        assert (sample_log_file.parent / "level_chart.svg").read_text().startswith("<svg")
+
+        to_markdown(*arguments, chart="none")
+        assert "![]" not in markdown.read_text()
+
+        with pytest.raises(ExportError):
+            to_markdown(*arguments, chart="radar")
+
+class TestToPdf:
+    """Test to_pdf function."""
+
+    def export(self, temp_dir: Path, sample_log_content: str, monkeypatch, **kwargs):
+        """Export today's sample log; return the chunk sizes and summary arguments."""
+        (temp_dir / get_daily_log_file_name("test")).write_text(sample_log_content)
+        chunks, summaries = [], []
+        make_table, make_summary = utils._pdf_table, utils._pdf_summary
+
+        def pdf_table(rows):
+            chunks.append(len(rows))
+            return make_table(rows)
+
+        def pdf_summary(*args):
+            summaries.append(args)
+            return make_summary(*args)
+
+        monkeypatch.setattr(utils, "PDF_CHUNK_ROWS", 2)
+        monkeypatch.setattr(utils, "_pdf_table", pdf_table)
+        monkeypatch.setattr(utils, "_pdf_summary", pdf_summary)
+        to_pdf("test", str(temp_dir), Logges.LogStatus.get_blank_dict(), **kwargs)
+
+        assert (temp_dir / get_daily_log_file_name("test", pdf=True)).exists()
+        return chunks, summaries
+
+    def test_chunks(self, temp_dir: Path, sample_log_content: str, monkeypatch):
+        """Test that rows are split into page-sized tables."""
+        chunks, summaries = self.export(temp_dir, sample_log_content, monkeypatch)
+        assert chunks == [2, 2, 1]
+        assert summaries == []
+
+    def test_max_rows_summary(self, temp_dir: Path, sample_log_content: str, monkeypatch):
+        """Test that capped exports keep the first rows and add a summary."""
+        chunks, summaries = self.export(temp_dir, sample_log_content, monkeypatch, max_rows=3)
+        assert chunks == [2, 1]
+        counts, shown, total, sample = summaries[0]
+        assert (shown, total, sample) == (3, 5, False)
+        assert sum(counts.values()) == 5
+
+    def test_sample(self, temp_dir: Path, sample_log_content: str, monkeypatch):
+        """Test that sampled exports keep max_rows rows."""
+        chunks, summaries = self.export(temp_dir, sample_log_content, monkeypatch, max_rows=4, sample=True)
+        assert chunks == [2, 2]
+        assert summaries[0][1:] == (4, 5, True)
+
+    def test_cells_wrap_only_when_too_wide(self):
+        """Test that only cells wider than their column become Paragraphs."""
+        assert utils._pdf_cell("[<module>:1]", 100) == "[<module>:1]"
+        wrapped = utils._pdf_cell("word " * 40, 100)
+        assert not isinstance(wrapped, str)
+
+
+class TestToText:
+    """Test to_text."""
+
+    def test_converts_binary_log(self, temp_dir: Path, sample_log_content: str):
+        """Test that a binary log converts to text lines parsing to the same entries."""
+        text_log = temp_dir / "text.log"
+        text_log.write_text(sample_log_content)
+        records = [
+            LogRecord(
+                timestamp=entry.time,
+                level=LogLevel[entry.level],
+                message=entry.message.strip(),
+                filename=entry.filename,
+                function=entry.function.split(":")[0],
+                line_number=int(entry.function.split(":")[1]),
+                created=1769776496.0,
+            )
+            for entry in iter_logs(io.StringIO(sample_log_content))
+        ]
+        binary_log = temp_dir / "binary.log"
+        binary_log.write_bytes(BINARY_MAGIC + BinarySerializer().serialize_batch(records, [""] * len(records)))
+
+        assert to_text(str(binary_log), str(temp_dir / "out.log")) == len(records)
+        with open(temp_dir / "out.log") as converted, open(text_log) as original:
+            converted_entries = list(iter_logs(converted))
+            assert [entry[1:] for entry in converted_entries] == [entry[1:] for entry in iter_logs(original)]
+        assert all(entry.time.startswith("2026-01-30T") for entry in converted_entries)